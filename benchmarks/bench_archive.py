@@ -0,0 +1,105 @@
+"""Benchmark the streaming archive parser against BeautifulSoup on saved HTML fixtures.
+
+Usage:
+    python -m benchmarks.bench_archive [--repeat N]
+
+BeautifulSoup is optional.  When it's installed, its results are verified against the streaming
+parser's and both are timed.
+"""
+
+# Standard Imports
+from functools import partial
+from typing import Iterator, List
+import argparse
+import codecs
+import glob
+import os
+import subprocess
+import sys
+import timeit
+# Third Party Imports
+try:
+    from bs4 import BeautifulSoup
+except ImportError:
+    BeautifulSoup = None  # pylint: disable=invalid-name
+# Local Imports
+from well.archive import CHUNK_SIZE, parse_chunks
+from well.globals import ARCHIVE_NEEDLE
+
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+
+
+def soup_items(raw_html: str, tag: str = 'h2', needle: str = ARCHIVE_NEEDLE) -> List[str]:
+    """The BeautifulSoup parse the archive module used to do."""
+    # LOCAL VARIABLES
+    soup = BeautifulSoup(raw_html, 'html.parser')  # Soup object
+    target = soup.find(tag, string=needle)         # Target tag
+
+    # DONE
+    return [item.text.strip().upper()
+            for item in target.find_next_sibling(['ul', 'ol']).find_all('li')]
+
+
+def stream_chunks(raw_bytes: bytes, consumed: List[int]) -> Iterator[str]:
+    """Yield raw_bytes CHUNK_SIZE at a time, like a streamed response, tallying bytes consumed."""
+    # LOCAL VARIABLES
+    decoder = codecs.getincrementaldecoder('utf-8')()  # Same decoding as the archive module
+
+    # STREAM IT
+    for start in range(0, len(raw_bytes), CHUNK_SIZE):
+        consumed[0] = min(start + CHUNK_SIZE, len(raw_bytes))
+        yield decoder.decode(raw_bytes[start:start + CHUNK_SIZE])
+    yield decoder.decode(b'', final=True)
+
+
+def stream_items(raw_bytes: bytes, filename: str) -> List[str]:
+    """Stream raw_bytes through the archive module's parser."""
+    return parse_chunks(stream_chunks(raw_bytes, [0]), url=filename, tag='h2')
+
+
+def time_import(module: str) -> float:
+    """Time a cold import of module in a fresh interpreter, in seconds."""
+    # LOCAL VARIABLES
+    code = f'import time; s = time.perf_counter(); import {module}; print(time.perf_counter() - s)'
+
+    # DONE
+    return float(subprocess.run([sys.executable, '-c', code], capture_output=True, check=True,
+                                text=True).stdout)
+
+
+def main() -> int:
+    """Run the benchmark."""
+    # LOCAL VARIABLES
+    parser = argparse.ArgumentParser(description=__doc__.split('\n', maxsplit=1)[0])
+    consumed = [0]  # Bytes the streaming parser read before it stopped
+
+    # BENCHMARK IT
+    parser.add_argument('--repeat', type=int, default=20, help='runs per measurement')
+    args = parser.parse_args()
+    print(f'{"fixture":<24}{"bytes":>9}{"read":>9}{"stream ms":>11}{"soup ms":>10}')
+    for filename in sorted(glob.glob(os.path.join(FIXTURE_DIR, '*.html'))):
+        with open(filename, 'rb') as in_file:
+            raw_bytes = in_file.read()
+        items = parse_chunks(stream_chunks(raw_bytes, consumed), url=filename, tag='h2')
+        stream_ms = 1000 * min(timeit.repeat(partial(stream_items, raw_bytes, filename),
+                                             number=1, repeat=args.repeat))
+        soup_ms = float('nan')
+        if BeautifulSoup is not None:
+            if soup_items(raw_bytes.decode('utf-8')) != items:
+                print(f'Results differ for {filename}')
+                return 1
+            soup_ms = 1000 * min(timeit.repeat(partial(soup_items, raw_bytes.decode('utf-8')),
+                                               number=1, repeat=args.repeat))
+        print(f'{os.path.basename(filename):<24}{len(raw_bytes):>9}{consumed[0]:>9}'
+              f'{stream_ms:>11.2f}{soup_ms:>10.2f}')
+    print(f'import well.archive: {1000 * time_import("well.archive"):.1f} ms')
+    if BeautifulSoup is not None:
+        print(f'import bs4: {1000 * time_import("bs4"):.1f} ms')
+
+    # DONE
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
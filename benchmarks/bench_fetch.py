@@ -0,0 +1,154 @@
+"""Benchmark the multi-source archive fetch against local stand-in servers with injected delays.
+
+Usage:
+    python -m benchmarks.bench_fetch [--repeat N] [--timeout SECONDS]
+
+Every source is a localhost HTTP server that serves the saved archive fixture after its own delay.
+Each source is either healthy, slow, hung (never answers before the timeout) or broken (answers
+500).  Every scenario is fetched with both merges, and its startup latency is compared to its
+fastest healthy source.  ARCHIVE_FIRST should track that source, whatever the others do.
+"""
+
+# Standard Imports
+from functools import partial
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import List, Tuple
+import argparse
+import sys
+import threading
+import time
+# Third Party Imports
+# Local Imports
+from benchmarks.bench_suite import ARCHIVE_FIXTURE
+from well.archive import ArchiveSource, get_past_answers
+from well.globals import ARCHIVE_FIRST, ARCHIVE_MERGES
+
+
+BROKEN = -1.0   # Delay that stands for a server that answers 500
+HUNG = -2.0     # Delay that stands for a server that never answers in time
+SLACK_MS = 250  # ARCHIVE_FIRST may take this much longer than its fastest healthy source
+SCENARIOS = {
+    'one healthy': [0.05],
+    'fast + slow': [0.05, 1.0],
+    'slow + fast': [1.0, 0.05],
+    'fast + hung': [0.05, HUNG],
+    'broken + fast': [BROKEN, 0.05],
+    'broken + hung + slow': [BROKEN, HUNG, 0.5],
+}  # Scenario name to the delay of each of its sources
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    """Serve the archive fixture after a delay."""
+
+    def __init__(self, *args, body: bytes, delay: float, hang: float, **kwargs):
+        """StandInHandler() ctor."""
+        self.body = body    # Page to serve
+        self.delay = delay  # Seconds to wait before answering, or BROKEN or HUNG
+        self.hang = hang    # Seconds a HUNG server waits
+        super().__init__(*args, **kwargs)
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        """Answer, eventually."""
+        if self.delay == BROKEN:
+            self.send_error(500)
+            return
+        time.sleep(self.hang if self.delay == HUNG else self.delay)
+        try:
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/html; charset=utf-8')
+            self.send_header('Content-Length', str(len(self.body)))
+            self.end_headers()
+            self.wfile.write(self.body)
+        except (BrokenPipeError, ConnectionResetError):
+            pass  # The client stops reading as soon as it has the list, or gave up on us
+
+    def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+        """Keep quiet."""
+
+
+def start_servers(delays: List[float], body: bytes,
+                  hang: float) -> Tuple[List[ThreadingHTTPServer], List[ArchiveSource]]:
+    """Start one stand-in server per delay on free localhost ports.
+
+    Returns:
+        The servers, and an ArchiveSource for each.
+    """
+    # LOCAL VARIABLES
+    servers = []  # Running servers
+    sources = []  # Sources pointing at them
+
+    # START THEM
+    for delay in delays:
+        servers.append(ThreadingHTTPServer(('127.0.0.1', 0), partial(
+            StandInHandler, body=body, delay=delay, hang=hang)))
+        servers[-1].daemon_threads = True
+        threading.Thread(target=servers[-1].serve_forever, daemon=True).start()
+        sources.append(ArchiveSource(f'http://127.0.0.1:{servers[-1].server_address[1]}/'))
+
+    # DONE
+    return servers, sources
+
+
+def time_scenario(delays: List[float], body: bytes, repeat: int,
+                  timeout: float) -> List[Tuple[float, int]]:
+    """Fetch from stand-in servers with delays, with every merge.
+
+    Returns:
+        The best time, in milliseconds, and the number of answers, for each of ARCHIVE_MERGES.
+    """
+    # LOCAL VARIABLES
+    servers, sources = start_servers(delays, body, hang=timeout * 3)  # Stand-ins
+    results = []  # (best ms, answers) for each merge
+    start = 0.0   # Start time of one fetch
+    best = 0.0    # Best time of one merge
+    answers = []  # Answers of one fetch
+
+    # TIME IT
+    try:
+        for merge in ARCHIVE_MERGES:
+            best = float('inf')
+            for _ in range(repeat):
+                start = time.perf_counter()
+                answers = get_past_answers(sources, cache_dir=None, merge=merge, timeout=timeout)
+                best = min(best, 1000 * (time.perf_counter() - start))
+            results.append((best, len(answers)))
+    finally:
+        for server in servers:
+            server.shutdown()
+            server.server_close()
+
+    # DONE
+    return results
+
+
+def main() -> int:
+    """Run the benchmark."""
+    # LOCAL VARIABLES
+    parser = argparse.ArgumentParser(description=__doc__.split('\n', maxsplit=1)[0])
+    result = 0     # 0 for success, 1 if ARCHIVE_FIRST waited on more than the fastest source
+    fastest = 0.0  # Delay of the fastest healthy source, in milliseconds
+    timings = []   # (best ms, answers) for each merge
+
+    # BENCHMARK IT
+    parser.add_argument('--repeat', type=int, default=3, help='runs per measurement')
+    parser.add_argument('--timeout', type=float, default=2.0,
+                        help='per-request timeout, in seconds (default: %(default)s)')
+    args = parser.parse_args()
+    with open(ARCHIVE_FIXTURE, 'rb') as in_file:
+        body = in_file.read()
+    print(f'{"scenario":<24}{"fastest ms":>11}'
+          + ''.join(f'{merge + " ms":>11}{"answers":>9}' for merge in ARCHIVE_MERGES))
+    for name, delays in SCENARIOS.items():
+        fastest = 1000 * min(delay for delay in delays if delay >= 0)
+        timings = time_scenario(delays, body, repeat=args.repeat, timeout=args.timeout)
+        print(f'{name:<24}{fastest:>11.0f}'
+              + ''.join(f'{best:>11.0f}{answers:>9}' for best, answers in timings))
+        if timings[ARCHIVE_MERGES.index(ARCHIVE_FIRST)][0] > fastest + SLACK_MS:
+            result = 1
+
+    # DONE
+    return result
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,189 @@
+"""Benchmark the solver's hot paths on fixed, offline workloads.
+
+Usage:
+    python -m benchmarks.bench_suite [--repeat N] [--seed N] [--output FILE] [--baseline FILE]
+
+Workloads:
+    cold_first_turn   Remove the fixture archive from the dictionary and rank it, unique letters.
+    mid_game          Feed a seeded game's mixed green/yellow feedback into WordHints, then filter
+                      and rank the dictionary.
+    dictionary_filter WordHints.filter() the dictionary by the mid-game hints.
+    archive_parse     Parse the saved archive fixture.
+    archive_sync      Parse the saved archive fixture, already knowing all but its newest answer.
+
+Every workload reports its best and median wall time, then is run once more under tracemalloc for
+the number and size of the blocks it allocated (and still held when it returned) and its peak
+memory.  Results are written as JSON to --output.  Pass an earlier run's file as --baseline to
+print the speedup of each workload.
+"""
+
+# Standard Imports
+from typing import Any, Callable, Dict, List, Tuple
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+# Third Party Imports
+# Local Imports
+from benchmarks.bench_archive import FIXTURE_DIR, stream_chunks
+from well.archive import parse_chunks
+from well.globals import FIVE_LETTER_WORDS, INPUT_GREEN, INPUT_YELLOW
+from well.patterns import pattern_results, score_guess
+from well.vectorized import HAVE_NUMPY
+from well.word_hints import WordHints
+from well.words import calc_word_ordict, remove_word_hints, remove_words
+
+
+ARCHIVE_FIXTURE = os.path.join(FIXTURE_DIR, 'archive_answers.html')
+DEFAULT_OUTPUT = 'bench_output.txt'
+DEFAULT_SEED = 1
+
+
+def archive_answers(raw_bytes: bytes, known: List[str] = ()) -> List[str]:
+    """Parse the archive fixture, like get_past_answers() does."""
+    return parse_chunks(stream_chunks(raw_bytes, [0]), url=ARCHIVE_FIXTURE, tag='h2', known=known)
+
+
+def mid_game_feedback(seed: int) -> List[Tuple[str, str]]:
+    """Play two seeded random guesses against a seeded random answer.
+
+    Redraws until the feedback holds both a green and a yellow, so the hints are mixed.
+
+    Returns:
+        (guess, results) for each guess.
+    """
+    # LOCAL VARIABLES
+    rand = random.Random(seed)       # Seeded generator
+    words = list(FIVE_LETTER_WORDS)  # Words to draw from
+    feedback = []                    # (guess, results) for each guess
+    answer = ''                      # Hidden answer
+
+    # PLAY IT
+    while True:
+        answer = rand.choice(words)
+        feedback = [(guess, pattern_results(score_guess(guess, answer)))
+                    for guess in rand.sample(words, 2)]
+        if any(INPUT_GREEN in results for _, results in feedback) \
+                and any(INPUT_YELLOW in results for _, results in feedback):
+            break
+
+    # DONE
+    return feedback
+
+
+def build_hints(feedback: List[Tuple[str, str]]) -> WordHints:
+    """Feed feedback into a new WordHints object."""
+    # LOCAL VARIABLES
+    hints = WordHints()  # Hints built from feedback
+
+    # BUILD IT
+    for guess, results in feedback:
+        hints.update_word(guess, results)
+
+    # DONE
+    return hints
+
+
+def build_workloads(seed: int) -> Dict[str, Callable[[], Any]]:
+    """Build every workload's function, with its inputs prepared ahead of time."""
+    # LOCAL VARIABLES
+    raw_bytes = b''                     # Archive fixture
+    archive = []                        # Answers in the archive fixture
+    feedback = mid_game_feedback(seed)  # Mid-game feedback
+    hints = build_hints(feedback)       # Mid-game hints
+    words = list(FIVE_LETTER_WORDS)     # The dictionary
+
+    # BUILD THEM
+    with open(ARCHIVE_FIXTURE, 'rb') as in_file:
+        raw_bytes = in_file.read()
+    archive = archive_answers(raw_bytes)
+
+    # DONE
+    return {
+        'cold_first_turn': lambda: calc_word_ordict(remove_words(FIVE_LETTER_WORDS, archive),
+                                                    unique=True),
+        'mid_game': lambda: calc_word_ordict(remove_word_hints(words, build_hints(feedback))),
+        'dictionary_filter': lambda: remove_word_hints(words, hints),
+        'archive_parse': lambda: archive_answers(raw_bytes),
+        'archive_sync': lambda: archive_answers(raw_bytes, known=archive[1:]),
+    }
+
+
+def measure(func: Callable[[], Any], repeat: int) -> Dict[str, float]:
+    """Time func repeat times, then trace one more call's memory."""
+    # LOCAL VARIABLES
+    times = []     # Wall time of each call, in seconds
+    start = 0.0    # Start of a call
+    before = None  # Snapshot prior to the traced call
+    after = None   # Snapshot after the traced call
+    peak = 0       # Peak traced memory of the traced call
+    held = None    # The traced call's return value, held until the after snapshot
+    stats = []     # Differences between the snapshots
+
+    # TIME IT
+    func()  # Warm up (e.g., the word mask table and first page faults)
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+
+    # TRACE IT
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    tracemalloc.reset_peak()
+    held = func()
+    peak = tracemalloc.get_traced_memory()[1]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    del held
+    stats = after.compare_to(before, 'filename')
+
+    # DONE
+    return {'wall_min_ms': 1000 * min(times), 'wall_median_ms': 1000 * statistics.median(times),
+            'allocated_blocks': sum(stat.count_diff for stat in stats),
+            'allocated_bytes': sum(stat.size_diff for stat in stats),
+            'peak_bytes': peak}
+
+
+def main() -> int:
+    """Run the benchmark."""
+    # LOCAL VARIABLES
+    parser = argparse.ArgumentParser(description=__doc__.split('\n', maxsplit=1)[0])
+    results = {}   # Measurements for each workload
+    baseline = {}  # Measurements from an earlier run
+
+    # BENCHMARK IT
+    parser.add_argument('--repeat', type=int, default=10, help='timed runs per workload')
+    parser.add_argument('--seed', type=int, default=DEFAULT_SEED, help='mid-game seed')
+    parser.add_argument('--output', default=DEFAULT_OUTPUT, help='JSON results file')
+    parser.add_argument('--baseline', help='JSON results file from an earlier run to compare to')
+    args = parser.parse_args()
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as in_file:
+            baseline = json.load(in_file)['workloads']
+    print(f'{"workload":<20}{"min ms":>10}{"median ms":>11}{"blocks":>9}{"peak KiB":>10}'
+          f'{"speedup":>9}')
+    for name, func in build_workloads(args.seed).items():
+        results[name] = measure(func, args.repeat)
+        speedup = baseline[name]['wall_min_ms'] / results[name]['wall_min_ms'] \
+            if name in baseline else float('nan')
+        print(f'{name:<20}{results[name]["wall_min_ms"]:>10.2f}'
+              f'{results[name]["wall_median_ms"]:>11.2f}{results[name]["allocated_blocks"]:>9}'
+              f'{results[name]["peak_bytes"] / 1024:>10.1f}{speedup:>9.2f}')
+    with open(args.output, 'w', encoding='utf-8') as out_file:
+        json.dump({'python': platform.python_version(), 'numpy': HAVE_NUMPY, 'seed': args.seed,
+                   'repeat': args.repeat, 'workloads': results}, out_file, indent=4)
+        out_file.write('\n')
+    print(f'Wrote {args.output}')
+
+    # DONE
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
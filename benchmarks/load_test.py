@@ -0,0 +1,223 @@
+"""Load test the HTTP/JSON service with thousands of simulated players.
+
+Usage:
+    python -m benchmarks.load_test [--sessions N] [--concurrency N] [--seed N] [--url URL]
+
+Every simulated player starts a session, always plays the top suggestion and reports the feedback
+for a seeded random answer until it's solved.  Without --url, a server for the whole dictionary is
+started on a free localhost port for the duration of the test.  Reports p50/p90/p99 latency for
+every request.
+"""
+
+# Standard Imports
+from typing import Dict, List, Tuple
+from urllib.parse import urlsplit
+import argparse
+import asyncio
+import json
+import multiprocessing
+import random
+import socket
+import statistics
+import sys
+import time
+# Third Party Imports
+# Local Imports
+from well.batch import TURN_LIMIT
+from well.globals import FIVE_LETTER_WORDS, INPUT_GREEN, RANKING_FREQUENCY, RANKINGS
+from well.patterns import pattern_results, score_guess
+from well.server import HintServer
+
+
+class Client():
+    """One keep-alive HTTP/1.1 connection that times every request."""
+
+    def __init__(self, host: str, port: int, latencies: List[float]):
+        """Client() ctor."""
+        self.host = host            # Server host
+        self.port = port            # Server port
+        self.latencies = latencies  # Seconds taken by each request, shared by every client
+        self._reader = None         # Connection reader
+        self._writer = None         # Connection writer
+
+    async def request(self, method: str, path: str, payload: Dict = None) -> Tuple[int, Dict]:
+        """Send a request and return the status and parsed body."""
+        # LOCAL VARIABLES
+        body = json.dumps(payload).encode('utf-8') if payload is not None else b''
+        start = time.perf_counter()  # Start of the request
+        status = 0                   # Response status
+        length = 0                   # Response body length
+        line = b''                   # Response line
+
+        # REQUEST IT
+        if self._writer is None:
+            self._reader, self._writer = await asyncio.open_connection(self.host, self.port)
+        self._writer.write(f'{method} {path} HTTP/1.1\r\nHost: {self.host}\r\n'
+                           f'Content-Type: application/json\r\nContent-Length: {len(body)}\r\n'
+                           f'\r\n'.encode('latin-1') + body)
+        await self._writer.drain()
+        status = int((await self._reader.readline()).split()[1])
+        while True:
+            line = await self._reader.readline()
+            if line in (b'\r\n', b'\n', b''):
+                break
+            if line.lower().startswith(b'content-length:'):
+                length = int(line.split(b':', 1)[1])
+        body = await self._reader.readexactly(length)
+        self.latencies.append(time.perf_counter() - start)
+
+        # DONE
+        return status, json.loads(body)
+
+    async def close(self) -> None:
+        """Close the connection."""
+        if self._writer is not None:
+            self._writer.close()
+            await self._writer.wait_closed()
+
+
+async def play(client: Client, answer: str) -> int:
+    """Play one game through the service.
+
+    Returns:
+        Number of guesses it took, or 0 on failure.
+    """
+    # LOCAL VARIABLES
+    status, reply = await client.request('POST', '/sessions')  # Reply from the service
+    path = f'/sessions/{reply.get("session")}'                  # Session path
+    guess = ''                                                   # Top suggestion
+
+    # PLAY IT
+    for turn in range(1, TURN_LIMIT + 1):
+        if status >= 300 or not reply['suggestions']:
+            break
+        guess = reply['suggestions'][0]
+        if guess == answer:
+            await client.request('POST', f'{path}/feedback',
+                                 {'word': guess, 'results': INPUT_GREEN * len(guess)})
+            await client.request('DELETE', path)
+            return turn
+        status, reply = await client.request('POST', f'{path}/feedback', {
+            'word': guess, 'results': pattern_results(score_guess(guess, answer))})
+
+    # DONE
+    return 0
+
+
+async def drive(host: str, port: int, answers: List[str], concurrency: int) -> Dict[str, float]:
+    """Play a game against every answer, concurrency players at a time."""
+    # LOCAL VARIABLES
+    latencies = []               # Seconds taken by each request
+    queue = asyncio.Queue()      # Answers left to play
+    failures = []                # Answers that weren't solved
+    start = time.perf_counter()  # Start of the test
+
+    # DRIVE IT
+    for answer in answers:
+        queue.put_nowait(answer)
+    await asyncio.gather(*(_player(Client(host, port, latencies), queue, failures)
+                           for _ in range(min(concurrency, len(answers)))))
+
+    # DONE
+    return _summarize(latencies, len(answers), len(failures), time.perf_counter() - start)
+
+
+def serve(port: int, ranking: str) -> None:
+    """Serve the whole dictionary on localhost.  Runs in a child process."""
+    asyncio.run(HintServer(list(FIVE_LETTER_WORDS), ranking=ranking).serve(port=port))
+
+
+def main() -> int:
+    """Run the load test."""
+    # LOCAL VARIABLES
+    parser = argparse.ArgumentParser(description=__doc__.split('\n', maxsplit=1)[0])
+    server = None       # Server process, if this test started one
+    host = '127.0.0.1'  # Server host
+    port = 0            # Server port
+    rand = None         # Seeded generator
+    answers = []        # Answers to play
+    report = {}         # Results
+
+    # TEST IT
+    parser.add_argument('--sessions', type=int, default=2000, help='games to play')
+    parser.add_argument('--concurrency', type=int, default=200, help='simultaneous players')
+    parser.add_argument('--seed', type=int, default=1, help='answer selection seed')
+    parser.add_argument('--ranking', choices=RANKINGS, default=RANKING_FREQUENCY,
+                        help='ranking for the server this test starts (default: %(default)s)')
+    parser.add_argument('--url', help='an already running server (e.g., http://127.0.0.1:8642)')
+    args = parser.parse_args()
+    rand = random.Random(args.seed)
+    answers = [rand.choice(FIVE_LETTER_WORDS) for _ in range(args.sessions)]
+    if args.url:
+        host, port = urlsplit(args.url).hostname, urlsplit(args.url).port
+    else:
+        port = _free_port()
+        server = multiprocessing.Process(target=serve, args=(port, args.ranking), daemon=True)
+        server.start()
+        _wait_for(host, port)
+    try:
+        report = asyncio.run(drive(host, port, answers, args.concurrency))
+    finally:
+        if server is not None:
+            server.terminate()
+            server.join()
+    print(json.dumps(report, indent=4))
+
+    # DONE
+    return 1 if report['failures'] else 0
+
+
+def _free_port() -> int:
+    """Find a free localhost port."""
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+async def _player(client: Client, queue: asyncio.Queue, failures: List[str]) -> None:
+    """Play answers off of queue, one at a time, over one connection."""
+    try:
+        while not queue.empty():
+            answer = queue.get_nowait()
+            if not await play(client, answer):
+                failures.append(answer)
+    finally:
+        await client.close()
+
+
+def _summarize(latencies: List[float], games: int, failures: int,
+               seconds: float) -> Dict[str, float]:
+    """Summarize the request latencies, in milliseconds."""
+    # LOCAL VARIABLES
+    cuts = statistics.quantiles(latencies, n=100) if len(latencies) > 1 else latencies * 99
+
+    # DONE
+    return {'games': games, 'failures': failures, 'requests': len(latencies),
+            'seconds': seconds, 'requests_per_second': len(latencies) / seconds,
+            'p50_ms': 1000 * cuts[49], 'p90_ms': 1000 * cuts[89], 'p99_ms': 1000 * cuts[98],
+            'max_ms': 1000 * max(latencies, default=0.0)}
+
+
+def _wait_for(host: str, port: int, timeout: float = 60.0) -> None:
+    """Wait for the server to accept connections.
+
+    Raises:
+        TimeoutError: It didn't within timeout seconds.
+    """
+    # LOCAL VARIABLES
+    deadline = time.monotonic() + timeout  # Give up after this
+
+    # WAIT FOR IT
+    while time.monotonic() < deadline:
+        try:
+            with socket.create_connection((host, port), timeout=1):
+                return
+        except OSError:
+            time.sleep(0.1)
+
+    # DONE
+    raise TimeoutError(f'No server on {host}:{port} after {timeout} seconds')
+
+
+if __name__ == '__main__':
+    sys.exit(main())
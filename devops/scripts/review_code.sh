@@ -35,14 +35,14 @@ else
     EXIT_CODE=1
 fi
 # Pylint (Test Code)
-# find ./test/ -type f -name "*.py" | xargs pylint --score=no --disable=duplicate-code
-# if [ $? -eq 0 ]
-# then
-#     echo -e "[✓] Pylint is happy with the test code"
-# else
-#     echo -e "\n\n[X] Pylint is *NOT* happy with the test code\n"
-#     EXIT_CODE=1
-# fi
+find ./test/ -type f -name "*.py" | xargs pylint --score=no --disable=duplicate-code
+if [ $? -eq 0 ]
+then
+    echo -e "[✓] Pylint is happy with the test code"
+else
+    echo -e "\n\n[X] Pylint is *NOT* happy with the test code\n"
+    EXIT_CODE=1
+fi
 
 
 # DONE
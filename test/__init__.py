@@ -0,0 +1,17 @@
+"""Unit tests for the well package.
+
+Every test runs against a temporary cache directory, set up here before anything imports
+well.globals, so nothing is read from or written to the real CACHE_DIR (e.g., pattern matrices).
+"""
+
+# Standard Imports
+import atexit
+import os
+import shutil
+import tempfile
+# Third Party Imports
+# Local Imports
+
+
+os.environ['WELL_CACHE_DIR'] = tempfile.mkdtemp(prefix='well-test-')
+atexit.register(shutil.rmtree, os.environ['WELL_CACHE_DIR'], ignore_errors=True)
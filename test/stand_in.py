@@ -0,0 +1,104 @@
+"""Local stand-in archive servers, so the archive tests never touch the real network."""
+
+# Standard Imports
+from functools import partial
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Sequence
+import threading
+import time
+# Third Party Imports
+# Local Imports
+from well.archive import ArchiveSource
+from well.globals import ARCHIVE_NEEDLE
+
+
+def make_page(answers: Sequence[str], needle: str = ARCHIVE_NEEDLE) -> bytes:
+    """Build an archive page that lists answers, in order, after <h2>needle</h2>."""
+    return ('<html><body><h1>Past answers</h1><p>Intro</p>'
+            f'<h2>{needle}</h2><ul>'
+            + ''.join(f'<li>{answer}</li>' for answer in answers)
+            + '</ul><p>Footer</p></body></html>').encode('utf-8')
+
+
+# pylint: disable=too-many-instance-attributes
+# Calm down, Pylint.  It's fine...
+class StandInServer():
+    """A localhost HTTP server that serves one page, and counts the requests for it.
+
+    Use it as a context manager.  The page, delay, status and ETag may be changed between
+    requests.
+    """
+
+    def __init__(self, body: bytes = b'', delay: float = 0.0, status: int = 200,
+                 etag: Optional[str] = None):
+        """StandInServer() ctor.
+
+        Args:
+            body: Optional; The page to serve.
+            delay: Optional; Seconds to wait before answering.
+            status: Optional; The status to answer with.  Anything but 200 is sent as an error.
+            etag: Optional; The page's ETag.  A matching If-None-Match is answered with 304.
+        """
+        self.body = body                               # Page to serve
+        self.delay = delay                             # Seconds to wait before answering
+        self.status = status                           # Status to answer with
+        self.etag = etag                               # ETag of the page
+        self.requests: List[Dict[str, str]] = []       # Headers of every request, in order
+        self._lock = threading.Lock()                  # Guards requests
+        self._server = ThreadingHTTPServer(('127.0.0.1', 0),
+                                           partial(_StandInHandler, stand_in=self))
+        self._server.daemon_threads = True             # Don't wait on hung answers to exit
+
+    def __enter__(self) -> 'StandInServer':
+        """Start serving."""
+        threading.Thread(target=self._server.serve_forever, kwargs={'poll_interval': 0.05},
+                         daemon=True).start()
+        return self
+
+    def __exit__(self, *args) -> None:
+        """Stop serving."""
+        self._server.shutdown()
+        self._server.server_close()
+
+    @property
+    def source(self) -> ArchiveSource:
+        """An ArchiveSource for this server's page."""
+        return ArchiveSource(f'http://127.0.0.1:{self._server.server_address[1]}/')
+
+    def record(self, headers: Dict[str, str]) -> None:
+        """Count a request."""
+        with self._lock:
+            self.requests.append(headers)
+
+
+class _StandInHandler(BaseHTTPRequestHandler):
+    """Answer for a StandInServer."""
+
+    def __init__(self, *args, stand_in: StandInServer, **kwargs):
+        """_StandInHandler() ctor."""
+        self.stand_in = stand_in  # The server's settings
+        super().__init__(*args, **kwargs)
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        """Answer, eventually."""
+        self.stand_in.record(dict(self.headers.items()))
+        time.sleep(self.stand_in.delay)
+        try:
+            if self.stand_in.status != 200:
+                self.send_error(self.stand_in.status)
+            elif self.stand_in.etag and self.headers.get('If-None-Match') == self.stand_in.etag:
+                self.send_response(304)
+                self.end_headers()
+            else:
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/html; charset=utf-8')
+                self.send_header('Content-Length', str(len(self.stand_in.body)))
+                if self.stand_in.etag:
+                    self.send_header('ETag', self.stand_in.etag)
+                self.end_headers()
+                self.wfile.write(self.stand_in.body)
+        except (BrokenPipeError, ConnectionResetError):
+            pass  # The client gave up on us
+
+    def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+        """Keep quiet."""
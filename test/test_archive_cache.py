@@ -0,0 +1,136 @@
+"""The on-disk archive cache, against a local stand-in server (see: get_source_answers())."""
+
+# Standard Imports
+from contextlib import redirect_stdout
+from typing import List, Optional
+import io
+import shutil
+import tempfile
+import unittest
+# Third Party Imports
+# Local Imports
+from test.stand_in import StandInServer, make_page
+from well.archive import get_past_answers, get_source_answers, parse_chunks
+
+
+ANSWERS = ['CRANE', 'SLATE', 'AUDIO', 'PIANO', 'GHOST']  # Newest first
+ETAG = '"v1"'                                           # ETag of the stand-in page
+
+
+class TestArchiveCache(unittest.TestCase):
+    """Cached startup makes no requests, a stale cache makes one request, and syncs lose nothing."""
+
+    def setUp(self):
+        """Start every test with an empty cache."""
+        self.cache_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.cache_dir)
+
+    def sync(self, server: StandInServer, answers: List[str], etag: str,
+             expected: Optional[List[str]] = None) -> None:
+        """Change the page, sync it, and check the answers both fresh and from the cache.
+
+        Args:
+            server: The stand-in serving the page.
+            answers: The page's new answers.
+            etag: The page's new ETag.
+            expected: Optional; The answers a sync should find.  Defaults to answers.
+        """
+        server.body = make_page(answers)
+        server.etag = etag
+        with redirect_stdout(io.StringIO()):
+            self.assertEqual(get_source_answers(server.source, cache_dir=self.cache_dir, ttl=0),
+                             expected or answers)
+        self.assertEqual(get_source_answers(server.source, cache_dir=self.cache_dir),
+                         expected or answers)
+
+    def test_warm_start(self):
+        """A fresh cached copy is returned without a single request."""
+        with StandInServer(make_page(ANSWERS), etag=ETAG) as server:
+            self.assertEqual(get_source_answers(server.source, cache_dir=self.cache_dir), ANSWERS)
+            self.assertEqual(len(server.requests), 1)
+            self.assertEqual(get_past_answers([server.source], cache_dir=self.cache_dir), ANSWERS)
+            self.assertEqual(get_source_answers(server.source, cache_dir=self.cache_dir), ANSWERS)
+            self.assertEqual(len(server.requests), 1)
+
+    def test_expired(self):
+        """An expired copy is revalidated with one conditional request, then fresh again."""
+        with StandInServer(make_page(ANSWERS), etag=ETAG) as server:
+            get_source_answers(server.source, cache_dir=self.cache_dir)
+            self.assertEqual(get_source_answers(server.source, cache_dir=self.cache_dir, ttl=0),
+                             ANSWERS)
+            self.assertEqual(len(server.requests), 2)
+            self.assertEqual(server.requests[1].get('If-None-Match'), ETAG)
+            get_source_answers(server.source, cache_dir=self.cache_dir)
+            self.assertEqual(len(server.requests), 2)  # The 304 renewed the copy
+
+    def test_changed(self):
+        """A changed page replaces the cached copy."""
+        with StandInServer(make_page(ANSWERS), etag=ETAG) as server:
+            get_source_answers(server.source, cache_dir=self.cache_dir)
+            server.body = make_page(['TRAIN'] + ANSWERS)
+            server.etag = '"v2"'
+            self.assertEqual(get_source_answers(server.source, cache_dir=self.cache_dir, ttl=0),
+                             ['TRAIN'] + ANSWERS)
+            self.assertEqual(get_source_answers(server.source, cache_dir=self.cache_dir),
+                             ['TRAIN'] + ANSWERS)
+            self.assertEqual(len(server.requests), 2)
+
+    def test_offline(self):
+        """An expired copy is still returned when the server is gone."""
+        with StandInServer(make_page(ANSWERS), etag=ETAG) as server:
+            get_source_answers(server.source, cache_dir=self.cache_dir)
+        with redirect_stdout(io.StringIO()):
+            self.assertEqual(get_source_answers(server.source, cache_dir=self.cache_dir, ttl=0,
+                                                timeout=1.0), ANSWERS)
+
+    def test_failing(self):
+        """An expired copy is still returned when the server fails."""
+        with StandInServer(make_page(ANSWERS), etag=ETAG) as server:
+            get_source_answers(server.source, cache_dir=self.cache_dir)
+            server.status = 500
+            with redirect_stdout(io.StringIO()):
+                self.assertEqual(get_source_answers(server.source, cache_dir=self.cache_dir,
+                                                    ttl=0), ANSWERS)
+            self.assertEqual(len(server.requests), 2)
+
+    def test_sync_newest_first(self):
+        """Once a page is shown to add answers up front, a sync stops at the cached answers."""
+        with StandInServer(make_page(ANSWERS), etag=ETAG) as server:
+            get_source_answers(server.source, cache_dir=self.cache_dir)
+            self.sync(server, ['TRAIN'] + ANSWERS, '"v2"')
+            # Anything past the overlap would fail to parse, so only a sync gets the new answer
+            self.sync(server, ['BLOKE', 'TRAIN'] + ANSWERS[:2] + ['TOOLONG'], '"v3"',
+                      ['BLOKE', 'TRAIN'] + ANSWERS)
+
+    def test_sync_alphabetical(self):
+        """An answer inserted in the middle of an alphabetical page is found."""
+        answers = ['ABACK', 'ABASE', 'ABATE', 'ABIDE', 'ACORN']
+        with StandInServer(make_page(answers), etag=ETAG) as server:
+            get_source_answers(server.source, cache_dir=self.cache_dir)
+            self.sync(server, ['AAHED'] + answers, '"v2"')  # Looks newest first, so far
+            self.sync(server, ['AAHED'] + answers[:4] + ['ABOUT'] + answers[4:], '"v3"')
+            self.sync(server, ['AAHED'] + answers[:4] + ['ABOUT', 'ACRID'] + answers[4:],
+                      '"v4"')
+
+    def test_sync_oldest_first(self):
+        """An answer appended to an oldest first page is found."""
+        answers = ANSWERS[::-1]
+        with StandInServer(make_page(answers), etag=ETAG) as server:
+            get_source_answers(server.source, cache_dir=self.cache_dir)
+            self.sync(server, answers + ['TRAIN'], '"v2"')
+            self.sync(server, answers + ['TRAIN', 'BLOKE'], '"v3"')
+
+    def test_parse_unordered(self):
+        """Known answers that don't follow the new ones never stop a parse early."""
+        for known, answers in ((['ABACK', 'ABASE', 'ABATE', 'ACORN'],
+                                ['ABACK', 'ABASE', 'ABATE', 'ABOUT', 'ACORN']),
+                               (['GHOST', 'PIANO', 'AUDIO', 'SLATE'],
+                                ['GHOST', 'PIANO', 'AUDIO', 'SLATE', 'CRANE']),
+                               (['CRANE', 'SLATE', 'AUDIO'], ['TRAIN', 'SLATE', 'CRANE', 'AUDIO'])):
+            with self.subTest(answers=answers):
+                self.assertEqual(parse_chunks([make_page(answers).decode()], url='stand-in',
+                                              tag='h2', known=known), answers)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,103 @@
+"""Fetching several archive sources at once, against local stand-ins (see: get_past_answers())."""
+
+# Standard Imports
+from contextlib import ExitStack, redirect_stdout
+import io
+import shutil
+import tempfile
+import time
+import unittest
+# Third Party Imports
+# Local Imports
+from test.stand_in import StandInServer, make_page
+from well.archive import get_past_answers
+from well.globals import ARCHIVE_FIRST, ARCHIVE_UNION
+
+
+ANSWERS = ['CRANE', 'SLATE', 'AUDIO', 'PIANO', 'GHOST']  # Newest first
+HANG = 2.0                                              # Seconds a hung server takes to answer
+
+
+class TestArchiveFetch(unittest.TestCase):
+    """Sick sources never hold up or spoil the answers of healthy ones."""
+
+    def setUp(self):
+        """Start every test with an empty cache and a quiet stdout."""
+        self.cache_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.cache_dir)
+        self.stack = ExitStack()
+        self.addCleanup(self.stack.close)
+        self.output = io.StringIO()
+        self.stack.enter_context(redirect_stdout(self.output))
+
+    def serve(self, *args, **kwargs) -> StandInServer:
+        """Start a StandInServer(*args, **kwargs) that stops at the end of the test."""
+        return self.stack.enter_context(StandInServer(*args, **kwargs))
+
+    def test_first_skips_hung(self):
+        """The first healthy answers win without waiting on a hung source."""
+        hung = self.serve(make_page(['TRAIN'] + ANSWERS), delay=HANG)
+        healthy = self.serve(make_page(ANSWERS))
+        start = time.perf_counter()
+        self.assertEqual(get_past_answers([hung.source, healthy.source], cache_dir=None,
+                                          merge=ARCHIVE_FIRST), ANSWERS)
+        self.assertLess(time.perf_counter() - start, HANG / 2)
+
+    def test_first_skips_failing(self):
+        """A source that errors or has no list is skipped."""
+        failing = self.serve(make_page(ANSWERS), status=500)
+        listless = self.serve(make_page(ANSWERS, needle='Something else'))
+        healthy = self.serve(make_page(ANSWERS), delay=0.1)
+        self.assertEqual(get_past_answers([failing.source, listless.source, healthy.source],
+                                          cache_dir=None, merge=ARCHIVE_FIRST), ANSWERS)
+
+    def test_first_quiet_stragglers(self):
+        """Sources left behind never print, while the failures waited on are reported."""
+        failing = self.serve(make_page(ANSWERS), status=500)
+        straggler = self.serve(make_page(ANSWERS), status=500, delay=0.3)
+        healthy = self.serve(make_page(ANSWERS), delay=0.1)
+        self.assertEqual(get_past_answers([failing.source, straggler.source, healthy.source],
+                                          cache_dir=self.cache_dir, merge=ARCHIVE_FIRST),
+                         ANSWERS)
+        self.assertIn(failing.source.url, self.output.getvalue())
+        time.sleep(0.5)  # Long enough for the straggler to fail
+        self.assertEqual(len(straggler.requests), 1)
+        self.assertNotIn(straggler.source.url, self.output.getvalue())
+
+    def test_all_failing(self):
+        """The first source's error is raised when every source fails."""
+        failing = self.serve(make_page(ANSWERS), status=500)
+        listless = self.serve(make_page(ANSWERS, needle='Something else'))
+        with self.assertRaises(OSError):  # The HTTPError of the 500
+            get_past_answers([failing.source, listless.source], cache_dir=None,
+                             merge=ARCHIVE_UNION)
+        with self.assertRaises(RuntimeError):
+            get_past_answers([listless.source, failing.source], cache_dir=None,
+                             merge=ARCHIVE_UNION)
+
+    def test_union(self):
+        """Every healthy source is merged, in source order, without duplicates."""
+        slow = self.serve(make_page(['TRAIN', 'CRANE', 'SLATE']), delay=0.3)
+        failing = self.serve(make_page(['ZZZZZ']), status=500)
+        healthy = self.serve(make_page(ANSWERS))
+        self.assertEqual(get_past_answers([slow.source, failing.source, healthy.source],
+                                          cache_dir=None, merge=ARCHIVE_UNION),
+                         ['TRAIN', 'CRANE', 'SLATE', 'AUDIO', 'PIANO', 'GHOST'])
+
+    def test_not_modified(self):
+        """Expired copies are revalidated with If-None-Match, and a 304 keeps them."""
+        first = self.serve(make_page(ANSWERS[:3]), etag='"a1"')
+        second = self.serve(make_page(ANSWERS[2:]), etag='"b1"')
+        sources = [first.source, second.source]
+        get_past_answers(sources, cache_dir=self.cache_dir, merge=ARCHIVE_UNION)
+        first.body = second.body = b'Not modified, so never sent'
+        self.assertEqual(get_past_answers(sources, cache_dir=self.cache_dir, ttl=0,
+                                          merge=ARCHIVE_UNION), ANSWERS)
+        for server, etag in ((first, '"a1"'), (second, '"b1"')):
+            self.assertEqual(len(server.requests), 2)
+            self.assertIsNone(server.requests[0].get('If-None-Match'))
+            self.assertEqual(server.requests[1].get('If-None-Match'), etag)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,62 @@
+"""The streaming archive parser, checked against BeautifulSoup on the saved HTML fixtures."""
+
+# Standard Imports
+from typing import List
+import codecs
+import glob
+import os
+import unittest
+# Third Party Imports
+# Local Imports
+from benchmarks.bench_archive import FIXTURE_DIR, BeautifulSoup, soup_items, stream_chunks
+from well.archive import parse_chunks
+
+
+class TestListParser(unittest.TestCase):
+    """parse_chunks() finds the same items BeautifulSoup did, however the page is chunked."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Read every fixture."""
+        cls.fixtures = {}  # Fixture filename to its raw bytes
+        for filename in sorted(glob.glob(os.path.join(FIXTURE_DIR, '*.html'))):
+            with open(filename, 'rb') as in_file:
+                cls.fixtures[os.path.basename(filename)] = in_file.read()
+
+    def test_fixtures(self):
+        """Every fixture is there to test against."""
+        self.assertIn('archive_answers.html', self.fixtures)
+        self.assertIn('archive_messy.html', self.fixtures)
+
+    @unittest.skipIf(BeautifulSoup is None, 'BeautifulSoup is not installed')
+    def test_soup(self):
+        """Streamed items match the BeautifulSoup parse, item for item."""
+        for name, raw_bytes in self.fixtures.items():
+            expected = soup_items(raw_bytes.decode('utf-8'))
+            for size in (1, 7, 1024, len(raw_bytes)):
+                with self.subTest(fixture=name, chunk_size=size):
+                    self.assertEqual(parse_chunks(_split(raw_bytes, size), url=name, tag='h2'),
+                                     expected)
+
+    def test_stops_early(self):
+        """The parser stops reading once the list closes."""
+        for name, raw_bytes in self.fixtures.items():
+            with self.subTest(fixture=name):
+                consumed = [0]  # Bytes read before the parser stopped
+                self.assertTrue(parse_chunks(stream_chunks(raw_bytes, consumed), url=name,
+                                             tag='h2'))
+                self.assertLess(consumed[0], len(raw_bytes))
+
+
+def _split(raw_bytes: bytes, size: int) -> List[str]:
+    """Split raw_bytes every size bytes, and decode them like a streamed response would."""
+    # LOCAL VARIABLES
+    decoder = codecs.getincrementaldecoder('utf-8')()  # Same decoding as the archive module
+
+    # DONE
+    return [decoder.decode(raw_bytes[start:start + size])
+            for start in range(0, len(raw_bytes), size)] + [decoder.decode(b'', final=True)]
+
+
+if __name__ == '__main__':
+    unittest.main()
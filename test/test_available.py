@@ -0,0 +1,93 @@
+"""Keeping the available words in step with the archive (see: remove_words())."""
+
+# Standard Imports
+from typing import List, Optional, Tuple
+from unittest import mock
+import glob
+import os
+import shutil
+import tempfile
+import unittest
+# Third Party Imports
+# Local Imports
+from well.globals import FIVE_LETTER_WORDS
+from well.instrument import NullInstrument
+from well.main import _get_available
+from well.words import remove_words
+
+
+ARCHIVE = ['CRANE', 'SLATE', 'AUDIO']  # Past answers, upper case like the archive
+
+
+class TestRemoveWords(unittest.TestCase):
+    """In place removal deletes every remove word in one pass, and only touches source."""
+
+    def test_in_place(self):
+        """Every remove word is deleted, in any case, from the very same list."""
+        # LOCAL VARIABLES
+        source = list(FIVE_LETTER_WORDS)  # List to remove from
+
+        # TEST IT
+        self.assertIs(remove_words(source, ARCHIVE + ['ZZZZZ'], in_place=True), source)
+        self.assertEqual(source, remove_words(FIVE_LETTER_WORDS, ARCHIVE))
+        self.assertEqual(len(source), len(FIVE_LETTER_WORDS) - len(ARCHIVE))
+        self.assertIs(remove_words(source, [], in_place=True), source)
+        self.assertEqual(len(source), len(FIVE_LETTER_WORDS) - len(ARCHIVE))
+
+
+class TestGetAvailable(unittest.TestCase):
+    """A later run syncs the last run's result with the new answers instead of starting over."""
+
+    def setUp(self):
+        """Start every test with an empty cache."""
+        self.cache_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.cache_dir)
+
+    def get_available(self, archive: List[str],
+                      new_answers: List[str]) -> Tuple[List[str], Optional[List[str]]]:
+        """Run _get_available() against a fake archive.
+
+        Args:
+            archive: What get_past_answers() returns.
+            new_answers: What get_new_answers() returns.
+
+        Returns:
+            The available words, and the answers get_new_answers() was told were known, or None
+            if the whole archive was read instead.
+        """
+        # LOCAL VARIABLES
+        known = []      # Every known answers get_new_answers() was called with
+        available = []  # Result under test
+
+        # RUN IT
+        with mock.patch('well.main.get_past_answers', return_value=archive), \
+                mock.patch('well.main.get_new_answers',
+                           side_effect=lambda answers: known.append(list(answers)) or new_answers):
+            available = _get_available(FIVE_LETTER_WORDS, NullInstrument(),
+                                       cache_dir=self.cache_dir)
+
+        # DONE
+        return available, known[0] if known else None
+
+    def test_sync(self):
+        """Only the first run reads the whole archive, and every run removes all of it."""
+        self.assertEqual(self.get_available(ARCHIVE, ['GHOST']),
+                         (remove_words(FIVE_LETTER_WORDS, ARCHIVE), None))
+        self.assertEqual(self.get_available(['PIANO'], ['GHOST']),
+                         (remove_words(FIVE_LETTER_WORDS, ARCHIVE + ['GHOST']), ARCHIVE))
+        self.assertEqual(self.get_available(['PIANO'], []),
+                         (remove_words(FIVE_LETTER_WORDS, ARCHIVE + ['GHOST']),
+                          ARCHIVE + ['GHOST']))
+
+    def test_corrupt(self):
+        """An unusable saved result is rebuilt from the whole archive."""
+        self.get_available(ARCHIVE, [])
+        for filename in glob.glob(os.path.join(self.cache_dir, 'available-*.json')):
+            with open(filename, 'w', encoding='utf-8') as out_file:
+                out_file.write('{"archive": "not a list"}')
+        self.assertEqual(self.get_available(['GHOST'], []),
+                         (remove_words(FIVE_LETTER_WORDS, ['GHOST']), None))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,103 @@
+"""LRUCache limits and counters."""
+
+# Standard Imports
+import threading
+import unittest
+# Third Party Imports
+# Local Imports
+from well.cache import CacheStats, LRUCache
+
+
+class TestLRUCache(unittest.TestCase):
+    """Least recently used entries go first, and every lookup is counted."""
+
+    def test_entry_limit(self):
+        """The least recently used entry is evicted once max_entries is exceeded."""
+        # LOCAL VARIABLES
+        cache = LRUCache(max_entries=2)  # Cache under test
+
+        # TEST IT
+        cache.put('a', 1)
+        cache.put('b', 2)
+        self.assertEqual(cache.get('a'), 1)  # Now b is the least recently used
+        cache.put('c', 3)
+        self.assertNotIn('b', cache)
+        self.assertIn('a', cache)
+        self.assertIn('c', cache)
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.evictions, 1)
+
+    def test_byte_limit(self):
+        """Entries are evicted until the total size is back under max_bytes."""
+        # LOCAL VARIABLES
+        cache = LRUCache(max_bytes=10, sizeof=len)  # Cache under test, sized by len()
+
+        # TEST IT
+        cache.put('a', 'xxxx')
+        cache.put('b', 'xxxx')
+        cache.put('c', 'xxxxxx')
+        self.assertEqual(['c' in cache, 'b' in cache, 'a' in cache], [True, True, False])
+        self.assertEqual(cache.size, 10)
+        cache.put('d', 'x' * 11)  # Too big to ever fit
+        self.assertNotIn('d', cache)
+        self.assertEqual(cache.size, 10)
+        self.assertEqual(cache.evictions, 1)
+
+    def test_replace(self):
+        """Putting a cached key replaces its value and its size."""
+        # LOCAL VARIABLES
+        cache = LRUCache(sizeof=len)  # Cache under test, sized by len()
+
+        # TEST IT
+        cache.put('a', 'xxxx')
+        cache.put('a', 'xx')
+        self.assertEqual(cache.get('a'), 'xx')
+        self.assertEqual(cache.size, 2)
+        self.assertEqual(len(cache), 1)
+
+    def test_counters(self):
+        """Hits and misses are counted by get(), but not by `in`, and clear() resets them."""
+        # LOCAL VARIABLES
+        cache = LRUCache(max_entries=1, sizeof=len)  # Cache under test, sized by len()
+
+        # TEST IT
+        self.assertIsNone(cache.get('a'))
+        self.assertEqual(cache.get('a', 'default'), 'default')
+        cache.put('a', 'xx')
+        self.assertEqual(cache.get('a'), 'xx')
+        self.assertIn('a', cache)
+        cache.put('b', 'xxx')
+        self.assertEqual(cache.stats(), CacheStats(hits=1, misses=2, evictions=1, entries=1,
+                                                   size=3))
+        cache.clear()
+        self.assertEqual(cache.stats(), CacheStats(hits=0, misses=0, evictions=0, entries=0,
+                                                   size=0))
+
+    def test_threads(self):
+        """Counters and limits hold up when threads share the cache."""
+        # LOCAL VARIABLES
+        cache = LRUCache(max_entries=50)  # Cache under test
+        threads = [threading.Thread(target=_hammer, args=(cache, offset))
+                   for offset in range(4)]  # Threads sharing the cache
+
+        # TEST IT
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(cache.hits + cache.misses, 4 * 1000)
+        self.assertEqual(len(cache), 50)
+        self.assertLessEqual(cache.evictions, cache.misses - 50)  # Racing misses may share a put
+        self.assertEqual(cache.size, sum(cache.sizeof([key]) for key in range(1300)
+                                         if key in cache))
+
+
+def _hammer(cache: LRUCache, offset: int) -> None:
+    """Look up, and cache on a miss, 1000 keys that overlap with other threads'."""
+    for key in range(offset * 100, offset * 100 + 1000):
+        if cache.get(key) is None:
+            cache.put(key, [key])
+
+
+if __name__ == '__main__':
+    unittest.main()
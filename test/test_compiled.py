@@ -0,0 +1,83 @@
+"""Every compiled form of the hints (scan, regex, predicates) agrees with WordHints.filter()."""
+
+# Standard Imports
+import random
+import re
+import unittest
+# Third Party Imports
+# Local Imports
+from well.globals import FIVE_LETTER_WORDS
+from well.patterns import pattern_results, score_guess
+from well.word_hints import WordHints
+
+
+GAMES = 100  # Random games played per test
+TURNS = 4    # Random guesses per game
+
+
+class TestCompiled(unittest.TestCase):
+    """scan(), to_regex(), compile_predicate() and Constraints.predicate() keep the same words."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Share one word list, and its one word per line buffer."""
+        cls.words = list(FIVE_LETTER_WORDS)
+        cls.buffer = '\n'.join(cls.words) + '\n'
+
+    def assert_agree(self, hints: WordHints) -> None:
+        """Check every compiled form of hints against filter() on the whole word list."""
+        # LOCAL VARIABLES
+        expected = list(hints.filter(self.words))  # Words the hints keep
+        regex = re.compile(hints.to_regex())        # Exported expression
+        predicate = hints.compile_predicate()       # Generated predicate
+
+        # CHECK IT
+        self.assertEqual(list(hints.scan(self.buffer)), expected)
+        self.assertEqual([word for word in self.words if regex.match(word)], expected)
+        self.assertEqual([word for word in self.words if predicate(word)], expected)
+        self.assertEqual(list(filter(hints.compile().predicate(), self.words)), expected)
+
+    def play(self, answer: str, *guesses: str) -> WordHints:
+        """Play guesses against answer, checking every compiled form after each one.
+
+        Returns:
+            The resulting hints.
+        """
+        # LOCAL VARIABLES
+        hints = WordHints()  # Hints under test
+
+        # PLAY IT
+        for guess in guesses:
+            hints.update_word(guess, pattern_results(score_guess(guess, answer),
+                                                     length=len(answer)))
+            with self.subTest(answer=answer, guesses=guesses[:guesses.index(guess) + 1]):
+                self.assert_agree(hints)
+
+        # DONE
+        return hints
+
+    def test_minimum_counts(self):
+        """Repeated yellows and greens raise the minimum count of a letter."""
+        self.assertIn(('e', 3, 5), self.play('geese', 'eerie').compile().bounds)
+        self.assertIn(('s', 2, 5), self.play('sassy', 'asset').compile().bounds)
+        self.assertIn(('a', 2, 5), self.play('llama', 'label', 'allay').compile().bounds)
+
+    def test_maximum_counts(self):
+        """A grey copy of a letter that's also green or yellow caps its count."""
+        self.assertIn(('e', 2, 2), self.play('lever', 'eerie').compile().bounds)
+        self.assertIn(('e', 1, 1), self.play('crept', 'geese').compile().bounds)
+        self.assertIn(('l', 2, 2), self.play('llama', 'lolly').compile().bounds)
+        self.assertIn(('t', 1, 1), self.play('robot', 'tooth', 'motto').compile().bounds)
+
+    def test_random_games(self):
+        """Every compiled form agrees after every turn of random games."""
+        # LOCAL VARIABLES
+        rng = random.Random(24)  # Reproducible games
+
+        # TEST IT
+        for _ in range(GAMES):
+            self.play(rng.choice(self.words), *rng.sample(self.words, TURNS))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,56 @@
+"""Entropy ranking, checked against bucket histograms counted one guess at a time."""
+
+# Standard Imports
+from collections import Counter
+import math
+import random
+import unittest
+# Third Party Imports
+# Local Imports
+from well.entropy import calc_entropies
+from well.patterns import matrix_max_words, score_guess
+from well.vectorized import HAVE_NUMPY, np
+
+
+@unittest.skipUnless(HAVE_NUMPY, 'Entropy ranking requires NumPy')
+class TestCalcEntropies(unittest.TestCase):
+    """Blocking guesses by word length never changes the entropies."""
+
+    def assert_entropies(self, words: tuple) -> None:
+        """Compare calc_entropies() for every word against every word with a direct count.
+
+        Args:
+            words: A hashable word list, every word the same length.
+        """
+        # LOCAL VARIABLES
+        rows = np.arange(len(words))  # Every word as both guess and answer
+        expected = []                 # Entropy of each guess, counted directly
+
+        # CHECK IT
+        for guess in words:
+            counts = Counter(score_guess(guess, answer) for answer in words)
+            expected.append(-sum(count / len(words) * math.log2(count / len(words))
+                                 for count in counts.values()))
+        np.testing.assert_allclose(calc_entropies(rows, rows, words), expected)
+
+    def test_five_letters(self):
+        """One block covers every guess."""
+        rand = random.Random(5)
+        self.assert_entropies(tuple(sorted({''.join(rand.choices('abcdefgh', k=5))
+                                            for _ in range(300)})))
+
+    def test_eleven_letters(self):
+        """A 3**11 bucket histogram shrinks the blocks to a few dozen guesses."""
+        rand = random.Random(11)
+        self.assert_entropies(tuple(sorted({''.join(rand.choices('abcdefgh', k=11))
+                                            for _ in range(100)})))
+
+    def test_matrix_max_words(self):
+        """Wider patterns leave room for fewer words."""
+        self.assertEqual(matrix_max_words(5), 16_384)
+        self.assertLess(matrix_max_words(8), matrix_max_words(5))
+        self.assertLess(matrix_max_words(11), matrix_max_words(8))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,110 @@
+"""Hard mode: legal guesses keep revealed greens in place and play revealed yellows again."""
+
+# Standard Imports
+from typing import List, Tuple
+import random
+import unittest
+# Third Party Imports
+# Local Imports
+from well.globals import FIVE_LETTER_WORDS, INPUT_GREEN, INPUT_YELLOW, RANKING_ENTROPY
+from well.patterns import pattern_results, score_guess
+from well.solver import Solver
+from well.vectorized import HAVE_NUMPY
+from well.word_index import WordIndex
+
+
+GAMES = 200  # Random games played per test
+TURNS = 4    # Random legal guesses per game
+
+
+class TestHardMode(unittest.TestCase):
+    """The legal guesses are exactly the words that use every revealed hint."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Share one word list and index."""
+        cls.words = list(FIVE_LETTER_WORDS)
+        cls.word_index = WordIndex(cls.words)
+
+    def play(self, solver: Solver, answer: str, rng: random.Random) -> List[Tuple[str, str]]:
+        """Play random legal guesses, checking the legal guesses after every turn.
+
+        Returns:
+            Every (guess, results) played.
+        """
+        # LOCAL VARIABLES
+        plays = []    # Every (guess, results) so far
+        guess = ''    # Current guess
+        results = ''  # Feedback for guess
+
+        # PLAY IT
+        for _ in range(TURNS):
+            guess = rng.choice(solver.legal_list)
+            results = pattern_results(score_guess(guess, answer), length=len(answer))
+            if results == INPUT_GREEN * len(answer):
+                break
+            solver.update(guess, results)
+            plays.append((guess, results))
+            with self.subTest(answer=answer, plays=plays):
+                self.assertEqual(solver.legal_list, [word for word in solver.guess_index.words
+                                                     if _uses_hints(word, plays)])
+                self.assertIn(answer, solver.legal_list)
+                self.assertLessEqual(set(solver.available_list), set(solver.legal_list))
+
+        # DONE
+        return plays
+
+    def test_random_games(self):
+        """Legal guesses match a direct check of every revealed hint after every turn."""
+        # LOCAL VARIABLES
+        rng = random.Random(17)  # Reproducible games
+
+        # TEST IT
+        for _ in range(GAMES):
+            self.play(Solver([], word_index=self.word_index, hard=True,
+                             guess_index=self.word_index), rng.choice(self.words), rng)
+
+    def test_known_hints(self):
+        """A green stays put and a yellow is played again, anywhere, even where it was yellow."""
+        # LOCAL VARIABLES
+        solver = Solver([], word_index=self.word_index, hard=True,
+                        guess_index=self.word_index)  # Hard mode game
+
+        # TEST IT
+        solver.update('crane', 'g  y ')  # C is first, and there's an N somewhere
+        self.assertIn('clung', solver.legal_list)
+        self.assertIn('cynic', solver.legal_list)
+        self.assertIn('caner', solver.legal_list)  # N where it was yellow, and a grey E
+        self.assertNotIn('uncle', solver.legal_list)  # C moved
+        self.assertNotIn('chalk', solver.legal_list)  # No N
+
+    @unittest.skipUnless(HAVE_NUMPY, 'Entropy ranking requires NumPy')
+    def test_entropy(self):
+        """The entropy ranking only suggests legal guesses."""
+        # LOCAL VARIABLES
+        rng = random.Random(170)              # Reproducible games
+        dictionary = tuple(self.words[:600])  # Every legal guess, few enough to rank quickly
+        solver = None                         # Hard mode game
+
+        # TEST IT
+        for _ in range(10):
+            solver = Solver(list(dictionary), ranking=RANKING_ENTROPY, hard=True,
+                            dictionary=dictionary)
+            solver.rank()
+            if self.play(solver, rng.choice(dictionary), rng):
+                self.assertLessEqual(set(solver.rank()), set(solver.legal_list))
+
+
+def _uses_hints(word: str, plays: List[Tuple[str, str]]) -> bool:
+    """Determine if word keeps every green of plays in place and plays every yellow again."""
+    for guess, results in plays:
+        for index, (letter, result) in enumerate(zip(guess, results)):
+            if result == INPUT_GREEN and word[index] != letter:
+                return False
+            if result == INPUT_YELLOW and letter not in word:
+                return False
+    return True
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,69 @@
+"""Instrumentation of nested stages."""
+
+# Standard Imports
+import io
+import json
+import time
+import tracemalloc
+import unittest
+# Third Party Imports
+# Local Imports
+from well.instrument import Instrument, PROFILE_CPROFILE, PROFILE_TRACEMALLOC
+
+
+def _after_inner_stage() -> None:
+    """Run in the outer stage once the inner stage is over."""
+    time.sleep(0.001)
+
+
+class TestNestedStages(unittest.TestCase):
+    """An inner stage neither double counts nor cuts short its outer stage."""
+
+    def play(self, profile: str = None) -> dict:
+        """Run an outer stage wrapped around an inner stage and return the emitted turn.
+
+        Args:
+            profile: Optional; The profile mode to instrument with.
+        """
+        # LOCAL VARIABLES
+        out_file = io.StringIO()                           # JSON lines
+        instrument = Instrument(out_file, profile=profile)  # Instrumentation under test
+        keep = None                                        # Memory held by the outer stage
+
+        # PLAY IT
+        try:
+            with instrument.stage('outer'):
+                time.sleep(0.05)
+                with instrument.stage('inner'):
+                    time.sleep(0.1)
+                keep = bytearray(1 << 20)
+                _after_inner_stage()
+            del keep
+        finally:
+            instrument.close()
+
+        # DONE
+        return json.loads(out_file.getvalue().splitlines()[0])
+
+    def test_exclusive_time(self):
+        """The outer stage isn't credited with the inner stage's time."""
+        stages = self.play()['stages_ms']
+        self.assertGreaterEqual(stages['inner'], 100)
+        self.assertGreaterEqual(stages['outer'], 50)
+        self.assertLess(stages['outer'], 100)
+
+    def test_cprofile(self):
+        """The profiler keeps running after the inner stage."""
+        functions = [func['function'] for func in self.play(PROFILE_CPROFILE)['profile']]
+        self.assertTrue(any(func.endswith('(_after_inner_stage)') for func in functions))
+
+    @unittest.skipIf(tracemalloc.is_tracing(), 'tracemalloc is already in use')
+    def test_tracemalloc(self):
+        """The outer stage's peak covers memory allocated after the inner stage."""
+        memory = self.play(PROFILE_TRACEMALLOC)['peak_bytes']
+        self.assertGreaterEqual(memory['outer'], 1 << 20)
+        self.assertNotIn('inner', memory)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,106 @@
+"""Multi-board games: one guess stream ranked and narrowed across every board (see: MultiSolver)."""
+
+# Standard Imports
+from collections import defaultdict
+import unittest
+# Third Party Imports
+# Local Imports
+from well.globals import FIVE_LETTER_WORDS, INPUT_GREEN
+from well.multi_solver import MultiSolver
+from well.patterns import pattern_results, score_guess
+from well.solver import Solver
+from well.word_index import WordIndex
+
+
+ANSWERS = ['moist', 'plank', 'fuzzy']  # One per board
+
+
+class TestMultiSolver(unittest.TestCase):
+    """Boards are ranked together, drop out once solved, and bad input changes nothing."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Share one word list and index."""
+        cls.words = list(FIVE_LETTER_WORDS)
+        cls.word_index = WordIndex(cls.words)
+
+    def setUp(self):
+        """Start a game, and a standalone Solver per board to check it against."""
+        self.game = MultiSolver([], boards=len(ANSWERS), word_index=self.word_index)
+        self.singles = [Solver([], word_index=self.word_index) for _ in ANSWERS]
+
+    def guess(self, word: str) -> None:
+        """Play word on the game and on every standalone Solver."""
+        # LOCAL VARIABLES
+        results = [pattern_results(score_guess(word, answer), length=len(answer))
+                   for answer in ANSWERS]  # Feedback for every board
+
+        # PLAY IT
+        self.game.update(word, results)
+        for single, result in zip(self.singles, results):
+            if result != INPUT_GREEN * len(word):
+                single.update(word, result)
+
+    def test_first_turn(self):
+        """Boards in the same state rank like one board, scaled by the number of boards."""
+        self.assertEqual(list(self.game.rank().items()),
+                         [(guess, score * len(ANSWERS))
+                          for guess, score in self.singles[0].rank().items()])
+
+    def test_combined(self):
+        """Boards in different states rank by the sum of their own scores."""
+        # LOCAL VARIABLES
+        totals = defaultdict(float)  # Guess to combined score
+
+        # TEST IT
+        for single in self.singles:
+            single.rank()  # Turn one, so turn two ranks just as the game's boards do
+        self.game.rank()
+        self.guess('crane')
+        for single in self.singles:
+            for guess, score in single.rank().items():
+                totals[guess] += score
+        self.assertEqual(dict(self.game.rank()), dict(totals))
+        self.assertEqual(list(self.game.rank().values()),
+                         sorted(totals.values(), reverse=True))
+        self.assertEqual([board.available_list for board in self.game.boards],
+                         [single.available_list for single in self.singles])
+
+    def test_solved(self):
+        """A solved board drops out of ranking and narrowing, and its results are ignored."""
+        # LOCAL VARIABLES
+        results = []  # Feedback for the next guess
+
+        # TEST IT
+        self.guess('moist')
+        self.assertEqual(self.game.solved, [True, False, False])
+        self.assertEqual(self.game.unsolved, self.game.boards[1:])
+        self.assertNotIn('moist', self.game.rank())
+        results = ['not even results'] + [pattern_results(score_guess('plank', answer))
+                                          for answer in ANSWERS[1:]]
+        self.game.update('plank', results)
+        self.assertEqual(self.game.solved, [True, True, False])
+        self.assertFalse(self.game.boards[0].word_hints.deltas)  # Solved, so never updated
+        self.assertEqual(self.game.rank(), self.game.boards[2].rank())  # Only board left
+
+    def test_bad_results(self):
+        """Bad results for any board are rejected before any board is updated."""
+        # LOCAL VARIABLES
+        signatures = [board.word_hints.signature()
+                      for board in self.game.boards]  # Before the bad input
+
+        # TEST IT
+        with self.assertRaises(ValueError):
+            self.game.update('crane', ['     ', 'g    '])  # Too few boards
+        with self.assertRaises(ValueError):
+            self.game.update('crane', ['     ', '  y  ', 'x    '])  # Not a result
+        with self.assertRaises(ValueError):
+            self.game.update('crane', ['     ', '  y  ', '    '])  # Too short
+        self.assertEqual([board.word_hints.signature() for board in self.game.boards],
+                         signatures)
+        self.assertEqual([len(board.available_list) for board in self.game.boards],
+                         [len(self.words)] * len(ANSWERS))
+
+
+if __name__ == '__main__':
+    unittest.main()
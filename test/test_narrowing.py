@@ -0,0 +1,74 @@
+"""Incremental narrowing (see: narrow_word_hints()) must agree with a full filter."""
+
+# Standard Imports
+import random
+import unittest
+# Third Party Imports
+# Local Imports
+from well.globals import FIVE_LETTER_WORDS
+from well.patterns import pattern_results, score_guess
+from well.solver import Solver
+from well.word_hints import WordHints
+from well.word_index import WordIndex
+from well.words import narrow_word_hints, remove_word_hints
+
+
+GAMES = 200  # Random games played per test
+TURNS = 6    # Random guesses per game
+
+
+class TestNarrowing(unittest.TestCase):
+    """Narrowing by each update's delta matches filtering by every hint from scratch."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Share one word list and index."""
+        cls.words = list(FIVE_LETTER_WORDS)
+        cls.word_index = WordIndex(cls.words)
+
+    def test_random_games(self):
+        """Narrow, full filter and the Solver's bitsets agree after every turn of random games."""
+        # LOCAL VARIABLES
+        rng = random.Random(6)  # Reproducible games
+        answer = ''             # Hidden answer
+        guess = ''              # Current guess
+        hints = None            # WordHints of one game
+        solver = None           # Solver of one game
+        narrowed = []           # Incrementally narrowed survivors
+
+        # TEST IT
+        for _ in range(GAMES):
+            answer = rng.choice(self.words)
+            hints = WordHints()
+            solver = Solver([], word_index=self.word_index)
+            narrowed = self.words
+            for _ in range(TURNS):
+                guess = rng.choice(self.words)
+                results = pattern_results(score_guess(guess, answer), length=len(answer))
+                hints.update_word(guess, results)
+                solver.update(guess, results)
+                narrowed = narrow_word_hints(narrowed, hints)
+                with self.subTest(answer=answer, guess=guess):
+                    self.assertIsNotNone(hints.deltas[-1])
+                    self.assertEqual(narrowed, remove_word_hints(self.words, hints))
+                    self.assertEqual(solver.available_list, narrowed)
+                    self.assertIn(answer, narrowed)
+
+    def test_loosened_hints(self):
+        """Contradictory feedback that loosens the hints falls back to a full filter."""
+        # LOCAL VARIABLES
+        hints = WordHints()  # Hints to loosen
+        narrowed = []        # Incrementally narrowed survivors
+
+        # TEST IT
+        hints.update_word('teeth', '   y ')  # No T in the fourth position
+        narrowed = narrow_word_hints(self.words, hints)
+        hints.update_word('tatty', '   g ')  # ...but there it is
+        self.assertIsNone(hints.deltas[-1])
+        self.assertEqual(narrow_word_hints(narrowed, hints),
+                         remove_word_hints(self.words, hints))
+        self.assertFalse(set(narrowed) & set(remove_word_hints(self.words, hints)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,144 @@
+"""The opening tree, shared between the whole dictionary and subsets of it (see: OpeningTree)."""
+
+# Standard Imports
+from contextlib import redirect_stdout
+import io
+import os
+import random
+import shutil
+import tempfile
+import unittest
+# Third Party Imports
+# Local Imports
+from well.globals import FIVE_LETTER_WORDS, RANKING_FREQUENCY, RANKING_POSITIONAL
+from well.opening import TREE_MIN_KEPT, build_opening_tree, get_tree_file, load_opening_tree
+from well.patterns import pattern_results, score_guess
+from well.solver import Solver
+from well.word_index import WordIndex
+
+
+GAMES = 100  # Random games played per test
+
+
+class TestOpeningTree(unittest.TestCase):
+    """A tree built for the dictionary serves subsets of it exactly like live computation."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Build one tree for the whole dictionary."""
+        cls.cache_dir = tempfile.mkdtemp()
+        cls.words = list(FIVE_LETTER_WORDS)
+        cls.full_index = WordIndex(cls.words)
+        build_opening_tree(cls.full_index, cache_dir=cls.cache_dir)
+
+    @classmethod
+    def tearDownClass(cls):
+        """Remove the tree."""
+        shutil.rmtree(cls.cache_dir)
+
+    def assert_live(self, word_index: WordIndex, seed: int) -> None:
+        """Play random games with and without the tree, and compare the first two turns."""
+        # LOCAL VARIABLES
+        rng = random.Random(seed)                                     # Reproducible games
+        tree = load_opening_tree(word_index, cache_dir=self.cache_dir)  # Tree under test
+        solvers = []                                                  # With, then without tree
+        answer = ''                                                   # Hidden answer
+        results = ''                                                  # Feedback for the opener
+
+        # TEST IT
+        self.assertIsNotNone(tree)
+        for _ in range(GAMES):
+            answer = rng.choice(word_index.words)
+            solvers = [Solver([], word_index=word_index, tree=tree),
+                       Solver([], word_index=word_index)]
+            self.assert_ranked(solvers, tree.top)
+            results = pattern_results(score_guess(tree.opener, answer), length=len(answer))
+            for solver in solvers:
+                solver.update(tree.opener, results)
+            self.assertEqual(*[solver.available_list for solver in solvers])
+            self.assertEqual(*[solver.survivors for solver in solvers])
+            self.assert_ranked(solvers, tree.top)
+
+    def assert_ranked(self, solvers: list, top: int) -> None:
+        """The tree's ranking is the live one, cut off after top guesses or fewer if filtered."""
+        # LOCAL VARIABLES
+        ranked = [list(solver.rank().items()) for solver in solvers]  # With, then without tree
+
+        # TEST IT
+        self.assertLessEqual(len(ranked[0]), top)
+        self.assertGreaterEqual(len(ranked[0]), min(TREE_MIN_KEPT, len(ranked[1])))
+        self.assertEqual(ranked[0], ranked[1][:len(ranked[0])])
+
+    def test_dictionary(self):
+        """Every lookup is served from the tree for the dictionary it was built for."""
+        # LOCAL VARIABLES
+        tree = load_opening_tree(self.full_index, cache_dir=self.cache_dir)  # Tree under test
+
+        # TEST IT
+        self.assertIsNotNone(tree.root())
+        self.assertIsNotNone(tree.lookup(0).ranking)
+        self.assert_live(self.full_index, seed=16)
+
+    def test_subset(self):
+        """A subset (e.g., the dictionary minus the archive) still uses the tree, and agrees."""
+        # LOCAL VARIABLES
+        rng = random.Random(160)                                       # Reproducible subset
+        subset = WordIndex([word for word in self.words if rng.random() > 0.2])  # Unplayed words
+        tree = load_opening_tree(subset, cache_dir=self.cache_dir)     # Tree under test
+
+        # TEST IT
+        self.assertTrue(set(tree.root()) <= set(subset.words))  # Filtered, not thrown away
+        self.assertIsNotNone(tree.lookup(0).ranking)
+        self.assertTrue(set(subset.words[index] for index in tree.lookup(0).candidate_ids)
+                        <= set(subset.words))
+        self.assert_live(subset, seed=17)
+
+    def test_rebuild(self):
+        """A positional tree is built for the words in play, and rebuilt when they change."""
+        # LOCAL VARIABLES
+        cache_dir = tempfile.mkdtemp()        # Where the trees go
+        dictionary = tuple(self.words[:600])  # Every legal guess
+        pools = [WordIndex(list(dictionary[1:])),
+                 WordIndex(list(dictionary[2:]))]  # Before and after the archive grew
+        names = [get_tree_file(pool.words, RANKING_POSITIONAL, cache_dir, dictionary)
+                 for pool in [WordIndex(list(dictionary))] + pools]  # Dictionary, then pools
+        output = io.StringIO()  # What load_opening_tree() had to say
+        tree = None             # Tree under test
+
+        # TEST IT
+        self.addCleanup(shutil.rmtree, cache_dir)
+        self.assertIsNone(load_opening_tree(pools[0], ranking=RANKING_POSITIONAL,
+                                            dictionary=dictionary, cache_dir=cache_dir,
+                                            rebuild=True))  # Never built, so never rebuilt
+        for pool in [WordIndex(list(dictionary)), pools[0]]:
+            build_opening_tree(pool, ranking=RANKING_POSITIONAL, cache_dir=cache_dir,
+                               dictionary=dictionary)
+        self.assertIsNone(load_opening_tree(pools[1], ranking=RANKING_POSITIONAL,
+                                            dictionary=dictionary, cache_dir=cache_dir))
+        with redirect_stdout(output):
+            tree = load_opening_tree(pools[1], ranking=RANKING_POSITIONAL, dictionary=dictionary,
+                                     cache_dir=cache_dir, rebuild=True)
+        self.assertIn('Rebuilding', output.getvalue())
+        self.assertEqual(list(tree.root().items()),
+                         list(Solver([], ranking=RANKING_POSITIONAL, word_index=pools[1],
+                                     dictionary=dictionary).rank().items())[:tree.top])
+        self.assertEqual([os.path.isfile(name) for name in names], [True, False, True])
+
+    def test_stale(self):
+        """A tree that can't be used is reported and ignored."""
+        # LOCAL VARIABLES
+        cache_dir = tempfile.mkdtemp()  # Where the stale tree goes
+        output = io.StringIO()          # What load_opening_tree() had to say
+
+        # TEST IT
+        self.addCleanup(shutil.rmtree, cache_dir)
+        self.assertIsNone(load_opening_tree(self.full_index, cache_dir=cache_dir))  # Never built
+        with open(get_tree_file(self.words, RANKING_FREQUENCY, cache_dir), 'wb') as out_file:
+            out_file.write(b'WELLTREE' + bytes(64))
+        with redirect_stdout(output):
+            self.assertIsNone(load_opening_tree(self.full_index, cache_dir=cache_dir))
+        self.assertIn('--build-tree', output.getvalue())
+
+
+if __name__ == '__main__':
+    unittest.main()
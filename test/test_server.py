@@ -0,0 +1,76 @@
+"""HintServer sessions and feedback validation (see: HintServer.take_feedback())."""
+
+# Standard Imports
+import asyncio
+import tempfile
+import unittest
+# Third Party Imports
+# Local Imports
+from well.globals import FIVE_LETTER_WORDS
+from well.server import HintServer, HTTPError
+
+
+class TestTakeFeedback(unittest.TestCase):
+    """Bad feedback is refused, and never marks a session solved."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Share one server, with an empty cache directory and so no opening tree."""
+        cls.cache_dir = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        cls.server = HintServer(list(FIVE_LETTER_WORDS), cache_dir=cls.cache_dir.name)
+
+    @classmethod
+    def tearDownClass(cls):
+        """Remove the cache directory."""
+        cls.cache_dir.cleanup()
+
+    def feedback(self, session_id: str, word: str, results: str) -> dict:
+        """Send one feedback line to a session."""
+        return asyncio.run(self.server.take_feedback(session_id, {'word': word,
+                                                                  'results': results}))
+
+    def test_wrong_length(self):
+        """Results that don't match the word length are a 400, and the game goes on."""
+        # LOCAL VARIABLES
+        session_id = asyncio.run(self.server.create_session())['session']  # Session under test
+
+        # TEST IT
+        for word, results in [('tares', ''), ('tares', 'gg'), ('', ''), ('tar', 'ggg'),
+                              ('tares', 'gggggg')]:
+            with self.subTest(word=word, results=results):
+                with self.assertRaises(HTTPError) as context:
+                    self.feedback(session_id, word, results)
+                self.assertEqual(context.exception.status, 400)
+        self.assertFalse(self.server.sessions[session_id].solved)
+        self.assertLess(self.feedback(session_id, 'tares', 'y   g')['remaining'],
+                        len(FIVE_LETTER_WORDS))
+
+    def test_solved(self):
+        """All green results solve the session."""
+        # LOCAL VARIABLES
+        session_id = asyncio.run(self.server.create_session())['session']  # Session under test
+
+        # TEST IT
+        self.feedback(session_id, 'tares', 'ggggg')
+        self.assertTrue(self.server.sessions[session_id].solved)
+
+
+class TestGuessIndex(unittest.TestCase):
+    """The guess index is only built once a hard mode session needs it."""
+
+    def test_lazy(self):
+        """Normal sessions don't build it, and hard mode sessions share one."""
+        with tempfile.TemporaryDirectory() as cache_dir:
+            server = HintServer(list(FIVE_LETTER_WORDS), cache_dir=cache_dir)
+            self.assertIsNone(server.tree)
+            asyncio.run(server.create_session())
+            self.assertIsNone(server.guess_index)
+            first = asyncio.run(server.create_session(options={'hard': True}))['session']
+            self.assertIsNotNone(server.guess_index)
+            second = asyncio.run(server.create_session(options={'hard': True}))['session']
+            self.assertIs(server.sessions[first].solver.guess_index,
+                          server.sessions[second].solver.guess_index)
+
+
+if __name__ == '__main__':
+    unittest.main()
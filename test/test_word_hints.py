@@ -0,0 +1,157 @@
+"""WordHints feedback handling, checked against real answers, and forking of hint states."""
+
+# Standard Imports
+import unittest
+# Third Party Imports
+# Local Imports
+from well.globals import FIVE_LETTER_WORDS
+from well.patterns import pattern_results, score_guess
+from well.word_hints import WordHints
+from well.words import remove_word_hints
+
+
+class TestWordHints(unittest.TestCase):
+    """Hints never eliminate the answer, and keep exactly the words consistent with the feedback."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Share one word list."""
+        cls.words = list(FIVE_LETTER_WORDS)
+
+    def assert_exact(self, answer: str, *guesses: str) -> None:
+        """Play guesses against answer and check the surviving candidates.
+
+        Args:
+            answer: The lowercase hidden answer.
+            guesses: Lowercase guesses, in order.
+        """
+        # LOCAL VARIABLES
+        hints = WordHints()  # Hints under test
+
+        # CHECK IT
+        for guess in guesses:
+            hints.update_word(guess, pattern_results(score_guess(guess, answer),
+                                                     length=len(answer)))
+        self.assertTrue(hints.check_word(answer))
+        self.assertEqual(list(hints.filter(self.words)),
+                         [word for word in self.words
+                          if all(score_guess(guess, word) == score_guess(guess, answer)
+                                 for guess in guesses)])
+
+    def test_grey_duplicate_letter(self):
+        """A grey copy of a letter that's green or yellow elsewhere is only excluded where it is."""
+        self.assert_exact('abide', 'speed')  # '  y y'
+        self.assert_exact('bedew', 'geese')  # ' gy  '
+        self.assert_exact('stoas', 'sassy')  # 'gyy  '
+
+    def test_yellow_solved_letter(self):
+        """A yellow copy of an already solved letter doesn't make it a must-have again."""
+        self.assert_exact('brace', 'wince', 'lames')  # '   gg' then ' y y '
+
+
+class TestSnapshot(unittest.TestCase):
+    """snapshot(), restore() and clone() fork hint states that never share updates."""
+
+    def setUp(self):
+        """Start from hints that already took some feedback."""
+        self.hints = WordHints()
+        self.play(self.hints, 'tares')
+
+    @staticmethod
+    def play(hints: WordHints, guess: str) -> None:
+        """Give hints the feedback guess gets against the hidden answer, MOIST."""
+        hints.update_word(guess, pattern_results(score_guess(guess, 'moist')))
+
+    def assert_same(self, first: WordHints, second: WordHints) -> None:
+        """Check two WordHints objects accept the same words and remember the same updates."""
+        self.assertEqual(first.signature(), second.signature())
+        self.assertEqual(first.deltas, second.deltas)
+        self.assertEqual(list(first.filter(FIVE_LETTER_WORDS)),
+                         list(second.filter(FIVE_LETTER_WORDS)))
+
+    def test_restore(self):
+        """Restoring undoes every update since the snapshot."""
+        # LOCAL VARIABLES
+        snapshot = self.hints.snapshot()  # State after the first guess
+        original = self.hints.clone()     # Same state, never updated again
+
+        # TEST IT
+        self.play(self.hints, 'pilot')
+        self.play(self.hints, 'unlit')
+        self.assertNotEqual(self.hints.signature(), original.signature())
+        self.hints.restore(snapshot)
+        self.assert_same(self.hints, original)
+        # Restored hints take new feedback just like the originals would
+        self.play(self.hints, 'pilot')
+        self.play(original, 'pilot')
+        self.assert_same(self.hints, original)
+
+    def test_restore_twice(self):
+        """A snapshot can be restored more than once."""
+        # LOCAL VARIABLES
+        snapshot = self.hints.snapshot()    # State after the first guess
+        signature = self.hints.signature()  # Signature after the first guess
+
+        # TEST IT
+        for guess in ('pilot', 'crane'):
+            with self.subTest(guess=guess):
+                self.play(self.hints, guess)
+                self.hints.restore(snapshot)
+                self.assertEqual(self.hints.signature(), signature)
+                self.assertEqual(len(self.hints.deltas), 1)
+
+    def test_clone(self):
+        """A clone and its original can be updated independently."""
+        # LOCAL VARIABLES
+        copy = self.hints.clone()  # Clone under test
+        before = list(self.hints.filter(FIVE_LETTER_WORDS))  # The original's candidates
+
+        # TEST IT
+        self.assert_same(copy, self.hints)
+        self.play(copy, 'pilot')
+        self.assertEqual(list(self.hints.filter(FIVE_LETTER_WORDS)), before)
+        self.assertEqual(len(self.hints.deltas), 1)
+        self.assertLess(len(list(copy.filter(FIVE_LETTER_WORDS))), len(before))
+        self.play(self.hints, 'crane')
+        self.assertEqual(len(copy.deltas), 2)
+        self.assertNotEqual(copy.signature(), self.hints.signature())
+        for mine, theirs in zip(self.hints.word, copy.word):
+            self.assertIsNot(mine, theirs)
+
+
+class TestFilterInput(unittest.TestCase):
+    """filter() takes words in any iterable, and validates them once, as a whole."""
+
+    def setUp(self):
+        """Start from one turn of hints."""
+        self.hints = WordHints()
+        self.hints.update_word('crane', 'g  y ')
+        self.words = ['colon', 'cynic', 'chalk', 'uncle']  # Candidates and not
+        self.expected = ['colon', 'cynic']                  # Just the candidates
+
+    def test_iterables(self):
+        """Tuples, sets, generators and dict keys all filter like the list would."""
+        for words in (tuple(self.words), iter(self.words), (word for word in self.words),
+                      dict.fromkeys(self.words)):
+            with self.subTest(words=type(words)):
+                self.assertEqual(remove_word_hints(words, self.hints), self.expected)
+        self.assertEqual(sorted(remove_word_hints(set(self.words), self.hints)), self.expected)
+
+    def test_type_error(self):
+        """Strings, non-iterables and non-string words are rejected."""
+        for words in ('clung', 5, None, ['clung', 5], (word.encode() for word in self.words)):
+            with self.subTest(words=words):
+                with self.assertRaises(TypeError):
+                    remove_word_hints(words, self.hints)
+
+    def test_value_error(self):
+        """Upper case and wrong length words are rejected, however they're passed in."""
+        for words in (['clung', 'CYNIC'], ['clung', 'cyni'], {'clung', 'cynics'},
+                      (word.upper() for word in self.words)):
+            with self.subTest(words=words):
+                with self.assertRaises(ValueError):
+                    remove_word_hints(words, self.hints)
+
+
+if __name__ == '__main__':
+    unittest.main()
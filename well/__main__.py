@@ -1,7 +1,89 @@
 """Entry point for the WERE LLAMA (WALL) Python package."""
 
+# Standard Imports
+import argparse
+import sys
+# Third Party Imports
+# Local Imports
+from well.batch import BATCH_TARGETS
+from well.batch import main as batch_main
+from well.globals import (FIVE_LETTER_WORDS, MAX_WORD_LENGTH, MIN_WORD_LENGTH, RANKING_FREQUENCY,
+                          RANKINGS, WORD_LENGTH)
+from well.instrument import PROFILES, Instrument
 from well.main import main
+from well.opening import main as opening_main
+from well.server import DEFAULT_HOST, DEFAULT_PORT
+from well.server import main as server_main
+from well.words import load_word_list
 
 
 if __name__ == '__main__':
-    main()
+    PARSER = argparse.ArgumentParser(prog='well', description='WERE LLAMA (WELL) Wordle helper')
+    PARSER.add_argument('--ranking', choices=RANKINGS, default=RANKING_FREQUENCY,
+                        help='how to rank the top guesses (default: %(default)s)')
+    PARSER.add_argument('--hard', action='store_true',
+                        help='hard mode: only suggest guesses that use every revealed hint')
+    PARSER.add_argument('--dictionary', metavar='FILE',
+                        help='play with the words, one per line, in FILE instead')
+    PARSER.add_argument('--length', type=int, default=WORD_LENGTH,
+                        choices=range(MIN_WORD_LENGTH, MAX_WORD_LENGTH + 1), metavar='N',
+                        help='letters per word in the --dictionary (default: %(default)s)')
+    PARSER.add_argument('--boards', type=int, default=1, metavar='N',
+                        help='play N boards with every guess, e.g. 4 for Quordle or 8 for '
+                        'Octordle (default: %(default)s)')
+    PARSER.add_argument('--batch', choices=BATCH_TARGETS,
+                        help='solve every answer headlessly and report how it went')
+    PARSER.add_argument('--processes', type=int,
+                        help='batch worker processes (default: one per CPU)')
+    PARSER.add_argument('--limit', type=int, help='play at most this many batch games')
+    PARSER.add_argument('--no-cache', dest='cache', action='store_false',
+                        help="don't share candidates and rankings between batch games")
+    PARSER.add_argument('--instrument', metavar='FILE',
+                        help='append per-turn stage timings to FILE as JSON lines')
+    PARSER.add_argument('--profile', choices=PROFILES,
+                        help='also capture a profile of each turn (requires --instrument)')
+    PARSER.add_argument('--serve', action='store_true',
+                        help='serve suggestions to many players over HTTP/JSON')
+    PARSER.add_argument('--host', default=DEFAULT_HOST,
+                        help='interface to serve on (default: %(default)s)')
+    PARSER.add_argument('--port', type=int, default=DEFAULT_PORT,
+                        help='port to serve on (default: %(default)s)')
+    PARSER.add_argument('--build-tree', action='store_true',
+                        help='precompute the first two turns for every mode and exit')
+    PARSER.add_argument('--opener', help='the first guess to build the tree for '
+                        '(default: the top ranked one)')
+    ARGS = PARSER.parse_args()
+    if ARGS.profile and not ARGS.instrument:
+        PARSER.error('--profile requires --instrument')
+    if ARGS.length != WORD_LENGTH and not ARGS.dictionary:
+        PARSER.error('--length requires --dictionary')
+    if ARGS.boards < 1:
+        PARSER.error('--boards must be at least 1')
+    if ARGS.hard and ARGS.boards > 1:
+        PARSER.error('--hard only supports a single board')
+    MODE = '--build-tree' if ARGS.build_tree else '--batch' if ARGS.batch \
+        else '--serve' if ARGS.serve else ''
+    if MODE and ARGS.dictionary:
+        PARSER.error(f'{MODE} only supports the default dictionary')
+    if MODE and ARGS.boards > 1:
+        PARSER.error(f'{MODE} only supports a single board')
+    if ARGS.hard and ARGS.serve:
+        PARSER.error('--serve clients choose hard mode per session')
+    try:
+        DICTIONARY = load_word_list(ARGS.dictionary, length=ARGS.length) if ARGS.dictionary \
+            else FIVE_LETTER_WORDS
+    except OSError as err:
+        PARSER.error(f'unable to read --dictionary: {err}')
+    if ARGS.build_tree:
+        sys.exit(opening_main(ranking=ARGS.ranking, opener=ARGS.opener))
+    if ARGS.batch:
+        sys.exit(batch_main(target=ARGS.batch, ranking=ARGS.ranking, processes=ARGS.processes,
+                            limit=ARGS.limit, cache=ARGS.cache, hard=ARGS.hard))
+    if ARGS.serve:
+        sys.exit(server_main(ranking=ARGS.ranking, host=ARGS.host, port=ARGS.port))
+    if ARGS.instrument:
+        with open(ARGS.instrument, 'a', encoding='utf-8') as OUT_FILE:
+            sys.exit(main(ranking=ARGS.ranking,
+                          instrument=Instrument(OUT_FILE, profile=ARGS.profile),
+                          hard=ARGS.hard, dictionary=DICTIONARY, boards=ARGS.boards))
+    main(ranking=ARGS.ranking, hard=ARGS.hard, dictionary=DICTIONARY, boards=ARGS.boards)
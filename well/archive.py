@@ -1,86 +1,521 @@
 """Functionality to retrieve and parse past Wordle answers."""
 
 # Standard Imports
-from typing import List
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from html.parser import HTMLParser
+from typing import Any, Callable, Dict, Final, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+import codecs
+import hashlib
+import json
+import os
+import tempfile
+import time
 # Third Party Imports
-from bs4 import BeautifulSoup
 import requests
 # Local Imports
-from well.globals import ARCHIVE_NEEDLE, ARCHIVE_URL
+from well.globals import (ARCHIVE_CACHE_TTL, ARCHIVE_FIRST, ARCHIVE_MERGES, ARCHIVE_NEEDLE,
+                          ARCHIVE_TIMEOUT, ARCHIVE_URL, CACHE_DIR, WORD_LENGTH)
 
 
-def get_past_answers(archive_url: str = ARCHIVE_URL) -> List[str]:
-    """Retrieve past Wordle answers.
+CHUNK_SIZE = 8192  # Bytes read from the response at a time
+POOL_SIZE = 8      # Connections kept alive per host by the shared session
+SYNC_OVERLAP = 3   # Known answers, in order, that must follow the new ones to stop a sync early
+VOID_TAGS = frozenset(['area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input', 'link', 'meta',
+                       'param', 'source', 'track', 'wbr'])  # Tags that never have an end tag
+
+
+class ArchiveSource(NamedTuple):
+    """A page that lists past Wordle answers, and where on the page to find them.
+
+    Attributes:
+        url: The page.
+        tag: The tag type holding needle (e.g., h2).
+        needle: The text of the tag the list of answers follows.
+    """
+
+    url: str
+    tag: str = 'h2'
+    needle: str = ARCHIVE_NEEDLE
+
+
+ARCHIVE_SOURCES: Final[Tuple[ArchiveSource, ...]] = (ArchiveSource(ARCHIVE_URL),)
+
+
+# pylint: disable=too-many-instance-attributes
+# Calm down, Pylint.  It's fine...
+class ListParser(HTMLParser):
+    """Incremental parser for the list that follows <tag>needle</tag>.
+
+    Mirrors what BeautifulSoup's html.parser tree builder finds with soup.find(tag, string=needle),
+    find_next_sibling(['ul', 'ol']) and find_all('li'), but stops as soon as that list closes.
+    Check done after every feed() and stop feeding once it's True.
+
+    Given the answers it already knows, from a page known to list the newest first, it also
+    stops as soon as the list reaches them: once SYNC_OVERLAP of them (or all, if fewer are known)
+    follow in order, starting with the newest.  synced is then the number of new items that came
+    before them.  The page is parsed in full instead if a known answer turns up anywhere else, or
+    if no new items came first (e.g., the page changed further down, or is no longer newest
+    first).
+    """
+
+    def __init__(self, tag: str, needle: str = ARCHIVE_NEEDLE, known: Sequence[str] = ()):
+        """ListParser() ctor."""
+        super().__init__()
+        self.known = known          # Answers already known, newest first
+        self.synced = -1            # New item count, once the list reached known, otherwise -1
+        self.tag = tag              # Tag holding the needle
+        self.needle = needle        # Text of the tag holding the needle
+        self.found_target = False   # Found <tag>needle</tag>
+        self.found_list = False     # Found the list after <tag>needle</tag>
+        self.done = False           # Finished with the list
+        self.items = []             # Text of every list item
+        self._stack = []            # [tag, child count, last child was text] for each open tag
+        self._target_depth = -1     # Stack depth of a <tag> candidate, -1 if outside of one
+        self._target_text = ''      # Text of the <tag> candidate
+        self._simple = True         # The <tag> candidate's .string isn't None
+        self._sibling_depth = -1    # Stack depth of <tag>needle</tag>'s siblings
+        self._list_depth = -1       # Stack depth of the list
+        self._open_items = []       # Indices of the items that are still open
+        self._matched = 0           # Consecutive closed items that matched known, in order
+        self._lookup = set(known)   # Answers already known, for lookups
+        self._ordered = True        # The list still looks like new items ahead of known
+
+    def handle_starttag(self, tag, attrs):
+        """Open a tag."""
+        if self.done:
+            return
+        self._add_child(text=False)
+        if tag in VOID_TAGS:
+            return  # Never opened, so never closed
+        self._stack.append([tag, 0, False])
+        if self._target_depth < 0 and not self.found_target and tag == self.tag:
+            self._target_depth = len(self._stack)
+            self._target_text = ''
+            self._simple = True
+        elif self.found_target and not self.found_list and len(self._stack) == \
+                self._sibling_depth + 1 and tag in ('ul', 'ol'):
+            self.found_list = True
+            self._list_depth = len(self._stack)
+        elif self._list_depth > 0 and tag == 'li':
+            self._open_items.append(len(self.items))
+            self.items.append('')
+
+    def handle_endtag(self, tag):
+        """Close a tag, and any tags left open inside of it."""
+        if self.done:
+            return
+        for depth in range(len(self._stack), 0, -1):
+            if self._stack[depth - 1][0] == tag:
+                while len(self._stack) >= depth:
+                    self._close_top()
+                break
+
+    def handle_data(self, data):
+        """Collect text."""
+        if self.done:
+            return
+        self._add_child(text=True)
+        if self._target_depth > 0:
+            self._target_text += data
+        for index in self._open_items:
+            self.items[index] += data
+
+    def _add_child(self, text: bool) -> None:
+        """Count a child of the innermost open tag, like BeautifulSoup's .string does."""
+        if self._stack and self._target_depth > 0:
+            if not text or not self._stack[-1][2]:  # Adjacent text is one child
+                self._stack[-1][1] += 1
+                self._simple = self._simple and self._stack[-1][1] <= 1
+            self._stack[-1][2] = text
+
+    def _close_top(self) -> None:
+        """Close the innermost open tag."""
+        # LOCAL VARIABLES
+        depth = len(self._stack)      # Depth of the tag being closed
+        name = self._stack.pop()[0]   # Name of the tag being closed
+
+        # CLOSE IT
+        if depth == self._target_depth:
+            self._target_depth = -1
+            if self._simple and self._target_text == self.needle:
+                self.found_target = True
+                self._sibling_depth = depth - 1
+        elif depth == self._list_depth:
+            self.done = True
+        elif name == 'li' and self._list_depth > 0 and self._open_items:
+            self._match_known(self._open_items.pop())
+        elif self.found_target and not self.found_list and depth == self._sibling_depth:
+            self.done = True  # The parent closed without a list
+
+    def _match_known(self, index: int) -> None:
+        """Check a closed item against the known answers, and stop once enough follow in order."""
+        # LOCAL VARIABLES
+        item = self.items[index].strip().upper()  # Closed item
+
+        # MATCH IT
+        if not self.known or not self._ordered:
+            return
+        if item == self.known[self._matched]:
+            self._matched += 1
+        elif self._matched or item in self._lookup:
+            self._ordered = False  # A known answer out of place, so parse it all
+            return
+        if self._matched == min(SYNC_OVERLAP, len(self.known)):
+            if index + 1 == self._matched:
+                self._ordered = False  # Nothing new up front, so the change is somewhere else
+            else:
+                self.synced = index + 1 - self._matched
+                self.done = True
+
+
+def get_past_answers(sources: Sequence[ArchiveSource] = ARCHIVE_SOURCES,
+                     cache_dir: Optional[str] = CACHE_DIR, ttl: int = ARCHIVE_CACHE_TTL,
+                     merge: str = ARCHIVE_FIRST, timeout: float = ARCHIVE_TIMEOUT) -> List[str]:
+    """Retrieve past Wordle answers from every source at once.
+
+    Every source is fetched (see: get_source_answers()) on its own thread, through one pooled
+    session.  With ARCHIVE_FIRST, the first source to return valid answers wins, so startup only
+    waits on the fastest healthy source.  The rest finish, and refresh their caches, in the
+    background, quietly.  With ARCHIVE_UNION, every source is waited on and the answers of those
+    that succeed are merged, in source order, without duplicates.  Fetch threads never print:
+    problems are only reported, from the calling thread, for the sources that were waited on.
 
     Args:
-        archive_url: Optional; The URL to retrieve the answers from.
+        sources: Optional; The pages to retrieve the answers from.
+        cache_dir: Optional; The directory to cache answers in.  None disables the cache.
+        ttl: Optional; Seconds a cached copy is considered fresh.
+        merge: Optional; How to combine the sources: one of ARCHIVE_MERGES.
+        timeout: Optional; Seconds to wait on each server to connect, or to send more data.
 
     Returns:
         List of five letter strings on success.
+
+    Raises:
+        ValueError: No sources, or an unknown merge.
+        RuntimeError: Every source failed and the first source's answers could not be parsed.
+        requests.exceptions.RequestException: Every source failed and the first source's fetch
+            failed.
     """
     # LOCAL VARIABLES
-    words = _get_all_items(url=archive_url, tag='h2')  # All of the li tag strings
-    word_list = []                                     # List of Wordle-compliant words
+    executor = None                   # One thread per source
+    futures = {}                      # Future to the index of its source
+    results = {}                      # Source index to its answers, for every success
+    errors = {}                       # Source index to its exception, for every failure
+    warnings = [[] for _ in sources]  # Source index to its warnings, collected off this thread
+    index = 0                         # Index of the source a future fetched
 
-    # PARSE IT
-    for word in words:
-        if 5 != len(word):
-            raise RuntimeError(f'Found a non-Wordle word: {word}')
-        word_list.append(word)
+    # INPUT VALIDATION
+    if not sources:
+        raise ValueError('No archive sources')
+    if merge not in ARCHIVE_MERGES:
+        raise ValueError(f'Unknown merge: {merge}')
+
+    # GET THEM
+    executor = ThreadPoolExecutor(max_workers=len(sources), thread_name_prefix='archive')
+    try:
+        futures = {executor.submit(get_source_answers, source, cache_dir, ttl, timeout,
+                                   warnings[index].append): index
+                   for index, source in enumerate(sources)}
+        for future in as_completed(futures):
+            index = futures[future]
+            try:
+                results[index] = future.result()
+            except (requests.exceptions.RequestException, RuntimeError) as err:
+                errors[index] = err
+                warnings[index].append(f'Failed to fetch URL "{sources[index].url}" with '
+                                       f'"{repr(err)}"')
+            for warning in warnings[index]:
+                print(warning)
+            if merge == ARCHIVE_FIRST and index in results:
+                return results[index]
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)  # Don't wait on the stragglers
+
+    # DONE
+    if not results:
+        raise errors[min(errors)]
+    return list(dict.fromkeys(answer for index in sorted(results) for answer in results[index]))
+
+
+def get_new_answers(known: Iterable[str], **kwargs) -> List[str]:
+    """Retrieve the past Wordle answers that aren't in known.
+
+    Meant for keeping an available list current without rebuilding it (e.g.,
+    remove_words(available, get_new_answers(archive), in_place=True)).
+
+    Args:
+        known: Answers the caller already has, in any case.
+        kwargs: Optional; Passed on to get_past_answers().
+
+    Returns:
+        List of five letter strings, in source order.
+
+    Raises:
+        See: get_past_answers().
+    """
+    # LOCAL VARIABLES
+    known = {answer.upper() for answer in known}  # Answers to skip, upper case like the archive
+
+    # DONE
+    return [answer for answer in get_past_answers(**kwargs) if answer not in known]
+
+
+def get_source_answers(source: ArchiveSource, cache_dir: Optional[str] = CACHE_DIR,
+                       ttl: int = ARCHIVE_CACHE_TTL, timeout: float = ARCHIVE_TIMEOUT,
+                       warn: Callable[[str], None] = print) -> List[str]:
+    """Retrieve past Wordle answers from one source.
+
+    Parsed answers are cached in cache_dir.  A cached copy younger than ttl is returned without
+    touching the network.  An older copy is revalidated with ETag/If-Modified-Since, and is still
+    returned if the revalidation fails.  Once a full parse has shown that the page adds new answers
+    ahead of the old ones, a changed page is only parsed until it reaches the cached answers (see:
+    parse_chunks()), so a sync costs as much as the answers published since the last one.  The
+    cache records every known answer, when the last sync happened, and whether the page has been
+    shown to list the newest first.
+
+    Args:
+        source: The page to retrieve the answers from.
+        cache_dir: Optional; The directory to cache answers in.  None disables the cache.
+        ttl: Optional; Seconds a cached copy is considered fresh.
+        timeout: Optional; Seconds to wait on the server to connect, or to send more data.
+        warn: Optional; Reports problems that didn't stop the answers from being returned (e.g.,
+            falling back on a cached copy).
+
+    Returns:
+        List of five letter strings on success.
+
+    Raises:
+        RuntimeError: The answers could not be parsed and there is no cached copy.
+        requests.exceptions.RequestException: The fetch failed and there is no cached copy.
+    """
+    # LOCAL VARIABLES
+    archive_url = source.url  # The URL to retrieve the answers from
+    cache_file = None         # Cache filename for archive_url
+    cache = None              # Cached copy of the answers
+    headers = {}              # Conditional request headers
+    response = None           # Response from archive_url
+    word_list = []            # List of Wordle-compliant words
+    known = ()                # Cached answers to sync against
+
+    # CHECK THE CACHE
+    if cache_dir is not None:
+        cache_file = _get_cache_file(cache_dir=cache_dir, url=archive_url)
+        cache = _read_cache(cache_file=cache_file, url=archive_url)
+    if cache:
+        if time.time() - cache['fetched'] < ttl:
+            return cache['answers']
+        if cache.get('etag'):
+            headers['If-None-Match'] = cache['etag']
+        if cache.get('last_modified'):
+            headers['If-Modified-Since'] = cache['last_modified']
+        if cache.get('newest_first'):
+            known = cache['answers']
+
+    # GET IT
+    try:
+        response = _get_response(url=archive_url, headers=headers, stream=True,
+                                 timeout=timeout)
+        with response:
+            if cache and response.status_code == requests.codes.not_modified:
+                word_list = cache['answers']
+            else:
+                word_list = _parse_answers(parse_chunks(chunks=_iter_text(response),
+                                                        url=archive_url, tag=source.tag,
+                                                        needle=source.needle,
+                                                        known=known))
+    except (requests.exceptions.RequestException, RuntimeError) as err:
+        if not cache:
+            raise
+        warn(f'Using the cached answers for URL "{archive_url}" after "{repr(err)}"')
+        return cache['answers']
+
+    # CACHE IT
+    if cache_file:
+        cache = cache or {}  # A 304 may not repeat the validators
+        _write_cache(cache_file=cache_file, warn=warn, cache={
+            'url': archive_url, 'fetched': time.time(), 'answers': word_list,
+            'newest_first': _is_newest_first(word_list=word_list, cache=cache),
+            'etag': response.headers.get('ETag', cache.get('etag')),
+            'last_modified': response.headers.get('Last-Modified', cache.get('last_modified'))})
 
     # DONE
     return word_list
 
 
-def _get_all_items(url: str, tag: str, needle: str = ARCHIVE_NEEDLE) -> List[str]:
-    """Get all the li tags from the tag type with the needle text.
+def parse_chunks(chunks: Iterable[str], url: str, tag: str, needle: str = ARCHIVE_NEEDLE,
+                 known: Sequence[str] = ()) -> List[str]:
+    """Parse all the li tags from the tag type with the needle text, out of chunks of HTML.
+
+    Stops consuming chunks as soon as the list closes, or new items reach the known answers.
+
+    Args:
+        chunks: The HTML.
+        url: Where the HTML came from, for error messages.
+        tag: The tag type holding needle (e.g., h2).
+        needle: Optional; The text of the tag the list follows.
+        known: Optional; Upper case answers from an earlier parse of a page that lists the
+            newest first, in document order.  If the page still starts with new items followed by
+            known, only those new items are parsed and known stands in for the rest.  Otherwise
+            the page is parsed in full (see: ListParser).
 
     Returns:
-        A list of upper case words parsed from <tag>needle</tag> found at URL url on success.
+        A list of upper case words parsed from <tag>needle</tag> found in chunks on success.
 
     Raises:
         RuntimeError: The parser stubbed its toe.
     """
     # LOCAL VARIABLES
-    raw_html = _get_raw_html(url=url)              # Raw HTML read from url
-    soup = BeautifulSoup(raw_html, 'html.parser')  # Soup object
-    target = soup.find(tag, string=needle)         # Target tag
-    list_container = None                          # Container with all the items
-    list_items = None                              # All the items
+    parser = ListParser(tag=tag, needle=needle, known=known)  # Incremental parser
 
-    # GET IT
-    if target:
-        list_container = target.find_next_sibling(['ul', 'ol'])
+    # PARSE IT
+    for chunk in chunks:
+        parser.feed(chunk)
+        if parser.done:
+            break
     else:
-        raise RuntimeError(f'Unable to find tag "{tag}" / needle "{needle}" in URL "{url}"')
+        parser.close()
 
-    if list_container:
-        list_items = list_container.find_all('li')
-    else:
+    # DONE
+    if not parser.found_target:
+        raise RuntimeError(f'Unable to find tag "{tag}" / needle "{needle}" in URL "{url}"')
+    if not parser.found_list:
         raise RuntimeError(f'No list found after the "{tag}" tag in URL "{url}"')
-
-    if list_items:
-        list_items = [item.text.strip().upper() for item in list_items]
-    else:
+    if not parser.items:
         raise RuntimeError(f'No items found in the "{tag}" tag list for URL "{url}"?!')
+    if parser.synced >= 0:
+        return [item.strip().upper() for item in parser.items[:parser.synced]] + list(known)
+    return [item.strip().upper() for item in parser.items]
+
+
+def _get_cache_file(cache_dir: str, url: str) -> str:
+    """Name the cache file for URL url."""
+    return os.path.join(cache_dir, f'archive-{hashlib.sha256(url.encode()).hexdigest()[:16]}.json')
+
+
+def _get_response(url: str, headers: Optional[Dict[str, str]] = None, stream: bool = False,
+                  timeout: float = ARCHIVE_TIMEOUT) -> requests.Response:
+    """Request URL url through the shared session.
+
+    Args:
+        url: The URL to request.
+        headers: Optional; Extra request headers.
+        stream: Optional; If True, the body is left to be read (and the response closed) later.
+        timeout: Optional; Seconds to wait on the server to connect, or to send more data.
+
+    Raises:
+        requests.exceptions.RequestException: The request failed or returned a bad status.
+    """
+    # LOCAL VARIABLES
+    response = _get_session().get(url, headers=headers, stream=stream,
+                                  timeout=timeout)  # Response from url
 
     # DONE
-    return list_items
+    response.raise_for_status()  # Bad status?
+    return response
 
 
-def _get_raw_html(url: str) -> str:
-    """Read the raw HTML from URL."""
+@lru_cache(maxsize=None)
+def _get_session() -> requests.Session:
+    """Build the session shared by every fetch, so connections are pooled and kept alive."""
     # LOCAL VARIABLES
-    raw_html = None  # Raw HTML read from url
+    session = requests.Session()  # Shared session
+    adapter = requests.adapters.HTTPAdapter(pool_connections=POOL_SIZE,
+                                            pool_maxsize=POOL_SIZE)  # Connection pool
 
-    # GET IT
+    # DONE
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
+def _is_newest_first(word_list: List[str], cache: Dict[str, Any]) -> bool:
+    """Check whether a page has been shown to list the newest answers first.
+
+    Args:
+        word_list: The answers just parsed from the page.
+        cache: The cached copy they replace, empty if there was none.
+
+    Returns:
+        True if word_list is new answers followed by the cached ones.  If nothing changed,
+        whatever the cache already knew.  False without a cache.
+    """
+    # LOCAL VARIABLES
+    old = cache.get('answers', [])  # Answers from the last sync
+
+    # DONE
+    if not old:
+        return False  # Nothing to compare with
+    if word_list == old:
+        return bool(cache.get('newest_first'))  # Nothing new, so nothing learned
+    return len(word_list) > len(old) and word_list[len(word_list) - len(old):] == old
+
+
+def _iter_text(response: requests.Response) -> Iterable[str]:
+    """Lazily decode a streamed response body, CHUNK_SIZE bytes at a time."""
+    # LOCAL VARIABLES
+    decoder = codecs.getincrementaldecoder(response.encoding or 'utf-8')(errors='replace')
+
+    # DECODE IT
+    for chunk in response.iter_content(chunk_size=CHUNK_SIZE):
+        yield decoder.decode(chunk)
+    yield decoder.decode(b'', final=True)
+
+
+def _parse_answers(words: List[str]) -> List[str]:
+    """Verify every word is Wordle-compliant.
+
+    Raises:
+        RuntimeError: Found a non-Wordle word.
+    """
+    # LOCAL VARIABLES
+    word_list = []  # List of Wordle-compliant words
+
+    # PARSE IT
+    for word in words:
+        if WORD_LENGTH != len(word):
+            raise RuntimeError(f'Found a non-Wordle word: {word}')
+        word_list.append(word)
+
+    # DONE
+    return word_list
+
+
+def _read_cache(cache_file: str, url: str) -> Optional[Dict[str, Any]]:
+    """Read the cached answers for URL url, if there are any."""
+    # LOCAL VARIABLES
+    cache = None  # Cached copy of the answers
+
+    # READ IT
     try:
-        response = requests.get(url)
-        response.raise_for_status()  # Bad status?
-        raw_html = response.text
-    except requests.exceptions.RequestException as err:
-        print(f'Failed to fetch URL "{url}" with "{repr(err)}"')
-        raise err from err
+        with open(cache_file, 'r', encoding='utf-8') as in_file:
+            cache = json.load(in_file)
+    except (OSError, ValueError):
+        cache = None  # Missing or corrupt, either way there's no cache
+    if not isinstance(cache, dict) or cache.get('url') != url \
+            or not isinstance(cache.get('answers'), list) \
+            or not isinstance(cache.get('fetched'), (int, float)):
+        cache = None
 
     # DONE
-    return raw_html
+    return cache
+
+
+def _write_cache(cache_file: str, cache: Dict[str, Any],
+                 warn: Callable[[str], None] = print) -> None:
+    """Atomically write the cache to cache_file.  Failures are reported to warn, not raised."""
+    # LOCAL VARIABLES
+    temp_fd = None  # File descriptor of the work-in-progress file
+    temp_name = ''  # Filename of the work-in-progress file
+
+    # WRITE IT
+    try:
+        os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+        temp_fd, temp_name = tempfile.mkstemp(dir=os.path.dirname(cache_file), suffix='.tmp')
+        with os.fdopen(temp_fd, 'w', encoding='utf-8') as out_file:
+            json.dump(cache, out_file)
+        os.replace(temp_name, cache_file)
+    except OSError as err:
+        warn(f'Unable to cache the answers in "{cache_file}" with "{repr(err)}"')
+        if temp_name and os.path.exists(temp_name):
+            os.remove(temp_name)
@@ -0,0 +1,212 @@
+"""Headless batch solver: play full games against known answers across a process pool."""
+
+# Standard Imports
+from collections import Counter
+from typing import Dict, Final, List, NamedTuple, Optional, Tuple
+import multiprocessing
+import time
+# Third Party Imports
+# Local Imports
+from well.archive import get_past_answers
+from well.cache import LRUCache
+from well.globals import FIVE_LETTER_WORDS, RANKING_ENTROPY, RANKING_FREQUENCY
+from well.opening import OpeningTree, load_opening_tree
+from well.patterns import pattern_results, score_guess
+from well.solver import Solver
+from well.vectorized import HAVE_NUMPY
+from well.word_index import WordIndex
+
+
+BATCH_ARCHIVE: Final[str] = 'archive'        # Play every past Wordle answer
+BATCH_DICTIONARY: Final[str] = 'dictionary'  # Play every dictionary word
+BATCH_TARGETS: Final[List[str]] = [BATCH_ARCHIVE, BATCH_DICTIONARY]
+MAX_TURNS: Final[int] = 6    # Wordle's guess limit; games that need more count as failures
+TURN_LIMIT: Final[int] = 20  # Give up on a game after this many guesses
+
+_WORKER: Dict[str, object] = {}  # Per-process state, built once by _init_worker()
+
+
+class BatchReport(NamedTuple):
+    """Results of a batch of games.
+
+    Attributes:
+        games: Number of games played.
+        distribution: Number of games solved in each number of guesses, including those solved
+            after MAX_TURNS.
+        failures: Answers that weren't solved within MAX_TURNS.
+        seconds: Wall time spent playing.
+    """
+
+    games: int
+    distribution: Dict[int, int]
+    failures: List[str]
+    seconds: float
+
+    @property
+    def games_per_second(self) -> float:
+        """Throughput."""
+        return self.games / self.seconds if self.seconds else 0.0
+
+    @property
+    def mean_guesses(self) -> float:
+        """Average number of guesses per solved game."""
+        # LOCAL VARIABLES
+        solved = sum(self.distribution.values())  # Number of solved games
+
+        # DONE
+        return sum(turns * count for turns, count in self.distribution.items()) / solved \
+            if solved else 0.0
+
+    def summary(self) -> str:
+        """Format this report for humans."""
+        # LOCAL VARIABLES
+        lines = [f'GAMES: {self.games} in {self.seconds:.2f}s '
+                 f'({self.games_per_second:.1f} games/s)']  # Report lines
+
+        # FORMAT IT
+        for turns in sorted(self.distribution):
+            lines.append(f'{turns:>3} guesses: {self.distribution[turns]}')
+        lines.append(f'MEAN GUESSES: {self.mean_guesses:.3f}')
+        lines.append(f'FAILURES ({len(self.failures)}): {", ".join(sorted(self.failures)[:20])}')
+
+        # DONE
+        return '\n'.join(lines)
+
+
+# pylint: disable=too-many-arguments,too-many-positional-arguments
+# Calm down, Pylint.  It's fine...
+def play_game(answer: str, word_index: WordIndex, ranking: str = RANKING_FREQUENCY,
+              cache: LRUCache = None, tree: OpeningTree = None,
+              guess_index: WordIndex = None) -> int:
+    """Play one game against answer, always guessing the top ranked word.
+
+    Args:
+        answer: The lowercase hidden answer.
+        word_index: WordIndex of the possible answers.
+        ranking: Optional; How to rank guesses: one of RANKINGS.
+        cache: Optional; An LRUCache shared by every game played with word_index.
+        tree: Optional; An OpeningTree loaded for word_index (see: load_opening_tree()).
+        guess_index: Optional; A WordIndex of the guesses, to play in hard mode.
+
+    Returns:
+        The number of guesses it took, or 0 if the answer was eliminated or TURN_LIMIT was hit.
+    """
+    # LOCAL VARIABLES
+    solver = Solver([], ranking=ranking, word_index=word_index, cache=cache, tree=tree,
+                    hard=guess_index is not None, guess_index=guess_index)  # Game state
+    guess = ''                                              # Current guess
+    results = ''                                            # Feedback for guess
+
+    # PLAY IT
+    for turn in range(1, TURN_LIMIT + 1):
+        guess = next(iter(solver.rank()), None) or next(iter(solver.available_list), None)
+        if guess is None:
+            break  # Eliminated the answer
+        if guess == answer:
+            return turn
+        results = pattern_results(score_guess(guess, answer), length=len(answer))
+        solver.update(guess, results)
+
+    # DONE
+    return 0
+
+
+def run_batch(answers: List[str], available: Optional[List[str]] = None,
+              ranking: str = RANKING_FREQUENCY, processes: Optional[int] = None,
+              chunksize: int = 16, cache: bool = True, hard: bool = False) -> BatchReport:
+    """Play a game against every answer.
+
+    Args:
+        answers: The lowercase hidden answers.
+        available: Optional; The possible answers.  Defaults to FIVE_LETTER_WORDS.
+        ranking: Optional; How to rank guesses: one of RANKINGS.
+        processes: Optional; Worker processes.  Defaults to one per CPU, and 1 plays every game
+            in this process.
+        chunksize: Optional; Games handed to a worker at a time.
+        cache: Optional; If True, each process shares an LRUCache between its games.  Either way,
+            an OpeningTree for available is used if one has been built.
+        hard: Optional; If True, every guess uses every revealed hint.
+
+    Returns:
+        A BatchReport.
+    """
+    # LOCAL VARIABLES
+    start = time.perf_counter()  # Start time
+    results = []                 # (answer, guesses) for every game
+    distribution = Counter()     # Guess count histogram
+    failures = []                # Answers that weren't solved in time
+
+    # PLAY THEM
+    if available is None:
+        available = list(FIVE_LETTER_WORDS)
+    if processes == 1:
+        _init_worker(available, ranking, cache, hard)
+        results = [_play(answer) for answer in answers]
+    else:
+        with multiprocessing.Pool(processes, initializer=_init_worker,
+                                  initargs=(available, ranking, cache, hard)) as pool:
+            results = list(pool.imap_unordered(_play, answers, chunksize=chunksize))
+
+    # TALLY THEM
+    for answer, turns in results:
+        if turns:
+            distribution[turns] += 1
+        if not turns or turns > MAX_TURNS:
+            failures.append(answer)
+
+    # DONE
+    return BatchReport(games=len(results), distribution=dict(distribution), failures=failures,
+                       seconds=time.perf_counter() - start)
+
+
+def _init_worker(available: List[str], ranking: str, cache: bool, hard: bool) -> None:
+    """Build the per-process state shared by every game this process plays."""
+    _WORKER['word_index'] = WordIndex(available)
+    _WORKER['guess_index'] = None
+    if hard:
+        _WORKER['guess_index'] = WordIndex(list(FIVE_LETTER_WORDS))
+    _WORKER['ranking'] = ranking
+    _WORKER['cache'] = LRUCache() if cache else None
+    _WORKER['tree'] = load_opening_tree(_WORKER['word_index'], ranking=ranking)
+
+
+def _play(answer: str) -> Tuple[str, int]:
+    """Play one game with the per-process state."""
+    return (answer, play_game(answer, word_index=_WORKER['word_index'],
+                              ranking=_WORKER['ranking'], cache=_WORKER['cache'],
+                              tree=_WORKER['tree'], guess_index=_WORKER['guess_index']))
+
+
+def main(target: str = BATCH_ARCHIVE, ranking: str = RANKING_FREQUENCY,
+         processes: Optional[int] = None, limit: Optional[int] = None, cache: bool = True,
+         hard: bool = False) -> int:
+    """Play a batch of games and print the report.
+
+    Args:
+        target: Optional; Which answers to play: BATCH_ARCHIVE or BATCH_DICTIONARY.
+        ranking: Optional; How to rank guesses: one of RANKINGS.
+        processes: Optional; Worker processes.  Defaults to one per CPU.
+        limit: Optional; Play at most this many games.
+        cache: Optional; If True, games share candidates and rankings for repeated hint states.
+        hard: Optional; If True, play in hard mode.
+    """
+    # LOCAL VARIABLES
+    answers = []   # Hidden answers to play against
+    report = None  # Results of the batch
+
+    # INPUT VALIDATION
+    if ranking == RANKING_ENTROPY and not HAVE_NUMPY:
+        print('The entropy ranking requires NumPy.\nExiting.\n')
+        return 1
+
+    # DO IT
+    if target == BATCH_ARCHIVE:
+        answers = [word.lower() for word in get_past_answers()]
+    else:
+        answers = list(FIVE_LETTER_WORDS)
+    report = run_batch(answers[:limit], ranking=ranking, processes=processes, cache=cache,
+                       hard=hard)
+    print(report.summary())
+
+    # DONE
+    return 0
@@ -0,0 +1,131 @@
+"""Defines the LRUCache class: a bounded, thread-safe memo for repeated hint states."""
+
+# Standard Imports
+from collections import OrderedDict
+from typing import Any, Callable, Final, Hashable, NamedTuple
+import sys
+import threading
+# Third Party Imports
+# Local Imports
+
+
+CACHE_MAX_ENTRIES: Final[int] = 16_384        # Default entry limit
+CACHE_MAX_BYTES: Final[int] = 64 * 1024 ** 2  # Default (approximate) memory limit
+
+
+class CacheStats(NamedTuple):
+    """A point-in-time view of an LRUCache's counters."""
+
+    hits: int       # Lookups that found an entry
+    misses: int     # Lookups that didn't
+    evictions: int  # Entries dropped to honor the limits
+    entries: int    # Entries held
+    size: int       # Approximate bytes held
+
+
+# pylint: disable=too-many-instance-attributes
+# Calm down, Pylint.  It's fine...
+class LRUCache():
+    """Map hashable keys (e.g., WordHints.signature()) to values, dropping the least recently used.
+
+    Bounded by both an entry count and an approximate byte count, where each value's size comes
+    from sizeof.  Cached values are shared by every caller, so treat them as read-only.  Safe to
+    share between threads (e.g., a server's executor).
+    """
+
+    def __init__(self, max_entries: int = CACHE_MAX_ENTRIES, max_bytes: int = CACHE_MAX_BYTES,
+                 sizeof: Callable[[Any], int] = None):
+        """LRUCache() ctor.
+
+        Args:
+            max_entries: Optional; Most entries held at once.
+            max_bytes: Optional; Most (approximate) bytes held at once.
+            sizeof: Optional; Estimates the bytes held by a value.  Defaults to shallow_sizeof().
+        """
+        self.max_entries = max_entries          # Entry limit
+        self.max_bytes = max_bytes              # Memory limit
+        self.sizeof = sizeof or shallow_sizeof  # Value size estimator
+        self.hits = 0                           # Lookups that found an entry
+        self.misses = 0                         # Lookups that didn't
+        self.evictions = 0                      # Entries dropped to honor the limits
+        self.size = 0                           # Approximate bytes held
+        self._entries = OrderedDict()           # Key to (value, size), least recently used first
+        self._lock = threading.Lock()           # Guards everything above
+
+    def __contains__(self, key: Hashable) -> bool:
+        """Determine if key is cached, without counting a hit or a miss."""
+        with self._lock:
+            return key in self._entries
+
+    def __len__(self) -> int:
+        """Number of entries held."""
+        return len(self._entries)
+
+    def clear(self) -> None:
+        """Drop every entry and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.evictions = self.size = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Look up key, marking it as the most recently used, or return default."""
+        # LOCAL VARIABLES
+        entry = None  # (value, size)
+
+        # LOOK IT UP
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self.hits += 1
+
+        # DONE
+        return entry[0]
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Cache value under key, then evict until back under both limits.
+
+        A value larger than max_bytes on its own isn't cached.
+        """
+        # LOCAL VARIABLES
+        size = self.sizeof(value)  # Approximate bytes held by value
+
+        # CACHE IT
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self.size -= self._entries.pop(key)[1]
+            self._entries[key] = (value, size)
+            self.size += size
+            while len(self._entries) > self.max_entries or self.size > self.max_bytes:
+                self.size -= self._entries.popitem(last=False)[1][1]
+                self.evictions += 1
+
+    def stats(self) -> CacheStats:
+        """Capture the counters."""
+        with self._lock:
+            return CacheStats(hits=self.hits, misses=self.misses, evictions=self.evictions,
+                              entries=len(self._entries), size=self.size)
+
+
+def shallow_sizeof(value: Any) -> int:
+    """Estimate the bytes held by value and, for tuples, lists and dicts, its direct members.
+
+    Strings inside containers are assumed to be shared (e.g., with a WordIndex), so only the
+    container's own slots and any numbers it holds are counted.
+    """
+    # LOCAL VARIABLES
+    size = sys.getsizeof(value)  # Size of value itself
+
+    # SIZE IT
+    if isinstance(value, dict):
+        size += sum(sys.getsizeof(item) for item in value.values() if not isinstance(item, str))
+    elif isinstance(value, (list, tuple)):
+        size += sum(shallow_sizeof(item) if isinstance(item, (dict, list, tuple))
+                    else sys.getsizeof(item) for item in value if not isinstance(item, str))
+
+    # DONE
+    return size
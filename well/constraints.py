@@ -0,0 +1,349 @@
+"""Defines the Constraints class: WordHints compiled down to integer bitmasks."""
+
+# Standard Imports
+from functools import lru_cache
+from typing import Callable, Dict, Final, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+import re
+# Third Party Imports
+# Local Imports
+from well.globals import FIVE_LETTER_WORDS
+
+
+ALPHABET: Final[str] = 'abcdefghijklmnopqrstuvwxyz'
+OTHER_BIT: Final[int] = 1 << len(ALPHABET)  # Any non-alphabet character
+ALL_BITS: Final[int] = (OTHER_BIT << 1) - 1  # Every letter plus OTHER_BIT
+SLOT_WIDTH: Final[int] = len(ALPHABET) + 1   # Bits per position in a packed mask
+
+
+def letter_bit(letter: str) -> int:
+    """Translate a single character into its bit."""
+    # LOCAL VARIABLES
+    code = ord(letter) - ord('a')  # Alphabet index
+
+    # DONE
+    if 0 <= code < len(ALPHABET):
+        return 1 << code
+    return OTHER_BIT
+
+
+def letters_mask(letters: str) -> int:
+    """OR together the bits of every character in letters."""
+    # LOCAL VARIABLES
+    mask = 0  # Bitmask of letters
+
+    # MASK IT
+    for letter in letters:
+        mask |= letter_bit(letter)
+
+    # DONE
+    return mask
+
+
+def mask_letters(mask: int) -> str:
+    """Translate a mask back into its alphabet letters, in order.  OTHER_BIT is ignored."""
+    return ''.join(letter for index, letter in enumerate(ALPHABET) if mask >> index & 1)
+
+
+def pack_masks(masks: Iterable[int]) -> int:
+    """Pack one SLOT_WIDTH mask per position into a single integer, first position lowest."""
+    # LOCAL VARIABLES
+    packed = 0  # Packed masks
+
+    # PACK IT
+    for index, mask in enumerate(masks):
+        packed |= mask << (index * SLOT_WIDTH)
+
+    # DONE
+    return packed
+
+
+def word_masks(word: str) -> Tuple[int, int]:
+    """Translate a word into its bitmasks.
+
+    Returns:
+        A tuple of the packed per-position letter bits and the mask of every letter in the word.
+    """
+    # LOCAL VARIABLES
+    bits = [letter_bit(letter) for letter in word]  # One bit per position
+    letters = 0                                     # All letters in word
+
+    # MASK IT
+    for bit in bits:
+        letters |= bit
+
+    # DONE
+    return (pack_masks(bits), letters)
+
+
+# pylint: disable=too-many-arguments,too-many-positional-arguments
+# Calm down, Pylint.  It's fine...
+def make_constraints(allowed: Iterable[int], required: int, fixed: int, room: int,
+                     min_counts: Iterable[int] = None,
+                     max_counts: Iterable[int] = None) -> 'Constraints':
+    """Create a Constraints object, deriving its packed masks and letter count bounds.
+
+    Args:
+        allowed: Per-position mask of the letters that position may still hold.
+        required: Mask of the letters a word must contain somewhere.
+        fixed: Mask of every solved and required letter.
+        room: Maximum number of positions whose letter falls outside of fixed.
+        min_counts: Optional; The fewest copies of each alphabet letter a word may hold.
+            Defaults to 0 for every letter.
+        max_counts: Optional; The most copies of each alphabet letter a word may hold.  Defaults
+            to len(allowed) for every letter.
+    """
+    # LOCAL VARIABLES
+    allowed = tuple(allowed)  # Frozen per-position masks
+    min_counts = tuple(min_counts) if min_counts is not None else (0,) * len(ALPHABET)
+    max_counts = tuple(max_counts) if max_counts is not None else (len(allowed),) * len(ALPHABET)
+
+    # DONE
+    return Constraints(allowed=allowed, required=required, fixed=fixed, room=room,
+                       rejected=pack_masks(ALL_BITS & ~mask for mask in allowed),
+                       outsiders=pack_masks([ALL_BITS & ~fixed] * len(allowed)),
+                       min_counts=min_counts, max_counts=max_counts,
+                       bounds=tuple((letter, low, high) for letter, low, high
+                                    in zip(ALPHABET, min_counts, max_counts)
+                                    if low > 0 or high < len(allowed)))
+
+
+def diff_constraints(old: 'Constraints', new: 'Constraints') -> Optional['Constraints']:
+    """Isolate what new adds on top of old.
+
+    Any word that satisfies old and the result also satisfies new.  Narrowing the survivors of old
+    with the result costs as much as the change, not the history.  That only works if new never
+    accepts a word old rejected, so new is checked for that first.
+
+    Args:
+        old: Constraints the words have already been narrowed by.
+        new: Later constraints from the same WordHints.
+
+    Returns:
+        Constraints holding the newly rejected letters, the newly required letters, the newly
+        tightened letter count bounds, and the room rule only if it changed.  None if new may
+        loosen old (e.g., contradictory feedback), so the words must be filtered by new in full.
+    """
+    # LOCAL VARIABLES
+    room = len(new.allowed)  # Room that can't reject anything
+
+    # DIFF IT
+    if not _implies(new, old):
+        return None  # Nothing to narrow from
+    if (old.fixed, old.room) != (new.fixed, new.room):
+        room = new.room
+
+    # DONE
+    return make_constraints(allowed=[ALL_BITS & ~(old_mask & ~new_mask)
+                                     for old_mask, new_mask in zip(old.allowed, new.allowed)],
+                            required=new.required & ~old.required, fixed=new.fixed, room=room,
+                            min_counts=[new_min if new_min > old_min else 0
+                                        for old_min, new_min in zip(old.min_counts,
+                                                                    new.min_counts)],
+                            max_counts=[new_max if new_max < old_max else len(new.allowed)
+                                        for old_max, new_max in zip(old.max_counts,
+                                                                    new.max_counts)])
+
+
+@lru_cache(maxsize=None)
+def word_mask_table() -> Dict[str, Tuple[int, int]]:
+    """Per-word bitmasks for FIVE_LETTER_WORDS, built once on first use."""
+    return {word: word_masks(word) for word in FIVE_LETTER_WORDS}
+
+
+class Constraints(NamedTuple):
+    """A frozen snapshot of WordHints, compiled down to integer bitmasks.
+
+    A word satisfies these constraints when every position holds an allowed letter, every required
+    letter appears somewhere, no more than room positions hold a letter outside of fixed, and it
+    holds from min_counts to max_counts copies of every letter.
+
+    Use make_constraints() to create one.
+
+    Attributes:
+        allowed: Per-position mask of the letters that position may still hold.
+        required: Mask of the letters a word must contain somewhere.
+        fixed: Mask of every solved and required letter.
+        room: Maximum number of positions whose letter falls outside of fixed.
+        rejected: The inverse of allowed, packed with pack_masks().
+        outsiders: The inverse of fixed for every position, packed with pack_masks().
+        min_counts: The fewest copies of each alphabet letter a word may hold.
+        max_counts: The most copies of each alphabet letter a word may hold.
+        bounds: (letter, min, max) for only the letters whose counts are bounded.
+    """
+
+    allowed: Tuple[int, ...]
+    required: int
+    fixed: int
+    room: int
+    rejected: int
+    outsiders: int
+    min_counts: Tuple[int, ...]
+    max_counts: Tuple[int, ...]
+    bounds: Tuple[Tuple[str, int, int], ...]
+
+    def check_word(self, word: str) -> bool:
+        """Determine if word satisfies these constraints."""
+        # LOCAL VARIABLES
+        masks = word_mask_table().get(word)  # Precomputed bitmasks
+
+        # CHECK IT
+        if masks is None:
+            masks = word_masks(word)
+
+        # DONE
+        return self.check_masks(masks) and self.check_counts(word)
+
+    def check_counts(self, word: str) -> bool:
+        """Determine if word holds an allowed number of copies of every bounded letter."""
+        for letter, low, high in self.bounds:
+            if not low <= word.count(letter) <= high:
+                return False
+        return True
+
+    def check_masks(self, masks: Tuple[int, int]) -> bool:
+        """Determine if bitmasks, as returned by word_masks(), satisfy these constraints.
+
+        Letter counts don't fit in the masks, so they're left to check_counts().
+        """
+        # LOCAL VARIABLES
+        packed, letters = masks  # Word bitmasks
+
+        # DONE
+        return not packed & self.rejected and letters & self.required == self.required \
+            and (packed & self.outsiders).bit_count() <= self.room
+
+    def filter(self, words: Iterable[str]) -> List[str]:
+        """Return the words that satisfy these constraints, in order."""
+        return list(self.iter_filter(words))
+
+    def iter_filter(self, words: Iterable[str]) -> Iterator[str]:
+        """Lazily yield the words that satisfy these constraints, in order.
+
+        Every mask is hoisted out of the loop before the first word is checked, so stopping after
+        the first few matches (e.g., with itertools.islice()) costs only the words checked so far.
+        """
+        # LOCAL VARIABLES
+        table = word_mask_table()   # Precomputed bitmasks
+        rejected = self.rejected    # Hoisted out of the loop
+        outsiders = self.outsiders  # Hoisted out of the loop
+        required = self.required    # Hoisted out of the loop
+        room = self.room            # Hoisted out of the loop
+        bounds = self.bounds        # Hoisted out of the loop
+        packed = 0                  # Packed letter bits of the current word
+        letters = 0                 # Letters of the current word
+
+        # FILTER IT
+        for word in words:
+            packed, letters = table.get(word) or word_masks(word)
+            if not packed & rejected and letters & required == required \
+                    and (packed & outsiders).bit_count() <= room:
+                for letter, low, high in bounds:
+                    if not low <= word.count(letter) <= high:
+                        break  # Too few or too many copies
+                else:
+                    yield word
+
+    def predicate(self) -> Callable[[str], bool]:
+        """Generate a Python predicate specialized to these constraints.
+
+        The generated source tests each position against only the letters it has to (e.g.,
+        word[0] == 'c'), so it needs no mask table.  It only ever holds letters and integers
+        derived from the masks.
+        """
+        # LOCAL VARIABLES
+        tests = [f'len(word) == {len(self.allowed)}']  # Generated conditions
+        namespace = {}                                  # Where the generated function lands
+        letters = ''                                    # Allowed letters of one position
+
+        # GENERATE IT
+        for index, mask in enumerate(self.allowed):
+            letters = mask_letters(mask)
+            if len(letters) == 1 and not mask & OTHER_BIT:
+                tests.append(f'word[{index}] == {letters!r}')
+            elif mask & OTHER_BIT and mask != ALL_BITS:
+                tests.append(f'word[{index}] not in {mask_letters(ALL_BITS & ~mask)!r}')
+            elif not mask & OTHER_BIT:
+                tests.append(f'word[{index}] in {letters!r}')
+        tests.extend(f'{letter!r} in word' for letter in mask_letters(self.required))
+        if self.room < len(self.allowed):
+            tests.append(f'sum(letter not in {mask_letters(self.fixed)!r} for letter in word) '
+                         f'<= {self.room}')
+        tests.extend(f'{low} <= word.count({letter!r}) <= {high}'
+                     for letter, low, high in self.bounds)
+        # pylint: disable=exec-used
+        # Calm down, Pylint.  It's fine...  Only letters and integers derived from masks get in.
+        exec(f'def predicate(word):\n    return {" and ".join(tests)}\n', namespace)
+
+        # DONE
+        return namespace['predicate']
+
+    def scan(self, buffer: str) -> Iterator[str]:
+        """Lazily yield the words of a newline-separated buffer that satisfy these constraints.
+
+        The whole buffer is scanned in one pass by the C regex engine (see: to_regex()).
+        """
+        for match in re.finditer(self.to_regex(), buffer, re.MULTILINE):
+            yield match.group()
+
+    def to_regex(self) -> str:
+        """Export these constraints as one anchored regular expression, for one word per line.
+
+        Required letters and minimum letter counts become lookaheads, the room rule and maximum
+        letter counts become negative lookaheads, and every position becomes a character class.
+        Lookarounds need a Perl-compatible engine (e.g., Python's re, grep -P, or most SQL REGEXP
+        implementations).  Words are matched as lowercase ASCII letters only.
+        """
+        # LOCAL VARIABLES
+        parts = ['^']  # Pieces of the expression
+        letters = ''   # Allowed letters of one position
+
+        # EXPORT IT
+        if self.room < len(self.allowed):
+            parts.append(f'(?!(?:[^\\n]*?[^{mask_letters(self.fixed)}\\n]){{{self.room + 1}}})')
+        parts.extend(f'(?=[^\\n]*{letter})' for letter in mask_letters(self.required))
+        for letter, low, high in self.bounds:
+            if low > (1 if letter_bit(letter) & self.required else 0):
+                parts.append(f'(?=(?:[^\\n]*?{letter}){{{low}}})')
+            if high < len(self.allowed):
+                parts.append(f'(?!(?:[^\\n]*?{letter}){{{high + 1}}})')
+        for mask in self.allowed:
+            letters = mask_letters(mask)
+            if len(letters) == len(ALPHABET):
+                parts.append('[a-z]')
+            elif len(letters) == 1:
+                parts.append(letters)
+            else:
+                parts.append(f'[{letters}]' if letters else '(?!)')
+        parts.append('$')
+
+        # DONE
+        return ''.join(parts)
+
+
+def _implies(new: Constraints, old: Constraints) -> bool:
+    """Determine if every word that satisfies new also satisfies old.
+
+    Conservative: False means new may accept a word old rejected, not that it does.
+    """
+    # LOCAL VARIABLES
+    bit = 0         # Bit of one letter
+    copies = 0      # Fewest copies of one letter a word that satisfies new may hold
+    guaranteed = 0  # Fewest positions of a word that satisfies new holding a letter of old.fixed
+
+    # CHECK IT
+    if any(new_mask & ~old_mask for old_mask, new_mask in zip(old.allowed, new.allowed)):
+        return False  # A position allows a letter it didn't before
+    if any(new_min < old_min for old_min, new_min in zip(old.min_counts, new.min_counts)) \
+            or any(new_max > old_max for old_max, new_max in zip(old.max_counts, new.max_counts)):
+        return False  # A letter count bound was relaxed
+    for code, letter in enumerate(ALPHABET):
+        bit = letter_bit(letter)
+        copies = max(sum(mask == bit for mask in new.allowed), new.min_counts[code],
+                     1 if new.required & bit else 0)
+        if old.required & bit and not copies:
+            return False  # No longer required, and not solved either
+        if old.fixed & bit:
+            guaranteed += copies
+
+    # DONE
+    return old.room >= len(old.allowed) or len(old.allowed) - guaranteed <= old.room
@@ -0,0 +1,153 @@
+"""Defines the PackedWords class: a word list packed into one contiguous buffer."""
+
+# Standard Imports
+from typing import Final, Iterable, Iterator, List, Sequence, Union
+import mmap
+import os
+# Third Party Imports
+# Local Imports
+
+
+PACK_BATCH: Final[int] = 4096  # Words written by pack_words() at a time
+
+
+class PackedWords(Sequence[str]):
+    """Read-only, lazily memory-mapped sequence of fixed-length ASCII words.
+
+    The file is every word concatenated, with no separators, so word N lives at byte offset
+    N * length.  Nothing is read until the first access, and the mapping is shared through the page
+    cache by every process that opens the same file.
+    """
+
+    def __init__(self, filename: str, length: int = 5):
+        """PackedWords() ctor.
+
+        Args:
+            filename: The packed word file (see: pack_words()).
+            length: Optional; The length of every word.
+        """
+        self.filename = filename  # Packed word file
+        self.length = length      # Length of every word
+        self._buffer = None       # Read-only view of the file, mapped on first use
+
+    @property
+    def buffer(self) -> memoryview:
+        """Read-only view of the packed words."""
+        # LOCAL VARIABLES
+        mapping = b''  # Memory-mapped file
+
+        # MAP IT
+        if self._buffer is None:
+            with open(self.filename, 'rb') as in_file:
+                if os.fstat(in_file.fileno()).st_size:
+                    mapping = mmap.mmap(in_file.fileno(), 0, access=mmap.ACCESS_READ)
+            if len(mapping) % self.length:
+                raise ValueError(f'"{self.filename}" does not hold {self.length} letter words')
+            self._buffer = memoryview(mapping)
+
+        # DONE
+        return self._buffer
+
+    def __contains__(self, word: object) -> bool:
+        """Determine if word is in these packed words."""
+        return self._find(word) >= 0
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[str, List[str]]:
+        """Get one word by index, or a list of words by slice."""
+        # LOCAL VARIABLES
+        length = self.length  # Length of every word
+
+        # GET IT
+        if isinstance(index, slice):
+            return [self[position] for position in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError('PackedWords index out of range')
+
+        # DONE
+        return str(self.buffer[index * length:(index + 1) * length], 'ascii')
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate every word, in order."""
+        # LOCAL VARIABLES
+        text = str(self.buffer, 'ascii')  # Every word, decoded at once
+        length = self.length              # Length of every word
+
+        # DONE
+        return (text[start:start + length] for start in range(0, len(text), length))
+
+    def __len__(self) -> int:
+        """Number of words."""
+        return len(self.buffer) // self.length
+
+    def __repr__(self) -> str:
+        """Describe these packed words."""
+        return f'{self.__class__.__name__}({self.filename!r}, length={self.length})'
+
+    def index(self, value: str, start: int = 0, stop: int = None) -> int:
+        """Get the index of the first occurrence of value.
+
+        Raises:
+            ValueError: value is not present.
+        """
+        # LOCAL VARIABLES
+        index = self._find(value, start)  # Index of value
+
+        # DONE
+        if index < 0 or (stop is not None and index >= stop):
+            raise ValueError(f'"{value}" is not in {self!r}')
+        return index
+
+    def _find(self, word: object, start: int = 0) -> int:
+        """Find the index of word, at or after index start, or -1."""
+        # LOCAL VARIABLES
+        needle = b''  # Encoded word
+        offset = -1   # Byte offset of a match
+
+        # FIND IT
+        if not isinstance(word, str) or len(word) != self.length or not word.isascii():
+            return -1
+        needle = word.encode('ascii')
+        offset = self.buffer.obj.find(needle, max(start, 0) * self.length)
+        while offset >= 0 and offset % self.length:
+            offset = self.buffer.obj.find(needle, offset + 1)  # Straddles two words
+
+        # DONE
+        return offset // self.length if offset >= 0 else -1
+
+
+def pack_words(words: Iterable[str], filename: str, length: int = 5) -> int:
+    """Write words, lowercased, as a packed word file for PackedWords.
+
+    Words are streamed to the file PACK_BATCH at a time, so words may be a lazy iterable (e.g.,
+    lines read from a file) of any size.
+
+    Args:
+        words: The words to pack.  Words of any other length are skipped.
+        filename: The file to write.
+        length: Optional; The length of every word.
+
+    Returns:
+        The number of words written.
+
+    Raises:
+        ValueError: A word contains a non-ASCII character.
+    """
+    # LOCAL VARIABLES
+    batch = []  # Words waiting to be written
+    count = 0   # Words written
+
+    # PACK IT
+    with open(filename, 'wb') as out_file:
+        for word in words:
+            if len(word) == length:
+                batch.append(word.lower())
+            if len(batch) >= PACK_BATCH:
+                out_file.write(''.join(batch).encode('ascii'))
+                count += len(batch)
+                batch = []
+        out_file.write(''.join(batch).encode('ascii'))
+
+    # DONE
+    return count + len(batch)
@@ -0,0 +1,150 @@
+"""Rank guesses by the information they are expected to reveal about the remaining candidates.
+
+A guess splits the candidates into buckets, one per feedback pattern.  Its score is the Shannon
+entropy of that bucket histogram, in bits.  Requires NumPy.
+"""
+
+# Standard Imports
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Dict, Final, List, Sequence
+# Third Party Imports
+# Local Imports
+from well.globals import FIVE_LETTER_WORDS
+from well.patterns import all_green, get_pattern_matrix
+from well.vectorized import HAVE_NUMPY, np
+
+
+BLOCK_SIZE: Final[int] = 512           # Most guesses bucketed per vectorized pass
+BLOCK_MAX_CELLS: Final[int] = 1 << 22  # Most histogram (or pattern) cells per pass
+SAMPLE_SIZE: Final[int] = 768          # Larger candidate sets are pre-screened with a sample
+SHORTLIST_SIZE: Final[int] = 256       # Guesses that survive the pre-screen to be scored exactly
+
+
+@lru_cache(maxsize=None)
+def _dictionary_rows(words: Sequence[str]) -> Dict[str, int]:
+    """Map every word in a (hashable) word list to its row in the pattern matrix."""
+    return {word: row for row, word in enumerate(words)}
+
+
+def calc_entropies(guess_rows: 'np.ndarray', answer_rows: 'np.ndarray',
+                   words: Sequence[str] = FIVE_LETTER_WORDS) -> 'np.ndarray':
+    """Calculate the entropy of every guess against the answers, in bits.
+
+    Guesses are bucketed in blocks of up to BLOCK_SIZE, shrunk so neither a block's patterns nor
+    its 3**length bucket histogram exceed BLOCK_MAX_CELLS cells.
+
+    Args:
+        guess_rows: Pattern matrix rows of the guesses.
+        answer_rows: Pattern matrix rows of the answers.
+        words: Optional; The word list the rows belong to.
+
+    Returns:
+        An array of entropies, one per guess.
+    """
+    # LOCAL VARIABLES
+    matrix = get_pattern_matrix(words)           # Guess x answer patterns
+    num_patterns = all_green(len(words[0])) + 1  # Buckets per guess
+    num_answers = len(answer_rows)               # Candidate count
+    xlogx = np.zeros(num_answers + 1)            # Bucket size -> size * log2(size)
+    entropies = np.empty(len(guess_rows))        # Results
+    offsets = None                               # Bucket offsets for one block
+    block_size = 0                               # Guesses per pass
+
+    # CALC IT
+    block_size = max(1, min(BLOCK_SIZE, BLOCK_MAX_CELLS // max(num_patterns, num_answers, 1)))
+    xlogx[1:] = np.arange(1, num_answers + 1) * np.log2(np.arange(1, num_answers + 1))
+    for start in range(0, len(guess_rows), block_size):
+        block = matrix[guess_rows[start:start + block_size]][:, answer_rows]
+        offsets = block + (np.arange(len(block)) * num_patterns)[:, None]
+        counts = np.bincount(offsets.ravel(), minlength=len(block) * num_patterns)
+        entropies[start:start + len(block)] = np.log2(num_answers) - xlogx[
+            counts.reshape(len(block), num_patterns)].sum(axis=1) / num_answers
+
+    # DONE
+    return entropies
+
+
+def rank_entropy(candidates: List[str], guesses: Sequence[str] = None,
+                 words: Sequence[str] = FIVE_LETTER_WORDS) -> OrderedDict[str, float]:
+    """Rank guesses by the entropy of the feedback they would produce against candidates.
+
+    Large candidate sets are first screened against an evenly spaced sample of the candidates.
+    Only the SHORTLIST_SIZE best guesses are then scored against every candidate, so the results
+    are limited to that shortlist.  Ties go to guesses that could be the answer.
+
+    Args:
+        candidates: The remaining possible answers.  Every one must be in words.
+        guesses: Optional; The words to rank.  Every one must be in words.  Defaults to words.
+        words: Optional; A hashable word list (e.g., PackedWords) to build the pattern matrix
+            for.  See: matrix_max_words().
+
+    Returns:
+        An OrderedDict of guess to entropy, in bits, sorted by descending entropy.
+
+    Raises:
+        RuntimeError: NumPy is not installed.
+        KeyError: A candidate or guess is not in words.
+        ValueError: words is too long for a pattern matrix.
+    """
+    return rank_entropy_boards([candidates], guesses=guesses, words=words)
+
+
+def rank_entropy_boards(boards: List[List[str]], guesses: Sequence[str] = None,
+                        words: Sequence[str] = FIVE_LETTER_WORDS) -> OrderedDict[str, float]:
+    """Rank guesses by the total entropy they would reveal across several boards at once.
+
+    Every board answers the same guess independently, so a guess's score is the sum of its
+    entropy against each board's candidates.  Boards without candidates are skipped.  Screened
+    and tie-broken like rank_entropy(), which is the one board case.
+
+    Args:
+        boards: The remaining possible answers of every board.  Every one must be in words.
+        guesses: Optional; The words to rank.  Every one must be in words.  Defaults to words.
+        words: Optional; A hashable word list (e.g., PackedWords) to build the pattern matrix
+            for.  See: matrix_max_words().
+
+    Returns:
+        An OrderedDict of guess to total entropy, in bits, sorted by descending entropy.
+
+    Raises:
+        RuntimeError: NumPy is not installed.
+        KeyError: A candidate or guess is not in words.
+        ValueError: words is too long for a pattern matrix.
+    """
+    # LOCAL VARIABLES
+    rows = {}           # Word to pattern matrix row
+    guess_rows = None   # Pattern matrix rows of the guesses
+    answer_rows = []    # Pattern matrix rows of each board's candidates
+    entropies = None    # Total entropy of each guess
+    hits = None         # Guesses that are also candidates on some board
+    order = None        # Ranked indices into guess_rows
+
+    # INPUT VALIDATION
+    if not HAVE_NUMPY:
+        raise RuntimeError('Entropy ranking requires NumPy')
+
+    # RANK IT
+    boards = [candidates for candidates in boards if candidates]
+    if not boards:
+        return OrderedDict()
+    rows = _dictionary_rows(words)
+    if guesses is None:
+        guess_rows = np.arange(len(rows))
+    else:
+        guess_rows = np.array([rows[guess] for guess in guesses], dtype=np.intp)
+    answer_rows = [np.array([rows[candidate] for candidate in candidates], dtype=np.intp)
+                   for candidates in boards]
+    # Early cutoff: pre-screen every guess against a sample of each board's candidates
+    if max(map(len, answer_rows)) > SAMPLE_SIZE and len(guess_rows) > SHORTLIST_SIZE:
+        entropies = sum(calc_entropies(guess_rows, board[::max(1, len(board) // SAMPLE_SIZE)],
+                                       words) for board in answer_rows)
+        guess_rows = guess_rows[np.sort(np.argsort(-entropies,
+                                                   kind='stable')[:SHORTLIST_SIZE])]
+    entropies = sum(calc_entropies(guess_rows, board, words) for board in answer_rows)
+    hits = np.isin(guess_rows, np.concatenate(answer_rows))
+    order = np.lexsort((~hits, -entropies))  # Last key is the primary key
+
+    # DONE
+    return OrderedDict(zip([words[row] for row in guess_rows[order].tolist()],
+                           entropies[order].tolist()))
@@ -0,0 +1,178 @@
+"""Per-turn stage timings, candidate counts and optional profiles, emitted as JSON lines."""
+
+# Standard Imports
+from contextlib import contextmanager, nullcontext
+from typing import Any, ContextManager, Dict, Final, Iterator, List, Optional, TextIO
+import cProfile
+import json
+import pstats
+import time
+import tracemalloc
+# Third Party Imports
+# Local Imports
+
+
+PROFILE_CPROFILE: Final[str] = 'cprofile'        # Profile the stages with cProfile
+PROFILE_TRACEMALLOC: Final[str] = 'tracemalloc'  # Trace the stages' memory with tracemalloc
+PROFILES: Final[List[str]] = [PROFILE_CPROFILE, PROFILE_TRACEMALLOC]
+PROFILE_TOP: Final[int] = 15                     # Functions reported per cProfile capture
+
+_NULL_CONTEXT = nullcontext()  # Reused by every disabled stage
+
+
+class NullInstrument():
+    """Instrumentation that's switched off.  Every method is a no-op."""
+
+    enabled = False
+
+    def stage(self, name: str) -> ContextManager:  # pylint: disable=unused-argument
+        """Time nothing."""
+        return _NULL_CONTEXT
+
+    def count(self, name: str, value: int) -> None:
+        """Record nothing."""
+
+    def end_turn(self) -> None:
+        """Emit nothing."""
+
+    def close(self) -> None:
+        """Close nothing."""
+
+
+# pylint: disable=too-many-instance-attributes
+# Calm down, Pylint.  It's fine...
+class Instrument(NullInstrument):
+    """Record how long each stage of a turn took, and emit one JSON line per turn.
+
+    Wrap each stage in stage(), record sizes with count(), then call end_turn().  Turn 0 is
+    everything prior to the first end_turn() (e.g., the archive fetch).  Only the code inside a
+    stage is timed and profiled, so time spent waiting on the user is left out.  Nested stages
+    are reported as exclusive time (see: stage()).
+    """
+
+    enabled = True
+
+    def __init__(self, out_file: TextIO, profile: Optional[str] = None):
+        """Instrument() ctor.
+
+        Args:
+            out_file: Where to write the JSON lines.
+            profile: Optional; PROFILE_CPROFILE or PROFILE_TRACEMALLOC to capture a profile of each
+                turn's stages.
+
+        Raises:
+            ValueError: Unknown profile.
+        """
+        if profile is not None and profile not in PROFILES:
+            raise ValueError(f'Unknown profile "{profile}", expected one of {PROFILES}')
+        self.out_file = out_file  # JSON lines destination
+        self.profile = profile    # Profile mode, if any
+        self.turn = 0             # Current turn
+        self._stages = {}         # Milliseconds spent in each stage this turn
+        self._counts = {}         # Sizes recorded this turn
+        self._memory = {}         # Peak bytes each outermost stage allocated this turn
+        self._stack = []          # [start, nested seconds] of each stage in progress
+        self._profiler = None     # cProfile capture for this turn
+        self._tracing = False     # This object started tracemalloc
+        if profile == PROFILE_CPROFILE:
+            self._profiler = cProfile.Profile()
+        elif profile == PROFILE_TRACEMALLOC and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._tracing = True
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """Time, and optionally profile, the code in this context as stage name.
+
+        Stages may nest.  Each stage is credited with its exclusive time, i.e., minus the time
+        spent in the stages nested inside it, so stage times add up to the instrumented total.
+        Profiles and peak memory are only captured around the outermost stage, and peak memory
+        is reported under that stage's name.
+        """
+        # LOCAL VARIABLES
+        frame = [0.0, 0.0]  # Start of the stage, seconds spent in nested stages
+        elapsed = 0.0       # Seconds spent in the stage
+        base = 0            # Traced bytes at the start of the stage
+
+        # TIME IT
+        if not self._stack:
+            if self._profiler:
+                self._profiler.enable()
+            if self.profile == PROFILE_TRACEMALLOC:
+                tracemalloc.reset_peak()
+                base = tracemalloc.get_traced_memory()[0]
+        frame[0] = time.perf_counter()
+        self._stack.append(frame)
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - frame[0]
+            self._stack.pop()
+            self._stages[name] = self._stages.get(name, 0.0) + 1000 * (elapsed - frame[1])
+            if self._stack:
+                self._stack[-1][1] += elapsed
+            else:
+                if self._profiler:
+                    self._profiler.disable()
+                if self.profile == PROFILE_TRACEMALLOC:
+                    self._memory[name] = max(self._memory.get(name, 0),
+                                             tracemalloc.get_traced_memory()[1] - base)
+
+    def count(self, name: str, value: int) -> None:
+        """Record a size (e.g., the number of candidates) for this turn."""
+        self._counts[name] = value
+
+    def end_turn(self) -> None:
+        """Emit this turn's JSON line and start the next turn."""
+        # LOCAL VARIABLES
+        record = {'event': 'turn', 'turn': self.turn, 'time': time.time(),
+                  'stages_ms': self._stages, 'counts': self._counts}  # JSON line
+
+        # EMIT IT
+        if self.profile == PROFILE_TRACEMALLOC:
+            record['peak_bytes'] = self._memory
+            record['traced_bytes'] = tracemalloc.get_traced_memory()[0]
+        elif self._profiler:
+            record['profile'] = _top_functions(self._profiler)
+            self._profiler = cProfile.Profile()
+        self._write(record)
+
+        # RESET IT
+        self.turn += 1
+        self._stages = {}
+        self._counts = {}
+        self._memory = {}
+
+    def close(self) -> None:
+        """Emit the current turn, if anything was recorded, and stop tracing."""
+        if self._stages or self._counts:
+            self.end_turn()
+        if self._tracing:
+            tracemalloc.stop()
+            self._tracing = False
+        self.out_file.flush()
+
+    def _write(self, record: Dict[str, Any]) -> None:
+        """Write one JSON line."""
+        self.out_file.write(json.dumps(record) + '\n')
+        self.out_file.flush()
+
+
+def _top_functions(profiler: cProfile.Profile) -> List[Dict[str, Any]]:
+    """Summarize the PROFILE_TOP functions with the most cumulative time."""
+    # LOCAL VARIABLES
+    stats = None  # Profile statistics
+    top = []      # Summaries
+
+    # SUMMARIZE IT
+    if not profiler.getstats():
+        return top  # Nothing was profiled
+    stats = pstats.Stats(profiler)
+    for func in sorted(stats.stats, key=lambda func: stats.stats[func][3],
+                       reverse=True)[:PROFILE_TOP]:
+        top.append({'function': f'{func[0]}:{func[1]}({func[2]})', 'calls': stats.stats[func][1],
+                    'total_ms': 1000 * stats.stats[func][2],
+                    'cumulative_ms': 1000 * stats.stats[func][3]})
+
+    # DONE
+    return top
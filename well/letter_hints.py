@@ -1,18 +1,37 @@
 """Defines the LetterHints class."""
 
 # Standard Imports
+from typing import Tuple
 # Third Party Imports
 # Local Imports
+from well.constraints import ALPHABET, letter_bit, letters_mask
 
 
 class LetterHints():
-    """Established facts about a single letter in a Wordle word."""
+    """Established facts about a single letter in a Wordle word.
+
+    The excluded characters are held as a bitmask (see: letter_bit()), and __slots__ keeps each
+    instance down to its two fields, so copying and snapshotting are cheap.
+    """
+
+    __slots__ = ('solution', 'excluded_mask')
+    _alphabet = ALPHABET  # For use during a solution
 
     def __init__(self):
         """LetterHints() ctor."""
-        self.solution = ''                                     # Updated when the result is green
-        self.excluded = ''                                     # Characters this letter can NOT be
-        self._alphabet = 'abcdefghijklmnopqrstuvwxyz'.lower()  # For use during a solution
+        self.solution = ''      # Updated when the result is green
+        self.excluded_mask = 0  # Bitmask of the characters this letter can NOT be
+
+    @property
+    def excluded(self) -> str:
+        """Characters this letter can NOT be, in alphabetical order."""
+        return ''.join(letter for letter in self._alphabet
+                       if self.excluded_mask & letter_bit(letter))
+
+    @excluded.setter
+    def excluded(self, letters: str) -> None:
+        """Replace the excluded characters."""
+        self.excluded_mask = letters_mask(letters)
 
     def exclude_letter(self, letter: str) -> None:
         """Add an excluded letter.
@@ -21,8 +40,7 @@ class LetterHints():
             letter: A single lowercase alphabet character to exclude from these letter hints.
         """
         self._validate_letter(letter)
-        if letter not in self.excluded:
-            self.excluded = self.excluded + letter
+        self.excluded_mask |= letter_bit(letter)
 
     def is_solved(self) -> bool:
         """Determine if this letter is already solved."""
@@ -48,8 +66,16 @@ class LetterHints():
         if self.is_solved():
             raise RuntimeError('This letter was already solved!')
         self._validate_letter(letter)
-        self.excluded = self._alphabet.replace(letter.lower(), '')
-        self.solution = letter.lower()
+        self.excluded_mask = letters_mask(self._alphabet) & ~letter_bit(letter)
+        self.solution = letter
+
+    def restore(self, state: Tuple[str, int]) -> None:
+        """Restore a snapshot() of these letter hints."""
+        self.solution, self.excluded_mask = state
+
+    def snapshot(self) -> Tuple[str, int]:
+        """Capture these letter hints as an immutable (solution, excluded_mask) tuple."""
+        return (self.solution, self.excluded_mask)
 
     def _validate_letter(self, letter: str) -> None:
         """Validate one letter.
@@ -2,48 +2,89 @@
 
 # Standard Imports
 from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Union
+import json
+import os
+import tempfile
 # Third Party Imports
 # Local Imports
-from well.archive import get_past_answers
-from well.globals import FIVE_LETTER_WORDS, INPUT_GREEN
-from well.prompt import get_feedback
-from well.word_hints import WordHints
-from well.words import calc_word_ordict, CountError, remove_word_hints, remove_words
+from well.archive import get_new_answers, get_past_answers
+from well.dictionary import PackedWords
+from well.globals import (CACHE_DIR, FIVE_LETTER_WORDS, INPUT_GREEN, RANKING_ENTROPY,
+                          RANKING_FREQUENCY, WORD_LENGTH)
+from well.instrument import NullInstrument
+from well.multi_solver import MultiSolver
+from well.opening import load_opening_tree
+from well.patterns import matrix_max_words, word_list_digest
+from well.prompt import get_results, get_word
+from well.solver import Solver
+from well.vectorized import HAVE_NUMPY
+from well.word_index import WordIndex
+from well.words import CountError, remove_words
 
 
-def main() -> int:
-    """Entry point for WERE LLAMA (WELL)."""
+def main(ranking: str = RANKING_FREQUENCY, instrument: NullInstrument = None,
+         hard: bool = False, dictionary: PackedWords = FIVE_LETTER_WORDS, boards: int = 1) -> int:
+    """Entry point for WERE LLAMA (WELL).
+
+    Args:
+        ranking: Optional; How to rank the top guesses: one of RANKINGS.
+        instrument: Optional; An Instrument to record each turn with.  Turn 0 is the startup.
+        hard: Optional; If True, only suggest guesses that use every revealed hint.
+        dictionary: Optional; Every legal guess (see: load_word_list()).  Past Wordle answers
+            are only removed from dictionaries of WORD_LENGTH letter words.
+        boards: Optional; Play this many boards with every guess (e.g., 4 for Quordle).
+    """
     # LOCAL VARIABLES
     result = 0  # 0 for success, 1 for failure
-    archive_list = []         # List of previous Wordle answers
-    available_list = []       # List of available words
+    length = dictionary.length  # Letters per word
+    available = []            # Dictionary words minus the archive
+    solver = None             # Hints and candidates (a MultiSolver for multiple boards)
     ord_dict = OrderedDict()  # OrderedDict of word probabilities
-    unique = True             # Only display unique solutions on round 1
-    word_hints = WordHints()  # WordHints object
-    temp_word = ''            # Word input from user
-    temp_result = ''          # Results input from user
+    remaining = ''            # How many words are left to guess from, per board
+
+    # INPUT VALIDATION
+    if ranking == RANKING_ENTROPY and not HAVE_NUMPY:
+        print('The entropy ranking requires NumPy.\nExiting.\n')
+        return 1
+    if ranking == RANKING_ENTROPY and len(dictionary) > matrix_max_words(length):
+        print(f'The entropy ranking is limited to {matrix_max_words(length)} {length} letter '
+              'words.\nExiting.\n')
+        return 1
+    if boards < 1 or (hard and boards > 1):  # Hard mode rules would conflict between boards
+        print(f'Unsupported number of boards{" in hard mode" if hard else ""}: {boards}\n'
+              'Exiting.\n')
+        return 1
+    if not dictionary:
+        print(f'No {length} letter words in the dictionary.\nExiting.\n')
+        return 1
+    if instrument is None:
+        instrument = NullInstrument()  # Off by default
 
     # DO IT
     # 1. Read the archive
-    archive_list = get_past_answers()
     # 2. Retrieve dictionary words
     # 3. Remove archive words
-    available_list = remove_words(FIVE_LETTER_WORDS, archive_list)
+    if length == WORD_LENGTH:
+        available = _get_available(dictionary, instrument=instrument)
+    else:
+        available = list(dictionary)
+    solver = _new_solver(available, ranking=ranking, instrument=instrument, hard=hard,
+                         dictionary=dictionary, boards=boards)
+    instrument.end_turn()
     # 4. Interact
     while True:
         # A. Calculate probability of remaining words
-        ord_dict = calc_word_ordict(available_list, unique=unique)
-        unique = False
-        print(f'TOP GUESSES ({len(ord_dict)} remaining): {", ".join(list(ord_dict.keys())[:10])}')
+        ord_dict = solver.rank()
+        remaining = _describe_remaining(solver)
+        print(f'TOP GUESSES ({remaining}): {", ".join(list(ord_dict.keys())[:10])}')
         try:
             # B. Take feedback
-            (temp_word, temp_result) = get_feedback()
-            if temp_result == (INPUT_GREEN * 5):
+            # C. Remove invalid words
+            if _take_turn(solver, length):
                 print('Congratulations!')
                 break  # All done
-            word_hints.update_word(temp_word, temp_result)
-            # C. Remove invalid words
-            available_list = remove_word_hints(available_list, word_hints)
+            instrument.end_turn()
         except (CountError, RuntimeError) as err:
             print(f'Error encountered: {repr(err)}')
             print('Exiting.\n')
@@ -54,4 +95,141 @@ def main() -> int:
             print('Try again.\n')
 
     # DONE
+    instrument.close()
     return result
+
+
+def _describe_remaining(solver: Union[Solver, MultiSolver]) -> str:
+    """Describe how many candidates are left: on each board, in board order, for a MultiSolver."""
+    if isinstance(solver, MultiSolver):
+        return 'remaining by board: ' + ', '.join(
+            'solved' if solved else str(len(board.available_list))
+            for board, solved in zip(solver.boards, solver.solved))
+    return f'{len(solver.available_list)} remaining'
+
+
+def _get_available(dictionary: PackedWords, instrument: NullInstrument,
+                   cache_dir: str = CACHE_DIR) -> List[str]:
+    """Remove the archive from dictionary, syncing the last run's result if there is one.
+
+    The result is saved to cache_dir along with the archive it excludes, so later runs only look
+    up the answers published since (see: get_new_answers()) and delete them in place.
+
+    Args:
+        dictionary: Every legal guess, WORD_LENGTH letters each.
+        instrument: An Instrument to record each stage with.
+        cache_dir: Optional; The directory to save the result in.
+
+    Returns:
+        The dictionary words that aren't past answers, in dictionary order.
+    """
+    # LOCAL VARIABLES
+    digest = word_list_digest(dictionary)[:16]                      # Identifies dictionary
+    filename = os.path.join(cache_dir, f'available-{digest}.json')  # Last run's result
+    saved = _read_available(filename)  # Last run's result, if it's usable
+    new_answers = []                   # Answers the saved result doesn't exclude yet
+
+    # SYNC IT
+    if saved is None:
+        with instrument.stage('get_past_answers'):
+            saved = {'archive': get_past_answers()}
+        with instrument.stage('remove_words'):
+            saved['available'] = remove_words(dictionary, saved['archive'])
+    else:
+        with instrument.stage('get_past_answers'):
+            new_answers = get_new_answers(saved['archive'])
+        with instrument.stage('remove_words'):
+            remove_words(saved['available'], new_answers, in_place=True)
+        saved['archive'].extend(new_answers)
+    if new_answers or not os.path.isfile(filename):
+        _write_available(filename, saved)
+
+    # DONE
+    return saved['available']
+
+
+# pylint: disable=too-many-arguments,too-many-positional-arguments
+# Calm down, Pylint.  It's fine...
+def _new_solver(available: List[str], ranking: str, instrument: NullInstrument, hard: bool,
+                dictionary: PackedWords, boards: int) -> Union[Solver, MultiSolver]:
+    """Index available, load the opening tree, and start a game on boards boards (see: main())."""
+    # LOCAL VARIABLES
+    word_index = None  # Index of available
+    tree = None        # Precomputed early turns, if they've been built
+
+    # START IT
+    with instrument.stage('word_index'):
+        word_index = WordIndex(available)
+    tree = load_opening_tree(word_index, ranking=ranking, dictionary=dictionary, rebuild=True)
+
+    # DONE
+    if boards == 1:
+        return Solver(available, ranking=ranking, word_index=word_index, instrument=instrument,
+                      tree=tree, hard=hard, dictionary=dictionary)
+    return MultiSolver(available, boards=boards, ranking=ranking, word_index=word_index,
+                       instrument=instrument, tree=tree, dictionary=dictionary)
+
+
+def _read_available(filename: str) -> Optional[Dict[str, Any]]:
+    """Read a result saved by _write_available(), if there's a usable one."""
+    # LOCAL VARIABLES
+    saved = None  # The archive, and the available words it left
+
+    # READ IT
+    try:
+        with open(filename, 'r', encoding='utf-8') as in_file:
+            saved = json.load(in_file)
+    except (OSError, ValueError):
+        saved = None  # Missing or corrupt, either way there's nothing to sync
+    if not isinstance(saved, dict) or not isinstance(saved.get('archive'), list) \
+            or not isinstance(saved.get('available'), list):
+        saved = None
+
+    # DONE
+    return saved
+
+
+def _take_turn(solver: Union[Solver, MultiSolver], length: int) -> bool:
+    """Take one guess's feedback from the user into solver.
+
+    A MultiSolver asks for the results of every unsolved board.
+
+    Returns:
+        True if the game is won: every board is solved.
+    """
+    # LOCAL VARIABLES
+    word = get_word(length=length)  # User-input word
+    result = ''                     # User-input results
+
+    # TAKE IT
+    if isinstance(solver, MultiSolver):
+        solver.update(word, [INPUT_GREEN * length if solved
+                             else get_results(length=length, board=board + 1)
+                             for board, solved in enumerate(solver.solved)])
+        return all(solver.solved)
+    result = get_results(length=length)
+    if result == INPUT_GREEN * length:
+        return True
+    solver.update(word, result)
+
+    # DONE
+    return False
+
+
+def _write_available(filename: str, saved: Dict[str, Any]) -> None:
+    """Atomically save the archive and the available words it left.  Failures are reported."""
+    # LOCAL VARIABLES
+    temp_fd = None  # File descriptor of the work-in-progress file
+    temp_name = ''  # Filename of the work-in-progress file
+
+    # WRITE IT
+    try:
+        os.makedirs(os.path.dirname(filename), exist_ok=True)
+        temp_fd, temp_name = tempfile.mkstemp(dir=os.path.dirname(filename), suffix='.tmp')
+        with os.fdopen(temp_fd, 'w', encoding='utf-8') as out_file:
+            json.dump(saved, out_file)
+        os.replace(temp_name, filename)
+    except OSError as err:
+        print(f'Unable to save the available words in "{filename}" with "{repr(err)}"')
+        if temp_name and os.path.exists(temp_name):
+            os.remove(temp_name)
@@ -0,0 +1,170 @@
+"""Defines the MultiSolver class: one guess stream played against several boards at once."""
+
+# Standard Imports
+from collections import OrderedDict, defaultdict
+from typing import TYPE_CHECKING, List, Sequence
+# Third Party Imports
+# Local Imports
+from well.cache import LRUCache
+from well.entropy import rank_entropy_boards
+from well.globals import FIVE_LETTER_WORDS, INPUT_GREEN, RANKING_ENTROPY, RANKING_FREQUENCY
+from well.instrument import NullInstrument
+from well.solver import Solver
+from well.word_index import WordIndex
+if TYPE_CHECKING:
+    from well.opening import OpeningTree  # Imports Solver
+
+
+# pylint: disable=too-many-arguments,too-many-positional-arguments
+# Calm down, Pylint.  It's fine...
+class MultiSolver():
+    """Hints, candidates and a combined ranking for a multi-board game (e.g., Quordle, Octordle).
+
+    Every board is its own Solver, with its own WordHints and candidates, but they all share one
+    WordIndex, one LRUCache and one OpeningTree.  Boards that reach the same hint state (e.g.,
+    every board on the first turn) are filtered once and looked up by the rest.
+
+    A guess is ranked across every unsolved board at once: by its total entropy, or by the sum of
+    its per-board scores.  A board drops out of both ranking and filtering as soon as it's solved.
+    Any board down to its last candidate is ranked first, since that guess is a guaranteed solve.
+    """
+
+    def __init__(self, available: List[str], boards: int = 4, ranking: str = RANKING_FREQUENCY,
+                 word_index: WordIndex = None, instrument: NullInstrument = None,
+                 cache: LRUCache = None, tree: 'OpeningTree' = None,
+                 dictionary: Sequence[str] = FIVE_LETTER_WORDS):
+        """MultiSolver() ctor.
+
+        Args:
+            available: The possible answers of every board.
+            boards: Optional; The number of boards.
+            ranking: Optional; How to rank guesses: one of RANKINGS.
+            word_index: Optional; A WordIndex of available to share between games.
+            instrument: Optional; An Instrument to record each stage with.
+            cache: Optional; An LRUCache of candidates and rankings.  Defaults to a new one, so
+                the boards can share their hint states.
+            tree: Optional; An OpeningTree loaded for word_index (see: load_opening_tree()).
+            dictionary: Optional; Every legal guess, a hashable word list (e.g., PackedWords) of
+                the same length as available.
+
+        Raises:
+            ValueError: Fewer than one board.
+        """
+        # INPUT VALIDATION
+        if boards < 1:
+            raise ValueError(f'A game needs at least one board: {boards}')
+
+        # INITIALIZE IT
+        self.ranking = ranking                            # Ranking mode
+        self.dictionary = dictionary                      # Every legal guess
+        self.instrument = instrument or NullInstrument()  # Stage timings, off by default
+        self.cache = LRUCache() if cache is None else cache  # Shared by every board
+        if word_index is None:
+            with self.instrument.stage('word_index'):
+                word_index = WordIndex(available)
+        self.boards = [Solver([], ranking=ranking, word_index=word_index,
+                              instrument=self.instrument, cache=self.cache, tree=tree,
+                              dictionary=dictionary) for _ in range(boards)]  # One per board
+        self.solved = [False] * boards  # Which boards are done
+
+    @property
+    def unsolved(self) -> List[Solver]:
+        """The boards still in play."""
+        return [board for board, solved in zip(self.boards, self.solved) if not solved]
+
+    def rank(self) -> OrderedDict[str, float]:
+        """Rank guesses against the candidates of every unsolved board, best first."""
+        # LOCAL VARIABLES
+        unsolved = self.unsolved  # Boards still in play
+        ord_dict = None           # Ranked guesses
+        finishers = []            # Last candidate of any board down to one
+
+        # RANK IT
+        self.instrument.count('boards', len(unsolved))
+        if not unsolved:
+            return OrderedDict()
+        if len({board.word_hints.signature() for board in unsolved}) == 1:
+            ord_dict = OrderedDict((guess, score * len(unsolved))
+                                   for guess, score in unsolved[0].rank().items())
+            for board in unsolved[1:]:
+                board.rank()  # Same state, so this is a lookup that keeps each board in step
+        elif self.ranking == RANKING_ENTROPY:
+            ord_dict = self._rank_entropy(unsolved)
+        else:
+            ord_dict = self._rank_combined(unsolved)
+        finishers = list(dict.fromkeys(board.available_list[0] for board in unsolved
+                                       if len(board.available_list) == 1))
+        if finishers:
+            ord_dict = OrderedDict([(guess, ord_dict.get(guess, 0.0)) for guess in finishers]
+                                   + [item for item in ord_dict.items()
+                                      if item[0] not in finishers])
+
+        # DONE
+        return ord_dict
+
+    def update(self, word: str, results: Sequence[str]) -> None:
+        """Take one guess's feedback from every board and narrow each unsolved board.
+
+        Every result is validated before any board is updated, so bad input changes nothing.
+
+        Args:
+            word: The lowercase word that was guessed.
+            results: The lowercase results (e.g., INPUT_GREEN) for word, one per board, in board
+                order.  The results of already solved boards are ignored.
+
+        Raises:
+            ValueError: Wrong number of results, or invalid results.
+        """
+        # LOCAL VARIABLES
+        length = len(self.boards[0].word_hints.word)  # Letters per word
+
+        # INPUT VALIDATION
+        if len(results) != len(self.boards):
+            raise ValueError(f'Expected results for {len(self.boards)} boards, '
+                             f'not {len(results)}')
+        for board, result in zip(self.unsolved, self._unsolved_results(results)):
+            board.word_hints.clone().update_word(word, result)
+
+        # UPDATE IT
+        for index, result in enumerate(results):
+            if self.solved[index]:
+                continue  # Dropped out
+            if result == INPUT_GREEN * length:
+                self.solved[index] = True
+            else:
+                self.boards[index].update(word, result)
+
+    def _rank_combined(self, unsolved: List[Solver]) -> OrderedDict[str, float]:
+        """Sum every unsolved board's own ranking."""
+        # LOCAL VARIABLES
+        totals = defaultdict(float)  # Guess to combined score
+
+        # COMBINE IT
+        with self.instrument.stage('combine_rankings'):
+            for board in unsolved:
+                for guess, score in board.rank().items():
+                    totals[guess] += score
+
+        # DONE
+        return OrderedDict(sorted(totals.items(), key=lambda item: item[1], reverse=True))
+
+    def _rank_entropy(self, unsolved: List[Solver]) -> OrderedDict[str, float]:
+        """Rank guesses by their total entropy across every unsolved board, cached."""
+        # LOCAL VARIABLES
+        key = ('rank_boards', tuple(sorted(board.word_hints.signature()
+                                           for board in unsolved)))  # Cache key
+        ord_dict = self.cache.get(key)                                 # Ranked guesses
+
+        # RANK IT
+        if ord_dict is None:
+            with self.instrument.stage('rank_entropy_boards'):
+                ord_dict = rank_entropy_boards([board.available_list for board in unsolved],
+                                               words=self.dictionary)
+            self.cache.put(key, ord_dict)
+
+        # DONE
+        return ord_dict
+
+    def _unsolved_results(self, results: Sequence[str]) -> List[str]:
+        """Pick out the results of the boards still in play."""
+        return [result for result, solved in zip(results, self.solved) if not solved]
@@ -0,0 +1,427 @@
+"""Precomputed opening decision tree: the first two turns answered with a lookup.
+
+The tree holds the top ranked openers and, for every feedback pattern the best opener can produce,
+the top ranked follow-up guesses and the ids of the surviving candidates.  It is saved to CACHE_DIR
+and memory-mapped from then on.
+
+A frequency ranking scores every word on its own, so one tree built for the whole dictionary serves
+every subset of it (e.g., main() without the archive): candidates and rankings are filtered down to
+the subset at lookup time, and publishing a new answer never invalidates it.  Other rankings score
+words against the candidates, so their trees are built for the pool of candidates actually in play,
+and rebuilt when that pool changes (see: load_opening_tree()).
+
+File layout (native byte order, every section 8-byte aligned):
+    header      magic, version, word length, word count, top, opener id, candidate id count
+    scores      float64[(1 + 3 ** length) * top]   root ranking, then one ranking per pattern
+    guesses     uint32[(1 + 3 ** length) * top]    word ids for those scores, NO_ID if unused
+    offsets     uint32[3 ** length + 1]            per pattern slice of candidates, NO_ID if absent
+    candidates  uint32[candidate id count]
+"""
+
+# Standard Imports
+from array import array
+from collections import OrderedDict
+from typing import Final, List, NamedTuple, Optional, Sequence, Tuple, Union
+import glob
+import mmap
+import os
+import struct
+import tempfile
+import time
+# Third Party Imports
+# Local Imports
+from well.archive import get_past_answers
+from well.globals import CACHE_DIR, FIVE_LETTER_WORDS, RANKING_ENTROPY, RANKING_FREQUENCY
+from well.patterns import pattern_results, score_guess, word_list_digest
+from well.solver import Solver
+from well.vectorized import HAVE_NUMPY
+from well.word_index import WordIndex
+from well.words import remove_words
+
+
+FILTERABLE_RANKINGS: Final[List[str]] = [RANKING_FREQUENCY]  # A subset ranks in the same order
+NO_ID: Final[int] = 0xFFFFFFFF  # Unused guess slot, or a pattern that wasn't precomputed
+TREE_MAGIC: Final[bytes] = b'WELLTREE'
+TREE_MIN_KEPT: Final[int] = 10  # Fewest filtered guesses served before ranking live instead
+TREE_TOP: Final[int] = 100      # Guesses stored per ranking
+TREE_VERSION: Final[int] = 2  # 2: Letter count bounds changed the candidates
+
+_HEADER = struct.Struct('=8s6I')  # See: the module docstring
+
+
+class TreeNode(NamedTuple):
+    """The second turn after the opener produced one feedback pattern."""
+
+    ranking: Optional[OrderedDict]  # Top ranked follow-up guesses, best first, None if stale
+    candidate_ids: Sequence[int]    # Ids of the surviving candidates, in index order
+
+
+# pylint: disable=too-many-instance-attributes
+# Calm down, Pylint.  It's fine...
+class OpeningTree():
+    """Read-only, memory-mapped opening decision tree (see: build_opening_tree()).
+
+    Given a WordIndex of fewer words than the tree was built for, candidates are translated to its
+    ids and the rest are dropped.  A stored ranking is returned as is if none of the candidates it
+    was ranked against were dropped.  Otherwise, a FILTERABLE_RANKINGS ranking is returned without
+    the dropped words, unless fewer than TREE_MIN_KEPT are left of a full one, and any other
+    ranking isn't returned at all.  Either way, a lookup never returns anything live computation
+    wouldn't.
+    """
+
+    def __init__(self, filename: str, words: Sequence[str], word_index: WordIndex = None,
+                 ranking: str = RANKING_FREQUENCY):
+        """OpeningTree() ctor.
+
+        Args:
+            filename: The tree file.
+            words: The word list the tree was built for, in index order.
+            word_index: Optional; A WordIndex of the candidates actually in play, all of them in
+                words.  Defaults to words, in the same order.
+            ranking: Optional; The ranking the tree was built with: one of RANKINGS.
+
+        Raises:
+            OSError: Unable to read filename.
+            ValueError: filename isn't a tree for words, or word_index holds a word that isn't.
+        """
+        # LOCAL VARIABLES
+        fields = ()    # Header fields
+        offset = 0     # Byte offset of the next section
+        patterns = 0   # Number of possible patterns
+        buffer = None  # The whole file
+        ids = {}       # word_index's words to their ids
+
+        # MAP IT
+        with open(filename, 'rb') as in_file:
+            self._mapping = mmap.mmap(in_file.fileno(), 0, access=mmap.ACCESS_READ)  # The file
+        if len(self._mapping) < _HEADER.size:
+            raise ValueError(f'"{filename}" is not an opening tree')
+        fields = _HEADER.unpack_from(self._mapping)
+        if fields[0] != TREE_MAGIC or fields[1] != TREE_VERSION or fields[3] != len(words):
+            raise ValueError(f'"{filename}" is not an opening tree for these words')
+        self.words = words                     # Indexed words
+        self.length = fields[2]                # Letters per word
+        self.top = fields[4]                   # Guesses stored per ranking
+        self.opener = words[fields[5]]         # The opener the patterns belong to
+        patterns = 3 ** self.length
+        buffer = memoryview(self._mapping)
+        offset = _HEADER.size
+        self._scores = buffer[offset:offset + 8 * (1 + patterns) * self.top].cast('d')
+        offset += 8 * (1 + patterns) * self.top
+        self._guesses = buffer[offset:offset + 4 * (1 + patterns) * self.top].cast('I')
+        offset += _align(4 * (1 + patterns) * self.top)
+        self._offsets = buffer[offset:offset + 4 * (patterns + 1)].cast('I')
+        offset += _align(4 * (patterns + 1))
+        self._candidates = buffer[offset:offset + 4 * fields[6]].cast('I')
+        if len(self._candidates) != fields[6]:
+            raise ValueError(f'"{filename}" is truncated')
+        self._translate = None  # Tree id to word_index id, -1 if dropped, None for the same ids
+        self._complete = True   # word_index holds every word
+        self._filter = ranking in FILTERABLE_RANKINGS  # Rankings hold for subsets, once filtered
+        if word_index is not None and list(word_index.words) != list(words):
+            ids = {word: index for index, word in enumerate(word_index.words)}
+            self._translate = array('i', [ids.get(word, -1) for word in words])
+            if len(self._translate) - self._translate.count(-1) != len(ids):
+                raise ValueError(f'"{filename}" is missing some of the word index\'s words')
+            self._complete = len(ids) == len(words)
+
+    def lookup(self, pattern: int) -> Optional[TreeNode]:
+        """The second turn after the opener produced pattern, or None if it wasn't precomputed.
+
+        The node's ranking is None if some of its candidates aren't in the word index, and the
+        ranking can't be filtered down to the rest.
+        """
+        # LOCAL VARIABLES
+        start = self._offsets[pattern]  # First candidate id index
+        tree_ids = []                   # Candidate ids, as stored
+        candidate_ids = []              # Candidate ids in the word index
+        ranking = None                  # Follow-up guesses
+
+        # LOOK IT UP
+        if start == NO_ID:
+            return None
+        tree_ids = self._candidates[start:self._next_offset(pattern)]
+        if self._translate is None:
+            candidate_ids = tree_ids
+        else:
+            candidate_ids = sorted(index for index in map(self._translate.__getitem__, tree_ids)
+                                   if index >= 0)
+        if len(candidate_ids) == len(tree_ids):
+            ranking = self._ranking(1 + pattern)
+        elif self._filter:
+            ranking = self._filtered(1 + pattern)
+
+        # DONE
+        return TreeNode(ranking=ranking, candidate_ids=candidate_ids)
+
+    def root(self) -> Optional[OrderedDict]:
+        """Top ranked openers, best first.
+
+        None if the word index lacks some of the words, and the ranking can't be filtered down to
+        the rest.
+        """
+        if self._complete:
+            return self._ranking(0)
+        return self._filtered(0) if self._filter else None
+
+    def _filtered(self, slot: int) -> Optional[OrderedDict]:
+        """Decode one stored ranking without the words the word index lacks.
+
+        Returns:
+            The filtered ranking, or None if fewer than TREE_MIN_KEPT guesses are left of a full
+            one, since the guesses cut off after the top might have outranked the rest.
+        """
+        # LOCAL VARIABLES
+        ord_dict = self._ranking(slot, drop=True)                 # Filtered ranking
+        full = self._guesses[(slot + 1) * self.top - 1] != NO_ID  # Cut off after the top
+
+        # DONE
+        return None if full and len(ord_dict) < TREE_MIN_KEPT else ord_dict
+
+    def _next_offset(self, pattern: int) -> int:
+        """Where the candidates of pattern end."""
+        for offset in self._offsets[pattern + 1:]:
+            if offset != NO_ID:
+                return offset
+        return len(self._candidates)  # Unreachable: the final offset is always set
+
+    def _ranking(self, slot: int, drop: bool = False) -> OrderedDict:
+        """Decode one stored ranking, without the words the word index lacks if drop."""
+        # LOCAL VARIABLES
+        ord_dict = OrderedDict()  # Decoded ranking
+        word_id = NO_ID           # Tree id of one guess
+
+        # DECODE IT
+        for index in range(slot * self.top, (slot + 1) * self.top):
+            word_id = self._guesses[index]
+            if word_id == NO_ID:
+                break
+            if not drop or self._translate[word_id] >= 0:
+                ord_dict[self.words[word_id]] = self._scores[index]
+
+        # DONE
+        return ord_dict
+
+
+# pylint: disable=too-many-arguments,too-many-positional-arguments,too-many-locals
+# Calm down, Pylint.  It's fine...
+def build_opening_tree(word_index: WordIndex, ranking: str = RANKING_FREQUENCY,
+                       opener: Optional[str] = None, top: int = TREE_TOP,
+                       cache_dir: str = CACHE_DIR,
+                       dictionary: Sequence[str] = FIVE_LETTER_WORDS) -> str:
+    """Precompute the first two turns for word_index's words and save them to cache_dir.
+
+    Every turn is computed by the same Solver pipeline a live game uses, so a lookup returns
+    exactly what live computation would, cut off after top guesses.
+
+    Args:
+        word_index: WordIndex of the possible answers.
+        ranking: Optional; How to rank guesses: one of RANKINGS.
+        opener: Optional; The first guess the tree is built for.  Defaults to the top ranked one.
+        top: Optional; Guesses stored per ranking.
+        cache_dir: Optional; The directory to store the tree in.
+        dictionary: Optional; Every legal guess, word_index's words among them.
+
+    Returns:
+        The tree filename.
+
+    Raises:
+        ValueError: Empty word list, or an opener that isn't in it.
+    """
+    # LOCAL VARIABLES
+    words = word_index.words                # Indexed words
+    length = len(words[0]) if words else 0  # Letters per word
+    solver = Solver([], ranking=ranking, word_index=word_index,
+                    dictionary=dictionary)             # Game state
+    rankings = []                                      # Root, then one ranking per pattern
+    offsets = array('I', [NO_ID] * (3 ** length + 1))  # Per pattern slice of candidates
+    candidates = array('I')                            # Candidate ids
+    opener_id = 0                                      # Id of the opener
+    patterns = set()                                   # Patterns the opener can produce
+    filename = get_tree_file(words, ranking, cache_dir, dictionary)  # Where to save it
+
+    # INPUT VALIDATION
+    if not words:
+        raise ValueError('Unable to build an opening tree without words')
+
+    # BUILD IT
+    rankings.append(solver.rank())
+    opener = opener or next(iter(rankings[0]))
+    opener_id = word_index.index(opener)
+    patterns = {score_guess(opener, answer) for answer in words}
+    for pattern in range(3 ** length):
+        rankings.append(OrderedDict())
+        if pattern not in patterns:
+            continue
+        solver = Solver([], ranking=ranking, word_index=word_index, dictionary=dictionary)
+        solver.rank()  # Turn one, so turn two ranks just as it would live
+        solver.update(opener, pattern_results(pattern, length=length))
+        rankings[-1] = solver.rank()
+        offsets[pattern] = len(candidates)
+        candidates.extend(word_index.ids(solver.survivors))
+    offsets[-1] = len(candidates)
+    _write_tree(filename, [_HEADER.pack(TREE_MAGIC, TREE_VERSION, length, len(words), top,
+                                        opener_id, len(candidates)),
+                           *_encode_rankings(rankings, word_index, top), offsets, candidates])
+
+    # DONE
+    return filename
+
+
+def get_tree_file(words: Sequence[str], ranking: str, cache_dir: str = CACHE_DIR,
+                  dictionary: Optional[Sequence[str]] = None) -> str:
+    """Name the tree file for a word list and ranking.
+
+    Args:
+        words: The word list the tree is built for.
+        ranking: How to rank guesses: one of RANKINGS.
+        cache_dir: Optional; The directory the tree is stored in.
+        dictionary: Optional; The dictionary words was drawn from.  Defaults to words.
+    """
+    return _tree_prefix(words if dictionary is None else dictionary, ranking, cache_dir) \
+        + f'{word_list_digest(words)[:16]}.tree'
+
+
+def load_opening_tree(word_index: WordIndex, ranking: str = RANKING_FREQUENCY,
+                      dictionary: Sequence[str] = FIVE_LETTER_WORDS, cache_dir: str = CACHE_DIR,
+                      rebuild: bool = False) -> Optional[OpeningTree]:
+    """Load the tree for a dictionary and ranking, if one has been built.
+
+    A FILTERABLE_RANKINGS tree is built for the whole dictionary, and any other tree for exactly
+    word_index's words.  If rebuild, a missing tree for word_index's words is rebuilt, with the
+    top ranked opener, as long as one was ever built for another subset of dictionary (e.g., before
+    the archive grew), and those stale trees are removed.  A tree that exists but can't be used
+    (e.g., it was built by an older version) is reported, not raised.
+
+    Args:
+        word_index: WordIndex of the candidates in play, a subset of dictionary.
+        ranking: Optional; How to rank guesses: one of RANKINGS.
+        dictionary: Optional; Every legal guess (see: build_opening_tree()).
+        cache_dir: Optional; The directory the tree is stored in.
+        rebuild: Optional; If True, keep an outdated tree for word_index's words up to date.
+    """
+    # LOCAL VARIABLES
+    words = dictionary if ranking in FILTERABLE_RANKINGS else word_index.words  # Tree words
+    filename = get_tree_file(words, ranking, cache_dir, dictionary)  # The tree file
+    stale = []  # Outdated trees for other subsets of dictionary
+
+    # LOAD IT
+    if rebuild and ranking not in FILTERABLE_RANKINGS and not os.path.isfile(filename):
+        stale = [name for name in glob.glob(glob.escape(_tree_prefix(dictionary, ranking,
+                                                                     cache_dir)) + '*.tree')
+                 if name != get_tree_file(dictionary, ranking, cache_dir)]  # Kept for batch()
+    if stale:
+        print(f'Rebuilding the {ranking} opening tree for {len(words)} words...')
+        try:
+            build_opening_tree(word_index, ranking=ranking, cache_dir=cache_dir,
+                               dictionary=dictionary)
+        except (OSError, ValueError) as err:
+            print(f'Unable to rebuild the opening tree after "{repr(err)}".')
+            return None
+        for name in stale:
+            _remove_tree(name)
+    if not os.path.isfile(filename):
+        return None  # Never built
+    try:
+        return OpeningTree(filename, words, word_index, ranking=ranking)
+    except (OSError, ValueError) as err:
+        print(f'Ignoring the opening tree "{filename}" after "{repr(err)}".  '
+              'Rebuild it with --build-tree.')
+        return None
+
+
+def _align(size: int) -> int:
+    """Round size up to a multiple of 8."""
+    return (size + 7) & ~7
+
+
+def _encode_rankings(rankings: List[OrderedDict], word_index: WordIndex,
+                     top: int) -> Tuple[array, array]:
+    """Encode rankings as their (scores, guesses) sections."""
+    # LOCAL VARIABLES
+    scores = array('d', [0.0] * (len(rankings) * top))     # Every ranking's scores
+    guesses = array('I', [NO_ID] * (len(rankings) * top))  # Every ranking's word ids
+
+    # ENCODE THEM
+    for slot, ord_dict in enumerate(rankings):
+        for index, (word, score) in enumerate(list(ord_dict.items())[:top]):
+            scores[slot * top + index] = score
+            guesses[slot * top + index] = word_index.index(word)
+
+    # DONE
+    return scores, guesses
+
+
+def _remove_tree(filename: str) -> None:
+    """Remove a stale tree file, unless it's already gone or in use elsewhere."""
+    try:
+        os.remove(filename)
+    except OSError:
+        pass  # Someone else removed it first, or it's still mapped (e.g., on Windows)
+
+
+def _tree_prefix(dictionary: Sequence[str], ranking: str, cache_dir: str) -> str:
+    """Name the start of every tree file for a dictionary and ranking."""
+    return os.path.join(cache_dir, f'opening-{ranking}-{word_list_digest(dictionary)[:16]}-')
+
+
+def _write_tree(filename: str, sections: List[Union[bytes, array]]) -> None:
+    """Atomically write a tree file, padding every section to a multiple of 8 bytes."""
+    # LOCAL VARIABLES
+    temp_fd = None  # File descriptor of the work-in-progress file
+    temp_name = ''  # Filename of the work-in-progress file
+    data = b''      # One section, as bytes
+
+    # WRITE IT
+    os.makedirs(os.path.dirname(filename), exist_ok=True)
+    temp_fd, temp_name = tempfile.mkstemp(dir=os.path.dirname(filename), suffix='.tmp')
+    try:
+        with os.fdopen(temp_fd, 'wb') as out_file:
+            for section in sections:
+                data = bytes(section)
+                out_file.write(data + bytes(_align(len(data)) - len(data)))
+        os.replace(temp_name, filename)  # Atomic, so concurrent readers never see half a file
+    finally:
+        if os.path.exists(temp_name):
+            os.remove(temp_name)
+
+
+def main(ranking: str = RANKING_FREQUENCY, opener: Optional[str] = None) -> int:
+    """Build the opening trees every mode shares.
+
+    A FILTERABLE_RANKINGS tree covers the whole dictionary, and main() and the server, which play
+    the dictionary minus the archive, filter it at lookup time (see: OpeningTree).  Any other
+    ranking gets one tree for the whole dictionary, played by batch(), and one for the dictionary
+    minus the archive, which main() and the server rebuild as the archive grows (see:
+    load_opening_tree()).
+
+    Args:
+        ranking: Optional; How to rank guesses: one of RANKINGS.
+        opener: Optional; The first guess the trees are built for.  Defaults to the top ranked one.
+    """
+    # LOCAL VARIABLES
+    start = time.perf_counter()        # Start of the build
+    pools = [list(FIVE_LETTER_WORDS)]  # Word lists to build a tree for
+    filename = ''                      # Tree filename
+
+    # INPUT VALIDATION
+    if ranking == RANKING_ENTROPY and not HAVE_NUMPY:
+        print('The entropy ranking requires NumPy.\nExiting.\n')
+        return 1
+
+    # BUILD THEM
+    if ranking not in FILTERABLE_RANKINGS:
+        pools.append(remove_words(FIVE_LETTER_WORDS, get_past_answers()))
+    for pool in pools:
+        try:
+            filename = build_opening_tree(WordIndex(pool), ranking=ranking, opener=opener)
+        except ValueError as err:
+            print(f'Error encountered: {repr(err)}')
+            print('Exiting.\n')
+            return 1
+        print(f'Built "{filename}" for {len(pool)} words in '
+              f'{time.perf_counter() - start:.2f}s')
+        start = time.perf_counter()
+
+    # DONE
+    return 0
@@ -0,0 +1,246 @@
+"""Calculate the feedback pattern a guess would produce against a hidden answer.
+
+Patterns are base-3 encoded, one digit per letter with the first letter least significant:
+PATTERN_BLANK, PATTERN_YELLOW, or PATTERN_GREEN.  The full guess x answer pattern matrix for a
+word list is built once, saved to CACHE_DIR, and memory-mapped from then on.
+"""
+
+# Standard Imports
+from typing import Dict, Final, Iterable, Sequence
+import hashlib
+import math
+import os
+import tempfile
+# Third Party Imports
+# Local Imports
+from well.globals import CACHE_DIR, FIVE_LETTER_WORDS, INPUT_GREEN, INPUT_SKIP, INPUT_YELLOW
+from well.vectorized import count_codes, encode_words, HAVE_NUMPY, np
+
+
+PATTERN_BLANK: Final[int] = 0
+PATTERN_YELLOW: Final[int] = 1
+PATTERN_GREEN: Final[int] = 2
+BLOCK_SIZE: Final[int] = 64                 # Guesses scored per vectorized pass
+MATRIX_MAX_BYTES: Final[int] = 16_384 ** 2  # Largest (quadratic) pattern matrix, in bytes
+
+_MATRICES: Dict[str, 'np.ndarray'] = {}  # Opened pattern matrices, keyed by word list digest
+
+
+def all_green(length: int = 5) -> int:
+    """The pattern of a correct guess."""
+    return 3 ** length - 1
+
+
+def score_guess(guess: str, answer: str) -> int:
+    """Calculate the pattern guess would produce against answer.
+
+    Greens are matched first.  Yellows are then handed out from left to right, one per unmatched
+    copy of the letter in answer.
+
+    Args:
+        guess: The lowercase guess.
+        answer: The lowercase answer, the same length as guess.
+
+    Returns:
+        The base-3 encoded pattern.
+    """
+    # LOCAL VARIABLES
+    pattern = 0     # Encoded pattern
+    power = 1       # Place value of the current letter
+    leftovers = {}  # Count of the answer letters that weren't green
+
+    # SCORE IT
+    # Greens
+    for guess_letter, answer_letter in zip(guess, answer):
+        if guess_letter == answer_letter:
+            pattern += PATTERN_GREEN * power
+        else:
+            leftovers[answer_letter] = leftovers.get(answer_letter, 0) + 1
+        power *= 3
+    # Yellows
+    power = 1
+    for guess_letter, answer_letter in zip(guess, answer):
+        if guess_letter != answer_letter and leftovers.get(guess_letter, 0):
+            pattern += PATTERN_YELLOW * power
+            leftovers[guess_letter] -= 1
+        power *= 3
+
+    # DONE
+    return pattern
+
+
+def pattern_results(pattern: int, length: int = 5) -> str:
+    """Translate a pattern into a user-style results string (e.g., INPUT_GREEN)."""
+    # LOCAL VARIABLES
+    results = ''                                    # Results string
+    lookup = (INPUT_SKIP, INPUT_YELLOW, INPUT_GREEN)  # Indexed by pattern digit
+
+    # TRANSLATE IT
+    for _ in range(length):
+        results = results + lookup[pattern % 3]
+        pattern //= 3
+
+    # DONE
+    return results
+
+
+def results_pattern(results: str) -> int:
+    """Translate a user-style results string (e.g., INPUT_GREEN) into a pattern.
+
+    Raises:
+        ValueError: Invalid results entry.
+    """
+    # LOCAL VARIABLES
+    pattern = 0                                          # Encoded pattern
+    lookup = {INPUT_SKIP: PATTERN_BLANK, INPUT_YELLOW: PATTERN_YELLOW,
+              INPUT_GREEN: PATTERN_GREEN}                # Digit for each entry
+
+    # TRANSLATE IT
+    for entry in reversed(results):
+        if entry not in lookup:
+            raise ValueError(f'Invalid results entry detected: {entry}')
+        pattern = pattern * 3 + lookup[entry]
+
+    # DONE
+    return pattern
+
+
+def matrix_max_words(length: int = 5) -> int:
+    """The longest list of words of length that fits in a MATRIX_MAX_BYTES pattern matrix."""
+    return math.isqrt(MATRIX_MAX_BYTES // pattern_dtype(length).itemsize)
+
+
+def pattern_dtype(length: int = 5) -> 'np.dtype':
+    """The smallest unsigned integer type that holds every pattern for words of length."""
+    # LOCAL VARIABLES
+    dtype = np.uint32  # Big enough for anything
+
+    # SIZE IT
+    if 3 ** length <= 1 << 8:
+        dtype = np.uint8
+    elif 3 ** length <= 1 << 16:
+        dtype = np.uint16
+
+    # DONE
+    return np.dtype(dtype)
+
+
+def score_codes(guesses: 'np.ndarray', answers: 'np.ndarray',
+                answer_counts: 'np.ndarray' = None) -> 'np.ndarray':
+    """Vectorized score_guess() for every pair of encoded guess and encoded answer.
+
+    Args:
+        guesses: (G, L) array of letter codes, as returned by vectorized.encode_words().
+        answers: (A, L) array of letter codes.
+        answer_counts: Optional; vectorized.count_codes(answers), if it's already on hand.
+
+    Returns:
+        (G, A) array of patterns.
+    """
+    # LOCAL VARIABLES
+    length = guesses.shape[1]                              # Letters per word
+    greens = guesses[:, None, :] == answers[None, :, :]    # (G, A, L) green letters
+    repeats = guesses[:, :, None] == guesses[:, None, :]   # (G, L, L) repeated guess letters
+    patterns = np.zeros(greens.shape[:2], dtype=np.int32)  # Encoded patterns
+    wanted = None   # Copies of the guess letter the answer has left over for yellows
+    claimed = None  # Copies already claimed by earlier non-green copies in the guess
+    rows = None     # Guesses that repeat a letter
+
+    # SCORE IT
+    if answer_counts is None:
+        answer_counts = count_codes(answers)
+    for index in range(length):
+        wanted = answer_counts[:, guesses[:, index]].T.astype(np.int16)
+        claimed = np.zeros_like(wanted)
+        # Only guesses that repeat this letter need adjusting
+        for other in range(length):
+            rows = np.flatnonzero(repeats[:, index, other])
+            if other == index or not rows.size:
+                continue
+            wanted[rows] -= greens[rows, :, other]  # A green copy isn't available for yellow
+            if other < index:
+                claimed[rows] += ~greens[rows, :, other]  # Yellows go left to right
+        patterns += 3 ** index * np.where(greens[:, :, index], PATTERN_GREEN,
+                                          (claimed < wanted) * PATTERN_YELLOW)
+
+    # DONE
+    return patterns.astype(pattern_dtype(length))
+
+
+def word_list_digest(words: Iterable[str]) -> str:
+    """Hash a word list, in order, for use as a cache key."""
+    return hashlib.sha256('\n'.join(words).encode('utf-8')).hexdigest()
+
+
+def get_pattern_matrix(words: Sequence[str] = None, cache_dir: str = CACHE_DIR) -> 'np.ndarray':
+    """Get the guess x answer pattern matrix for a word list.
+
+    The matrix is built on first use, saved to cache_dir under the word list digest, and
+    memory-mapped read-only from then on so every process shares one copy in the page cache.
+
+    Args:
+        words: Optional; The words to use as both guesses and answers.  Defaults to
+            FIVE_LETTER_WORDS.
+        cache_dir: Optional; The directory to store the matrix in.
+
+    Returns:
+        An (N, N) array, indexed [guess][answer] by position in words.
+
+    Raises:
+        RuntimeError: NumPy is not installed.
+        ValueError: words holds more than matrix_max_words() words.
+    """
+    # LOCAL VARIABLES
+    digest = ''    # Word list digest
+    filename = ''  # Cached matrix filename
+    matrix = None  # Pattern matrix
+
+    # INPUT VALIDATION
+    if not HAVE_NUMPY:
+        raise RuntimeError('The pattern matrix requires NumPy')
+    if words is None:
+        words = FIVE_LETTER_WORDS
+    if len(words) > matrix_max_words(len(words[0]) if words else 5):
+        raise ValueError('Pattern matrices are limited to '
+                         f'{matrix_max_words(len(words[0]))} words of this length')
+
+    # GET IT
+    digest = word_list_digest(words)
+    matrix = _MATRICES.get(digest)
+    if matrix is None:
+        codes = encode_words(words, length=len(words[0]) if words else 5)
+        dtype = pattern_dtype(codes.shape[1])
+        filename = os.path.join(cache_dir, f'patterns-{digest[:16]}.{dtype.name}')
+        if not os.path.isfile(filename):
+            _build_pattern_matrix(codes, filename)
+        matrix = np.memmap(filename, dtype=dtype, mode='r', shape=(len(words), len(words)))
+        _MATRICES[digest] = matrix
+
+    # DONE
+    return matrix
+
+
+def _build_pattern_matrix(codes: 'np.ndarray', filename: str) -> None:
+    """Score every encoded word against every other and save the results to filename."""
+    # LOCAL VARIABLES
+    dtype = pattern_dtype(codes.shape[1])  # Pattern data type
+    temp_fd = None                         # File descriptor of the work-in-progress file
+    temp_name = ''                         # Filename of the work-in-progress file
+    matrix = None                          # Work-in-progress matrix
+    counts = count_codes(codes)            # Letter counts of every answer
+
+    # BUILD IT
+    os.makedirs(os.path.dirname(filename), exist_ok=True)
+    temp_fd, temp_name = tempfile.mkstemp(dir=os.path.dirname(filename), suffix='.tmp')
+    os.close(temp_fd)
+    try:
+        matrix = np.memmap(temp_name, dtype=dtype, mode='w+', shape=(len(codes), len(codes)))
+        for start in range(0, len(codes), BLOCK_SIZE):
+            matrix[start:start + BLOCK_SIZE] = score_codes(codes[start:start + BLOCK_SIZE], codes,
+                                                           answer_counts=counts)
+        matrix.flush()
+        del matrix
+        os.replace(temp_name, filename)  # Atomic, so concurrent builders never see half a file
+    finally:
+        if os.path.exists(temp_name):
+            os.remove(temp_name)
@@ -1,36 +1,63 @@
 """Functionality to interact with the user."""
 
 # Standard Imports
-from typing import Tuple
+from typing import Optional, Tuple
 # Third Party Imports
 # Local Imports
-from well.globals import INPUT_GREEN, INPUT_SKIP_TITLE, INPUT_YELLOW
+from well.globals import INPUT_GREEN, INPUT_SKIP_TITLE, INPUT_YELLOW, WORD_LENGTH
 
 
-def get_feedback() -> Tuple[str, str]:
-    """Get feedback from the user: word and colors."""
+def get_feedback(length: int = WORD_LENGTH) -> Tuple[str, str]:
+    """Get feedback from the user: word and colors.
+
+    Args:
+        length: Optional; Letters per word.
+    """
+    return tuple((get_word(length=length), get_results(length=length)))
+
+
+def get_word(length: int = WORD_LENGTH) -> str:
+    """Get the word the user typed.
+
+    Args:
+        length: Optional; Letters per word.
+    """
     # LOCAL VARIABLES
-    word = ''    # User-input word
-    result = ''  # User-input results
+    word = ''  # User-input word
 
     # GET IT
-    # Word
     while True:
         print('What word did you type?')
         word = input()
-        if 5 != len(word):
+        if length != len(word):
             print(f'Invalid word length: {word}\nTry again!')
             continue
         break  # Got it
-    # Result
+
+    # DONE
+    return word.lower()
+
+
+def get_results(length: int = WORD_LENGTH, board: Optional[int] = None) -> str:
+    """Get the colors the user's word was given.
+
+    Args:
+        length: Optional; Letters per word.
+        board: Optional; Which board, counting from 1, the colors are for in a multi-board game.
+    """
+    # LOCAL VARIABLES
+    result = ''  # User-input results
+
+    # GET IT
     while True:
-        print(f'What were the results?\n({INPUT_GREEN.upper()} for green, '
+        print(f'What were the results{"" if board is None else f" on board {board}"}?\n'
+              f'({INPUT_GREEN.upper()} for green, '
               f'{INPUT_YELLOW.upper()} for yellow, {INPUT_SKIP_TITLE.upper()} otherwise)')
         result = input()
-        if 5 != len(result):
+        if length != len(result):
             print(f'Invalid results: {result}\nTry again!')
             continue
         break  # Got it
 
     # DONE
-    return tuple((word.lower(), result.lower()))
+    return result.lower()
@@ -0,0 +1,411 @@
+"""Asyncio HTTP/JSON service: WERE LLAMA suggestions for many concurrent players.
+
+Endpoints (every body is JSON):
+    POST   /sessions               Start a session: {"session", "suggestions", "remaining"}
+                                   Send {"hard": true} to only suggest hard mode guesses
+    GET    /sessions/<id>          The session's current suggestions
+    GET    /stats                  Session count and cache counters
+    POST   /sessions/<id>/feedback Take {"word": "tares", "results": "yy  g"} and re-rank
+    DELETE /sessions/<id>          End the session
+
+Add ?top=N to any of them to change the number of suggestions.  Ranking runs in an executor so
+the event loop keeps serving other players while one session crunches numbers.
+"""
+
+# Standard Imports
+from concurrent.futures import Executor
+from http import HTTPStatus
+from typing import Any, Dict, Final, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+import asyncio
+import json
+import secrets
+import time
+# Third Party Imports
+# Local Imports
+from well.archive import get_past_answers
+from well.cache import LRUCache
+from well.globals import (CACHE_DIR, FIVE_LETTER_WORDS, INPUT_GREEN, RANKING_ENTROPY,
+                          RANKING_FREQUENCY)
+from well.opening import load_opening_tree
+from well.solver import Solver
+from well.vectorized import HAVE_NUMPY
+from well.word_index import WordIndex
+from well.words import CountError, remove_words
+
+
+DEFAULT_HOST: Final[str] = '127.0.0.1'
+DEFAULT_PORT: Final[int] = 8642
+MAX_BODY: Final[int] = 4096          # Largest request body accepted, in bytes
+MAX_SESSIONS: Final[int] = 100_000   # Most sessions held at once
+MAX_TOP: Final[int] = 100            # Most suggestions returned at once
+SESSION_TTL: Final[int] = 60 * 60    # Seconds an idle session is kept
+TOP_N: Final[int] = 10               # Default number of suggestions
+
+
+class HTTPError(Exception):
+    """A request that can't be served, and the status to say so with."""
+
+    def __init__(self, status: HTTPStatus, message: str):
+        """HTTPError() ctor."""
+        super().__init__(message)
+        self.status = status
+
+
+# pylint: disable=too-few-public-methods
+# Calm down, Pylint.  It's fine...
+class Session():
+    """One player's game."""
+
+    def __init__(self, solver: Solver):
+        """Session() ctor."""
+        self.solver = solver             # Hints, candidates and rankings
+        self.ranked = []                 # Current ranking, best first
+        self.solved = False              # The player reported all green
+        self.lock = asyncio.Lock()       # One request at a time
+        self.touched = time.monotonic()  # Last use
+
+
+class HintServer():
+    """Serve suggestions for many sessions that share one WordIndex."""
+
+    def __init__(self, available: List[str], ranking: str = RANKING_FREQUENCY,
+                 executor: Optional[Executor] = None, cache_dir: str = CACHE_DIR):
+        """HintServer() ctor.
+
+        Args:
+            available: The possible answers (e.g., FIVE_LETTER_WORDS minus the archive).
+            ranking: Optional; How to rank guesses: one of RANKINGS.
+            executor: Optional; Where to rank.  Defaults to the event loop's default executor.
+            cache_dir: Optional; The directory to load the opening tree from.
+        """
+        self.ranking = ranking                  # Ranking mode
+        self.executor = executor                # Where the CPU-heavy work runs
+        self.word_index = WordIndex(available)  # Shared by every session
+        self.guess_index = None                 # Shared by hard mode sessions, once there is one
+        self.cache = LRUCache()                 # Shared by every session
+        self.tree = load_opening_tree(self.word_index, ranking=ranking, cache_dir=cache_dir,
+                                      rebuild=True)  # Precomputed early turns
+        self.sessions = {}                      # Session ID to Session
+
+    async def serve(self, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT) -> None:
+        """Warm up the ranking, then serve until cancelled."""
+        # LOCAL VARIABLES
+        server = None  # Listener
+
+        # SERVE IT
+        await self._run(_rank, self._new_solver(hard=False))
+        server = await asyncio.start_server(self.handle_connection, host, port)
+        print(f'Serving on {", ".join(str(sock.getsockname()) for sock in server.sockets)}')
+        async with server:
+            await asyncio.gather(server.serve_forever(), self._expire_sessions())
+
+    async def handle_connection(self, reader: asyncio.StreamReader,
+                                writer: asyncio.StreamWriter) -> None:
+        """Serve HTTP/1.1 requests on one connection until the client is done with it."""
+        # LOCAL VARIABLES
+        method = ''             # Request method
+        target = ''             # Request target
+        headers = {}            # Request headers, lowercase names
+        body = b''              # Request body
+        status = HTTPStatus.OK  # Response status
+        payload = {}            # Response body
+
+        # SERVE IT
+        try:
+            while True:
+                try:
+                    method, target, headers = await _read_head(reader)
+                    body = await _read_body(reader, headers)
+                except EOFError:
+                    break  # Client hung up between requests
+                except HTTPError as err:
+                    writer.write(_format_response(err.status, {'error': str(err)}))
+                    break  # No telling where the next request starts
+                try:
+                    status, payload = await self.dispatch(method, target, body)
+                except HTTPError as err:
+                    status, payload = err.status, {'error': str(err)}
+                writer.write(_format_response(status, payload))
+                await writer.drain()
+                if headers.get('connection', '').lower() == 'close':
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass  # Nothing left to say to this client
+        finally:
+            writer.close()
+
+    async def dispatch(self, method: str, target: str, body: bytes) -> Tuple[HTTPStatus, Dict]:
+        """Route one request.
+
+        Raises:
+            HTTPError: Bad request, unknown session or unknown route.
+        """
+        # LOCAL VARIABLES
+        url = urlsplit(target)                                  # Parsed target
+        parts = [part for part in url.path.split('/') if part]  # Path segments
+        top = _get_top(parse_qs(url.query))                     # Number of suggestions
+
+        # ROUTE IT
+        if parts == ['sessions'] and method == 'POST':
+            return HTTPStatus.CREATED, await self.create_session(top, _parse_json(body))
+        if parts == ['stats'] and method == 'GET':
+            return HTTPStatus.OK, {'sessions': len(self.sessions),
+                                   'cache': self.cache.stats()._asdict()}
+        if len(parts) == 2 and parts[0] == 'sessions' and method == 'GET':
+            return HTTPStatus.OK, await self.get_session(parts[1], top)
+        if len(parts) == 2 and parts[0] == 'sessions' and method == 'DELETE':
+            self._get_session(parts[1])
+            del self.sessions[parts[1]]
+            return HTTPStatus.OK, {'session': parts[1]}
+        if len(parts) == 3 and parts[0] == 'sessions' and parts[2] == 'feedback' \
+                and method == 'POST':
+            return HTTPStatus.OK, await self.take_feedback(parts[1], _parse_json(body), top)
+
+        # DONE
+        raise HTTPError(HTTPStatus.NOT_FOUND, f'No route for {method} {url.path}')
+
+    async def create_session(self, top: int = TOP_N,
+                             options: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Start a session and rank its first turn.
+
+        Raises:
+            HTTPError: Bad options (e.g., a non-boolean "hard").
+        """
+        # LOCAL VARIABLES
+        session_id = secrets.token_urlsafe(12)     # New session ID
+        session = None                             # New session
+        hard = (options or {}).get('hard', False)  # Hard mode
+
+        # INPUT VALIDATION
+        if not isinstance(hard, bool):
+            raise HTTPError(HTTPStatus.BAD_REQUEST, '"hard" must be a boolean')
+        if len(self.sessions) >= MAX_SESSIONS:
+            raise HTTPError(HTTPStatus.SERVICE_UNAVAILABLE, 'Too many sessions')
+
+        # START IT
+        session = Session(self._new_solver(hard=hard))
+        self.sessions[session_id] = session
+        async with session.lock:
+            session.ranked = await self._run(_rank, session.solver)
+
+        # DONE
+        return _describe(session_id, session, top)
+
+    async def get_session(self, session_id: str, top: int = TOP_N) -> Dict[str, Any]:
+        """Describe a session's current suggestions."""
+        # LOCAL VARIABLES
+        session = self._get_session(session_id)  # The session
+
+        # DONE
+        async with session.lock:
+            return _describe(session_id, session, top)
+
+    async def take_feedback(self, session_id: str, feedback: Dict[str, Any],
+                            top: int = TOP_N) -> Dict[str, Any]:
+        """Take a player's word and results, then re-rank.
+
+        Raises:
+            HTTPError: Bad feedback (e.g., a word that isn't five lowercase letters).
+        """
+        # LOCAL VARIABLES
+        session = self._get_session(session_id)       # The session
+        length = len(session.solver.word_hints.word)  # Letters per word
+        word = feedback.get('word')                   # Word the player typed
+        results = feedback.get('results')             # Results the player saw
+
+        # INPUT VALIDATION
+        if not isinstance(word, str) or not isinstance(results, str):
+            raise HTTPError(HTTPStatus.BAD_REQUEST, '"word" and "results" must be strings')
+        if not len(word) == len(results) == length:
+            raise HTTPError(HTTPStatus.BAD_REQUEST,
+                            f'"word" and "results" must be {length} characters long')
+        word = word.lower()
+        results = results.lower()
+
+        # UPDATE IT
+        async with session.lock:
+            if results == INPUT_GREEN * length:
+                session.solved = True
+            elif not session.solved:
+                try:
+                    session.ranked = await self._run(_update_and_rank, session.solver, word,
+                                                     results)
+                except (CountError, TypeError, ValueError, RuntimeError) as err:
+                    raise HTTPError(HTTPStatus.BAD_REQUEST, repr(err)) from err
+
+            # DONE
+            return _describe(session_id, session, top)
+
+    async def _expire_sessions(self) -> None:
+        """Periodically drop sessions that have been idle for longer than SESSION_TTL."""
+        # LOCAL VARIABLES
+        cutoff = 0.0  # Sessions untouched since cutoff are dropped
+
+        # EXPIRE THEM
+        while True:
+            await asyncio.sleep(SESSION_TTL / 10)
+            cutoff = time.monotonic() - SESSION_TTL
+            for session_id in [session_id for session_id, session in self.sessions.items()
+                               if session.touched < cutoff and not session.lock.locked()]:
+                del self.sessions[session_id]
+
+    def _get_session(self, session_id: str) -> Session:
+        """Look up a session and mark it as used.
+
+        Raises:
+            HTTPError: Unknown session.
+        """
+        # LOCAL VARIABLES
+        session = self.sessions.get(session_id)  # The session
+
+        # DONE
+        if session is None:
+            raise HTTPError(HTTPStatus.NOT_FOUND, f'Unknown session "{session_id}"')
+        session.touched = time.monotonic()
+        return session
+
+    def _new_solver(self, hard: bool) -> Solver:
+        """Start a game that shares the WordIndexes and cache."""
+        if hard and self.guess_index is None:
+            self.guess_index = WordIndex(list(FIVE_LETTER_WORDS))  # The first hard mode session
+        return Solver([], ranking=self.ranking, word_index=self.word_index, cache=self.cache,
+                      tree=self.tree, hard=hard, guess_index=self.guess_index)
+
+    async def _run(self, func, *args) -> Any:
+        """Run func(*args) in the executor."""
+        return await asyncio.get_running_loop().run_in_executor(self.executor, func, *args)
+
+
+def main(ranking: str = RANKING_FREQUENCY, host: str = DEFAULT_HOST,
+         port: int = DEFAULT_PORT) -> int:
+    """Serve suggestions from the dictionary, minus the archive, until interrupted.
+
+    Args:
+        ranking: Optional; How to rank guesses: one of RANKINGS.
+        host: Optional; Interface to listen on.
+        port: Optional; Port to listen on.
+    """
+    # INPUT VALIDATION
+    if ranking == RANKING_ENTROPY and not HAVE_NUMPY:
+        print('The entropy ranking requires NumPy.\nExiting.\n')
+        return 1
+
+    # SERVE IT
+    try:
+        asyncio.run(HintServer(remove_words(FIVE_LETTER_WORDS, get_past_answers()),
+                               ranking=ranking).serve(host=host, port=port))
+    except KeyboardInterrupt:
+        print('Exiting.\n')
+
+    # DONE
+    return 0
+
+
+def _describe(session_id: str, session: Session, top: int) -> Dict[str, Any]:
+    """The response body for a session."""
+    return {'session': session_id, 'suggestions': session.ranked[:top],
+            'remaining': len(session.solver.available_list), 'solved': session.solved}
+
+
+def _format_response(status: HTTPStatus, payload: Dict[str, Any]) -> bytes:
+    """Format an HTTP/1.1 JSON response."""
+    # LOCAL VARIABLES
+    body = json.dumps(payload).encode('utf-8')  # Response body
+
+    # DONE
+    return (f'HTTP/1.1 {status.value} {status.phrase}\r\nContent-Type: application/json\r\n'
+            f'Content-Length: {len(body)}\r\n\r\n').encode('latin-1') + body
+
+
+def _get_top(query: Dict[str, List[str]]) -> int:
+    """Read ?top=N.
+
+    Raises:
+        HTTPError: N isn't an integer from 1 to MAX_TOP.
+    """
+    # LOCAL VARIABLES
+    top = query.get('top', [str(TOP_N)])[-1]  # Number of suggestions
+
+    # DONE
+    if not top.isdigit() or not 0 < int(top) <= MAX_TOP:
+        raise HTTPError(HTTPStatus.BAD_REQUEST, f'"top" must be 1 to {MAX_TOP}')
+    return int(top)
+
+
+def _parse_json(body: bytes) -> Dict[str, Any]:
+    """Parse a JSON object request body.
+
+    Raises:
+        HTTPError: The body isn't a JSON object.
+    """
+    # LOCAL VARIABLES
+    parsed = None  # Parsed body
+
+    # PARSE IT
+    try:
+        parsed = json.loads(body or b'{}')
+    except ValueError as err:
+        raise HTTPError(HTTPStatus.BAD_REQUEST, f'Invalid JSON: {err}') from err
+
+    # DONE
+    if not isinstance(parsed, dict):
+        raise HTTPError(HTTPStatus.BAD_REQUEST, 'The body must be a JSON object')
+    return parsed
+
+
+def _rank(solver: Solver) -> List[str]:
+    """Rank the solver's guesses, best first.  Runs in the executor."""
+    return list(solver.rank().keys())[:MAX_TOP]
+
+
+async def _read_body(reader: asyncio.StreamReader, headers: Dict[str, str]) -> bytes:
+    """Read a request body.
+
+    Raises:
+        HTTPError: Bad or too large Content-Length.
+    """
+    # LOCAL VARIABLES
+    length = headers.get('content-length', '0')  # Body length
+
+    # DONE
+    if not length.isdigit():
+        raise HTTPError(HTTPStatus.BAD_REQUEST, 'Invalid Content-Length')
+    if int(length) > MAX_BODY:
+        raise HTTPError(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, f'Bodies are limited to {MAX_BODY}')
+    return await reader.readexactly(int(length))
+
+
+async def _read_head(reader: asyncio.StreamReader) -> Tuple[str, str, Dict[str, str]]:
+    """Read a request line and headers.
+
+    Raises:
+        EOFError: The client closed the connection before sending a request.
+        HTTPError: Malformed request.
+    """
+    # LOCAL VARIABLES
+    line = await reader.readline()  # Request line, then each header line
+    parts = []                      # Request line fields
+    headers = {}                    # Header names (lowercase) to values
+
+    # READ IT
+    if not line:
+        raise EOFError('Connection closed')
+    parts = line.decode('latin-1').split()
+    if len(parts) != 3:
+        raise HTTPError(HTTPStatus.BAD_REQUEST, 'Malformed request line')
+    while True:
+        line = await reader.readline()
+        if line in (b'\r\n', b'\n', b''):
+            break
+        name, _, value = line.decode('latin-1').partition(':')
+        headers[name.strip().lower()] = value.strip()
+
+    # DONE
+    return parts[0].upper(), parts[1], headers
+
+
+def _update_and_rank(solver: Solver, word: str, results: str) -> List[str]:
+    """Take feedback, then rank the solver's guesses, best first.  Runs in the executor."""
+    solver.update(word, results)
+    return _rank(solver)
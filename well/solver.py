@@ -0,0 +1,185 @@
+"""Defines the Solver class: the WERE LLAMA pipeline for a single game."""
+
+# Standard Imports
+from collections import OrderedDict
+from typing import TYPE_CHECKING, List, Sequence
+# Third Party Imports
+# Local Imports
+from well.cache import LRUCache
+from well.entropy import rank_entropy
+from well.globals import (FIVE_LETTER_WORDS, RANKING_ENTROPY, RANKING_FREQUENCY, RANKING_POSITIONAL,
+                          SCORER_POSITIONAL, SCORER_STATIC, WORD_LENGTH)
+from well.instrument import NullInstrument
+from well.word_hints import WordHints
+from well.word_index import WordIndex
+from well.patterns import results_pattern
+from well.words import calc_word_ordict
+if TYPE_CHECKING:
+    from well.opening import OpeningTree  # Imports Solver
+
+
+# pylint: disable=too-many-instance-attributes,too-many-arguments,too-many-positional-arguments
+# Calm down, Pylint.  It's fine...
+class Solver():
+    """Hints, candidates and rankings for one game.
+
+    The same pipeline drives the interactive loop in main() and every headless mode: rank the
+    available words, take feedback into WordHints, then narrow the candidates by what it added.
+
+    Solvers that share a WordIndex may also share an LRUCache, keyed by WordHints.signature(), so a
+    hint state any of them has already reached costs a lookup.  Rankings, available_list and
+    legal_list may then be shared between solvers, so treat them as read-only.
+
+    Given an OpeningTree for word_index, the first turn, and the second turn after the tree's
+    opener, are looked up instead of computed.  Those rankings hold only the tree's top guesses.
+    The tree may cover more words than word_index (see: OpeningTree), in which case its frequency
+    rankings are filtered down to these candidates, and other rankings are only looked up for
+    exactly these candidates.
+
+    In hard mode, a second pool of legal guesses is narrowed alongside the candidates, and the
+    entropy ranking scores only those guesses.  Ranking then costs as much as the legal pool, not
+    the whole guess list.  The frequency ranking only ever suggests candidates, and every
+    candidate is already a legal guess.
+    """
+
+    def __init__(self, available: List[str], ranking: str = RANKING_FREQUENCY,
+                 word_index: WordIndex = None, instrument: NullInstrument = None,
+                 cache: LRUCache = None, tree: 'OpeningTree' = None, hard: bool = False,
+                 guess_index: WordIndex = None, dictionary: Sequence[str] = FIVE_LETTER_WORDS):
+        """Solver() ctor.
+
+        Args:
+            available: The possible answers (e.g., FIVE_LETTER_WORDS minus the archive).
+            ranking: Optional; How to rank guesses: one of RANKINGS.
+            word_index: Optional; A WordIndex of available to share between games.
+            instrument: Optional; An Instrument to record each stage with.
+            cache: Optional; An LRUCache of candidates and rankings, shared by every solver of
+                word_index.
+            tree: Optional; An OpeningTree loaded for word_index (see: load_opening_tree()).
+            hard: Optional; If True, only suggest guesses that use every revealed hint.
+            guess_index: Optional; A WordIndex of the guesses to share between hard mode games.
+                Defaults to indexing dictionary.
+            dictionary: Optional; Every legal guess, a hashable word list (e.g., PackedWords) of
+                the same length as available.
+        """
+        self.ranking = ranking                                # Ranking mode
+        self.dictionary = dictionary                          # Every legal guess
+        self.word_hints = WordHints(len(dictionary[0]) if dictionary else WORD_LENGTH)  # Facts
+        self.word_index = word_index                          # Index of the possible answers
+        self.instrument = instrument or NullInstrument()      # Stage timings, off by default
+        self.cache = cache                                    # Shared candidates and rankings
+        self.tree = tree                                      # Precomputed early turns
+        self.hard = hard                                      # Hard mode
+        self.guess_index = guess_index                        # Index of the guesses, hard mode
+        self._node = None                                     # Tree node for this turn
+        self._legal_key = None                                # Hard mode rule, once there is one
+        self._unique = True                                   # Unique letters for round 1
+        if word_index is None:
+            with self.instrument.stage('word_index'):
+                self.word_index = WordIndex(available)
+        self.survivors = self.word_index.all_ids              # Bitset of the candidates
+        self.available_list = list(self.word_index.words)     # List of the candidates
+        if hard and guess_index is None:
+            with self.instrument.stage('guess_index'):
+                self.guess_index = WordIndex(list(dictionary))
+        self.legal = self.guess_index.all_ids if hard else 0  # Bitset of the legal guesses
+        self.legal_list = self.guess_index.words if hard else []  # List of the legal guesses
+
+    def rank(self) -> OrderedDict[str, float]:
+        """Rank guesses against the remaining candidates, best first."""
+        # LOCAL VARIABLES
+        key = None       # Cache key
+        ord_dict = None  # Ranked guesses
+
+        # RANK IT
+        self.instrument.count('candidates', len(self.available_list))
+        if self.hard:
+            self.instrument.count('legal', len(self.legal_list))
+        if self.tree is not None and not self.word_hints.deltas:
+            ord_dict = self.tree.root()  # Every guess is legal before the first hint
+        elif self._node is not None and not self._ranks_legal():
+            ord_dict = self._node.ranking
+        if ord_dict is None and self.cache is not None:
+            key = ('rank', self.word_hints.signature(), self.ranking, self._unique,
+                   self._legal_key if self._ranks_legal() else None)
+            ord_dict = self.cache.get(key)
+        if ord_dict is None:
+            if self.ranking == RANKING_ENTROPY:
+                with self.instrument.stage('rank_entropy'):
+                    ord_dict = rank_entropy(self.available_list,
+                                            guesses=self.legal_list if self.hard else None,
+                                            words=self.dictionary)
+            else:
+                with self.instrument.stage('calc_word_ordict'):
+                    ord_dict = calc_word_ordict(self.available_list, unique=self._unique,
+                                                scorer=SCORER_POSITIONAL
+                                                if self.ranking == RANKING_POSITIONAL
+                                                else SCORER_STATIC)
+            if key is not None:
+                self.cache.put(key, ord_dict)
+        self._unique = False
+
+        # DONE
+        return ord_dict
+
+    def update(self, word: str, results: str) -> None:
+        """Take feedback and narrow the candidates.
+
+        Args:
+            word: The lowercase word that was guessed.
+            results: The lowercase results (e.g., INPUT_GREEN) for word.
+        """
+        # LOCAL VARIABLES
+        key = None     # Cache key
+        cached = None  # Cached (survivors, available_list)
+
+        # UPDATE IT
+        with self.instrument.stage('update_word'):
+            self.word_hints.update_word(word, results)
+        self._node = None
+        if self.tree is not None and len(self.word_hints.deltas) == 1 and word == self.tree.opener:
+            self._node = self.tree.lookup(results_pattern(results))
+        if self._node is not None:
+            self.survivors = self.word_index.from_ids(self._node.candidate_ids)
+            self.available_list = [self.word_index.words[index]
+                                   for index in self._node.candidate_ids]
+        elif self.cache is not None:
+            key = ('candidates', self.word_hints.signature())
+            cached = self.cache.get(key)
+        if cached is not None:
+            self.survivors, self.available_list = cached
+        elif self._node is None:
+            with self.instrument.stage('remove_word_hints'):
+                if self.word_hints.deltas[-1] is None:
+                    self.survivors = self.word_index.match(self.word_hints.compile())  # Loosened
+                else:
+                    self.survivors = self.word_index.match(self.word_hints.deltas[-1],
+                                                           self.survivors)
+                self.available_list = list(self.word_index.iter_words(self.survivors))
+            if key is not None:
+                self.cache.put(key, (self.survivors, self.available_list))
+        self.instrument.count('survivors', len(self.available_list))
+        if self.hard:
+            self._update_legal()
+
+    def _ranks_legal(self) -> bool:
+        """Determine if the ranking depends on the legal guesses, not just the candidates."""
+        return self.hard and self.ranking == RANKING_ENTROPY
+
+    def _update_legal(self) -> None:
+        """Narrow the legal guesses by the hard mode rule (see: WordHints.compile_hard())."""
+        # LOCAL VARIABLES
+        cached = None  # Cached (legal, legal_list)
+
+        # UPDATE IT
+        self._legal_key = self.word_hints.compile_hard()
+        if self.cache is not None:
+            cached = self.cache.get(('legal', self._legal_key))
+        if cached is not None:
+            self.legal, self.legal_list = cached
+        else:
+            with self.instrument.stage('legal_guesses'):
+                self.legal = self.guess_index.match(self._legal_key, self.legal)
+                self.legal_list = list(self.guess_index.iter_words(self.legal))
+            if self.cache is not None:
+                self.cache.put(('legal', self._legal_key), (self.legal, self.legal_list))
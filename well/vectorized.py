@@ -0,0 +1,202 @@
+"""NumPy-backed versions of the word list calculations.
+
+NumPy is optional.  Check HAVE_NUMPY before calling anything in this module.  NumPy itself isn't
+imported until the first calculation that needs it (see: np), so importing the package stays fast
+when nothing is vectorized.
+"""
+
+# Standard Imports
+from collections import OrderedDict
+from types import ModuleType
+from typing import Any, Dict, Final, List, Sequence, Tuple
+import importlib
+import importlib.util
+# Third Party Imports
+# Local Imports
+from well.constraints import ALPHABET
+from well.dictionary import PackedWords
+from well.globals import REL_START_FREQ, REL_WORD_FREQ, WORD_LENGTH
+
+
+# pylint: disable=too-few-public-methods
+# Calm down, Pylint.  It's fine...
+class LazyModule():
+    """Stand in for a module, importing it on first attribute access."""
+
+    __slots__ = ('_name', '_module')
+
+    def __init__(self, name: str):
+        """LazyModule() ctor.
+
+        Args:
+            name: The absolute name of the module to import (e.g., numpy).
+        """
+        self._name = name                # Module to import
+        self._module: ModuleType = None  # The module, once imported
+
+    def __getattr__(self, attr: str) -> Any:
+        """Import the module, if it hasn't been yet, and look attr up in it."""
+        if self._module is None:
+            self._module = importlib.import_module(self._name)
+        return getattr(self._module, attr)
+
+
+HAVE_NUMPY: Final[bool] = importlib.util.find_spec('numpy') is not None
+np = LazyModule('numpy')  # pylint: disable=invalid-name
+VECTORIZE_MIN: Final[int] = 64  # Shorter word lists aren't worth the array overhead
+
+
+def encode_words(words: Sequence[str], length: int = 5) -> 'np.ndarray':
+    """Encode words as an (N, length) array of uint8 alphabet indices.
+
+    Args:
+        words: Lowercase words, each exactly length letters long.
+        length: Optional; The length of every word.
+
+    Raises:
+        ValueError: A word is the wrong length or contains a non-alphabet character.
+    """
+    # LOCAL VARIABLES
+    joined = ''   # One contiguous string
+    codes = None  # Alphabet indices
+
+    # ENCODE IT
+    if isinstance(words, PackedWords) and words.length == length:
+        codes = np.frombuffer(words.buffer, dtype=np.uint8) - ord('a')  # Already packed
+    else:
+        joined = ''.join(words)
+        if set(map(len, words)) - {length} or not joined.isascii():
+            raise ValueError('Unable to encode the word list')
+        codes = np.frombuffer(joined.encode('ascii'), dtype=np.uint8) - ord('a')
+    if codes.size and codes.max() >= len(ALPHABET):  # Wraparound catches anything below 'a'
+        raise ValueError('Unable to encode the word list')
+
+    # DONE
+    return codes.reshape(len(words), length)
+
+
+def calc_codes(codes: 'np.ndarray', table: Sequence[Sequence[float]] = None) -> 'np.ndarray':
+    """Calculate the likelihood of every encoded word, exactly like words.calc_word().
+
+    The sums are accumulated in the same order as calc_word() so equal words sort identically.
+
+    Args:
+        codes: (N, L) array of letter codes.
+        table: Optional; A positional table (see: words.positional_table()) to score with
+            instead of the static English frequencies.
+    """
+    # LOCAL VARIABLES
+    start_freq = np.array([REL_START_FREQ[letter] for letter in ALPHABET])  # Lookup table
+    word_freq = np.array([REL_WORD_FREQ[letter] for letter in ALPHABET])    # Lookup table
+    letter_freq = None  # Frequency of every letter of every word
+    probs = None        # Calculated values
+
+    # CALC IT
+    if table is None:
+        letter_freq = word_freq[codes]   # One gather for every letter of every word
+        probs = start_freq[codes[:, 0]]
+    else:
+        letter_freq = np.array(table)[np.arange(codes.shape[1]), codes]  # One gather, too
+        probs = np.zeros(len(codes))
+    for index in range(codes.shape[1]):
+        probs = probs + letter_freq[:, index]
+
+    # DONE
+    return probs
+
+
+def count_positions(codes: 'np.ndarray') -> 'np.ndarray':
+    """Count every letter of the alphabet at every position of the encoded words in one pass.
+
+    Returns:
+        (L, 26) array of letter counts.
+    """
+    # LOCAL VARIABLES
+    offsets = np.arange(codes.shape[1]) * len(ALPHABET)  # Where each position's counts start
+
+    # DONE
+    return np.bincount((codes + offsets).ravel(),
+                       minlength=codes.shape[1] * len(ALPHABET)).reshape(-1, len(ALPHABET))
+
+
+def count_codes(codes: 'np.ndarray') -> 'np.ndarray':
+    """Count how many times each letter of the alphabet appears in every encoded word.
+
+    Returns:
+        (N, 26) array of letter counts.
+    """
+    return np.count_nonzero(codes[:, :, None] == np.arange(len(ALPHABET)), axis=1).astype(np.int8)
+
+
+def index_codes(codes: 'np.ndarray') -> Tuple[Dict[Tuple[str, int], int],
+                                              Dict[Tuple[str, int], int]]:
+    """Build WordIndex's bitsets for every encoded word, where bit N stands for word N.
+
+    Returns:
+        A tuple of the (letter, position) bitsets and the (letter, minimum count) bitsets.  Only
+        non-empty bitsets are included.
+    """
+    # LOCAL VARIABLES
+    positions = {}                      # (letter, position) -> bitset
+    counts = {}                         # (letter, minimum count) -> bitset
+    letter_counts = count_codes(codes)  # (N, 26) letter counts
+
+    # INDEX IT
+    for code, letter in enumerate(ALPHABET):
+        for position in range(codes.shape[1]):
+            _add_bitset(positions, (letter, position), codes[:, position] == code)
+        for count in range(1, int(letter_counts[:, code].max(initial=0)) + 1):
+            _add_bitset(counts, (letter, count), letter_counts[:, code] >= count)
+
+    # DONE
+    return positions, counts
+
+
+def unique_codes(codes: 'np.ndarray') -> 'np.ndarray':
+    """Flag the encoded words that are comprised of entirely unique letters."""
+    # LOCAL VARIABLES
+    sorted_codes = np.sort(codes, axis=1)  # Repeats end up adjacent
+
+    # DONE
+    return np.all(sorted_codes[:, 1:] != sorted_codes[:, :-1], axis=1)
+
+
+def calc_word_ordict(words: List[str], unique: bool = False,
+                     table: Sequence[Sequence[float]] = None) -> OrderedDict[str, float]:
+    """Vectorized words.calc_word_ordict().
+
+    Args:
+        words: A list of same length words to calculate likelihoods for.
+        unique: Optional; If True, will only include words that are comprised of unique letters.
+        table: Optional; A positional table to score with (see: calc_codes()).
+
+    Raises:
+        ValueError: The word list can not be encoded.
+    """
+    # LOCAL VARIABLES
+    keys = list(dict.fromkeys(map(str.lower, words)))  # Same deduplication as calc_word_list()
+    length = len(keys[0]) if keys else WORD_LENGTH     # Letters per word
+    codes = encode_words(keys, length=length)           # (N, length) letter codes
+    probs = calc_codes(codes, table)                    # Likelihoods
+    order = None                                        # Descending indices into keys
+
+    # RANK IT
+    if unique:
+        order = np.flatnonzero(unique_codes(codes))
+        order = order[np.argsort(-probs[order], kind='stable')]
+    else:
+        order = np.argsort(-probs, kind='stable')  # Stable, like sorted(reverse=True)
+
+    # DONE
+    return OrderedDict(zip([keys[index] for index in order.tolist()], probs[order].tolist()))
+
+
+def _add_bitset(bitsets: Dict[Tuple[str, int], int], key: Tuple[str, int],
+                mask: 'np.ndarray') -> None:
+    """Pack a boolean mask, one entry per word, into a bitset and store it if it isn't empty."""
+    # LOCAL VARIABLES
+    bitset = int.from_bytes(np.packbits(mask, bitorder='little').tobytes(), 'little')
+
+    # DONE
+    if bitset:
+        bitsets[key] = bitset
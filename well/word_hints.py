@@ -2,65 +2,212 @@
 
 # Standard Imports
 from enum import IntEnum
+from typing import Callable, Iterable, Iterator, NamedTuple, Optional, Sequence, Tuple
 # Third Party Imports
 # Local Imports
-from well.globals import INPUT_GREEN, INPUT_SKIP, INPUT_YELLOW
+from well.constraints import (ALL_BITS, ALPHABET, Constraints, diff_constraints, letter_bit,
+                              letters_mask, make_constraints)
+from well.dictionary import PackedWords
+from well.globals import (INPUT_GREEN, INPUT_SKIP, INPUT_YELLOW, MAX_WORD_LENGTH, MIN_WORD_LENGTH,
+                          WORD_LENGTH)
 from well.letter_hints import LetterHints
 
 
 class LetterIndex(IntEnum):
-    """Standardize how indices are referenced inside WordHints."""
+    """Standardize how indices are referenced inside WordHints.
+
+    Covers the longest supported variant (see: MAX_WORD_LENGTH).  Only the first len(word) are
+    valid for any one WordHints object.
+    """
     FIRST = 0
     SECOND = 1
     THIRD = 2
     FOURTH = 3
     FIFTH = 4
+    SIXTH = 5
+    SEVENTH = 6
+    EIGHTH = 7
+    NINTH = 8
+    TENTH = 9
+    ELEVENTH = 10
+
+
+class HintsSnapshot(NamedTuple):
+    """An immutable capture of a WordHints object (see: WordHints.snapshot())."""
+
+    letters: Tuple[Tuple[str, int], ...]       # LetterHints.snapshot() for each position
+    must_haves: str                            # Yellow letters that haven't found a home yet
+    min_counts: Tuple[int, ...]                # Fewest copies of each alphabet letter
+    max_counts: Tuple[int, ...]                # Most copies of each alphabet letter
+    constraints: Constraints                   # Cached compile() results, or None
+    deltas: Tuple[Optional[Constraints], ...]  # What each update_word() call added
 
 
-# pylint: disable=too-many-instance-attributes
-# Calm down, Pylint.  It's fine...
 class WordHints():
-    """Established facts about a single Wordle word."""
-
-    def __init__(self):
-        """WordHints() ctor."""
-        self.first = LetterHints()
-        self.second = LetterHints()
-        self.third = LetterHints()
-        self.fourth = LetterHints()
-        self.fifth = LetterHints()
-        self.word = [self.first, self.second, self.third, self.fourth, self.fifth]
-        self._indices = [LetterIndex.FIRST, LetterIndex.SECOND, LetterIndex.THIRD,
-                         LetterIndex.FOURTH, LetterIndex.FIFTH]
-        self._must_haves = ''  # Yellow letters that haven't found a home yet
+    """Established facts about a single Wordle word.
+
+    Instances are slotted, and snapshot(), restore() and clone() only copy a handful of ints and
+    strings, so a search can cheaply fork hint states to try out hypothetical feedback.
+    """
+
+    __slots__ = ('word', '_indices', '_must_haves', '_min_counts', '_max_counts', '_constraints',
+                 'deltas')
+
+    def __init__(self, length: int = WORD_LENGTH):
+        """WordHints() ctor.
+
+        Args:
+            length: Optional; Letters per word, from MIN_WORD_LENGTH to MAX_WORD_LENGTH.
+
+        Raises:
+            ValueError: Unsupported length.
+        """
+        if not MIN_WORD_LENGTH <= length <= MAX_WORD_LENGTH:
+            raise ValueError(f'Word length must be {MIN_WORD_LENGTH} to {MAX_WORD_LENGTH}: '
+                             f'{length}')
+        self._indices = tuple(LetterIndex)[:length]  # Valid indices
+        self.word = [LetterHints() for _ in self._indices]
+        self._must_haves = ''     # Yellow letters that haven't found a home yet
+        self._min_counts = (0,) * len(ALPHABET)       # Fewest copies of each alphabet letter
+        self._max_counts = (length,) * len(ALPHABET)  # Most copies of each alphabet letter
+        self._constraints = None  # Cached compile() results, reset by every update
+        self.deltas = []          # What each update_word() call added (see: diff_constraints())
+
+    @property
+    def first(self) -> LetterHints:
+        """Hints for the first letter."""
+        return self.word[LetterIndex.FIRST]
+
+    @property
+    def second(self) -> LetterHints:
+        """Hints for the second letter."""
+        return self.word[LetterIndex.SECOND]
+
+    @property
+    def third(self) -> LetterHints:
+        """Hints for the third letter."""
+        return self.word[LetterIndex.THIRD]
+
+    @property
+    def fourth(self) -> LetterHints:
+        """Hints for the fourth letter."""
+        return self.word[LetterIndex.FOURTH]
+
+    @property
+    def fifth(self) -> LetterHints:
+        """Hints for the fifth letter."""
+        return self.word[LetterIndex.FIFTH]
 
     def check_word(self, guess: str) -> bool:
         """Determine if guess is valid given these word hints.
 
         Args:
-            guess: Lowercase, 5 letter word to evaluate against the current hints.
+            guess: Lowercase word, len(word) letters long, to evaluate against the current hints.
 
         Returns:
             True if valid, False otherwise.
         """
-        # LOCAL VARIABLES
-        valid = True
+        # INPUT VALIDATION
+        self._validate_string(letters=guess, param_name='guess')
+
+        # DONE
+        return self.compile().check_word(guess)
+
+    def filter(self, words: Iterable[str]) -> Iterator[str]:
+        """Lazily yield the words that are valid given these word hints, in order.
 
+        Unlike check_word(), words are validated once, up front, as a whole collection, and
+        PackedWords of the right length are trusted as is.  Every word is then checked by one
+        compiled predicate (see: Constraints.iter_filter()), so callers can stop after the first N
+        matches without paying for the rest.
+
+        Args:
+            words: Lowercase words, each len(word) letters long.  Anything but a sequence (e.g., a
+                set or a generator) is read into a list first, since it's read twice.
+
+        Raises:
+            TypeError: Bad type.
+            ValueError: A non-lowercase word, or a length other than len(word).
+        """
         # INPUT VALIDATION
-        self._validate_string(five_letters=guess, param_name='guess')
-
-        # CHECK IT
-        # Is it excluded anywhere?
-        valid = self._check_word_exclusion(guess=guess)
-        # Is there room?
-        if valid:
-            valid = self._check_word_room(guess=guess)
-        # Are the "must haves" in the guess?
-        if valid:
-            valid = self._check_word_must_haves(guess=guess)
+        if isinstance(words, Iterable) and not isinstance(words, Sequence):
+            words = list(words)  # Validated, then filtered, so only consume it once
+        self._validate_words(words)
+
+        # DONE
+        return self.compile().iter_filter(words)
+
+    def clone(self) -> 'WordHints':
+        """Copy these word hints.  The copy and the original can be updated independently."""
+        # LOCAL VARIABLES
+        copy = WordHints(len(self.word))  # The copy
+
+        # DONE
+        copy.restore(self.snapshot())
+        return copy
+
+    def compile(self) -> Constraints:
+        """Compile these word hints into a frozen Constraints object.
+
+        The result is cached until the next update to these word hints.  Modifying the LetterHints
+        objects directly, instead of through WordHints methods, bypasses that cache.
+        """
+        # LOCAL VARIABLES
+        allowed = []    # Per-position allowed letter masks
+        solutions = ''  # Solved letters
+        required = 0    # Must have letters mask
+
+        # COMPILE IT
+        if self._constraints is None:
+            for letter_hints in self.word:
+                if letter_hints.is_solved():
+                    allowed.append(letter_bit(letter_hints.solution))
+                    solutions = solutions + letter_hints.solution
+                else:
+                    allowed.append(ALL_BITS & ~letter_hints.excluded_mask)
+            required = letters_mask(self._must_haves)
+            self._constraints = make_constraints(allowed=allowed, required=required,
+                                                 fixed=letters_mask(solutions) | required,
+                                                 room=len(self.word) - len(solutions)
+                                                 - len(self._must_haves),
+                                                 min_counts=self._min_counts,
+                                                 max_counts=self._max_counts)
+
+        # DONE
+        return self._constraints
+
+    def compile_hard(self) -> Constraints:
+        """Compile the hard mode rule into a Constraints object that every legal guess satisfies.
+
+        Hard mode only requires the revealed hints to be used: green letters stay put and yellow
+        letters are played again.  Excluded letters may still be guessed, so every candidate is a
+        legal guess, but not every legal guess is a candidate.
+        """
+        # LOCAL VARIABLES
+        allowed = []    # Per-position allowed letter masks
+        solutions = ''  # Solved letters
+        required = letters_mask(self._must_haves)  # Must have letters mask
+
+        # COMPILE IT
+        for letter_hints in self.word:
+            if letter_hints.is_solved():
+                allowed.append(letter_bit(letter_hints.solution))
+                solutions = solutions + letter_hints.solution
+            else:
+                allowed.append(ALL_BITS)
 
         # DONE
-        return valid
+        return make_constraints(allowed=allowed, required=required,
+                                fixed=letters_mask(solutions) | required,
+                                room=len(self.word) - len(solutions) - len(self._must_haves))
+
+    def compile_predicate(self) -> Callable[[str], bool]:
+        """Compile these word hints into a generated predicate (see: Constraints.predicate()).
+
+        The predicate doesn't validate its input, and stops tracking these word hints as soon as
+        they're updated.
+        """
+        return self.compile().predicate()
 
     def exclude_letter(self, letter: str, skip: LetterIndex = None) -> None:
         """Add an excluded letter to all letters except the skip index.
@@ -72,106 +219,164 @@ class WordHints():
         for index in self._indices:
             if index != skip:
                 self.word[index].exclude_letter(letter=letter)
+        self._constraints = None
+
+    def restore(self, snapshot: HintsSnapshot) -> None:
+        """Return these word hints to the state captured by snapshot()."""
+        for letter_hints, state in zip(self.word, snapshot.letters):
+            letter_hints.restore(state)
+        self._must_haves = snapshot.must_haves
+        self._min_counts = snapshot.min_counts
+        self._max_counts = snapshot.max_counts
+        self._constraints = snapshot.constraints
+        self.deltas = list(snapshot.deltas)
+
+    def scan(self, buffer: str) -> Iterator[str]:
+        """Lazily yield the words in buffer, one per line, that are valid given these word hints.
+
+        The whole buffer is scanned in one re.finditer() pass with to_regex().  Lines that aren't
+        len(word) lowercase letters never match, so there's nothing to validate.
+        """
+        return self.compile().scan(buffer)
+
+    def signature(self) -> Tuple[Tuple[int, ...], int, int, int, Tuple[int, ...],
+                                 Tuple[int, ...]]:
+        """A canonical, hashable key for these word hints (e.g., for an LRUCache).
+
+        Word hints with the same signature accept exactly the same words, however they got there
+        (e.g., the same feedback in a different order).
+        """
+        # LOCAL VARIABLES
+        constraints = self.compile()  # Canonical form of these word hints
+
+        # DONE
+        return (constraints.allowed, constraints.required, constraints.fixed, constraints.room,
+                constraints.min_counts, constraints.max_counts)
+
+    def snapshot(self) -> HintsSnapshot:
+        """Capture the state of these word hints (see: restore())."""
+        return HintsSnapshot(letters=tuple(letter_hints.snapshot() for letter_hints in self.word),
+                             must_haves=self._must_haves, min_counts=self._min_counts,
+                             max_counts=self._max_counts, constraints=self._constraints,
+                             deltas=tuple(self.deltas))
 
     def solve_it(self, letter: str, solved: LetterIndex) -> None:
         """Solve one letter in the word."""
         self.word[solved].solve_it(letter=letter.lower())  # Update the solved letter
         if letter.lower() in self._must_haves:
             self._must_haves = self._must_haves.replace(letter.lower(), '')
+        self._constraints = None
+
+    def to_regex(self) -> str:
+        """Export these word hints as one anchored regular expression (see: Constraints.to_regex()).
+
+        The expression can be reused by other tools, e.g., grep -P on a word file with one word per
+        line.
+        """
+        return self.compile().to_regex()
 
     def update_word(self, word: str, results: str) -> None:
-        """Update the word based on user feedback."""
+        """Update the word based on user feedback.
+
+        The constraints this feedback adds are appended to deltas (see: diff_constraints()).
+        Every guessed letter also bounds how many copies the answer holds: at least as many as were
+        marked green or yellow, and, if any copy was marked grey, exactly that many.
+        """
+        # LOCAL VARIABLES
+        before = None  # Constraints prior to this feedback
+
         # INPUT VALIDATION
-        self._validate_string(five_letters=word, param_name='word')
-        self._validate_string(five_letters=results, param_name='results')
+        self._validate_string(letters=word, param_name='word')
+        self._validate_string(letters=results, param_name='results')
+        for entry in results:
+            if entry not in (INPUT_SKIP, INPUT_YELLOW, INPUT_GREEN):
+                raise ValueError(f'Invalid results entry detected: {entry}')
 
         # UPDATE IT
+        before = self.compile()
+        self._constraints = None
         for index in self._indices:
             # Validate results value
             if INPUT_SKIP == results[index]:
-                if word[index] in self._must_haves:
+                if word[index] in self._must_haves or \
+                        self._is_placed(word=word, results=results, letter=word[index]):
                     # It has to be somewhere else... but just not here
                     self.word[index].exclude_letter(letter=word[index])
                 else:
                     self.exclude_letter(letter=word[index])
             elif INPUT_YELLOW == results[index]:
                 self.word[index].exclude_letter(letter=word[index])
-                if word[index] not in self._must_haves:
+                if word[index] not in self._must_haves and not self._is_solved(word[index]):
+                    # A letter that's already home may not have a second copy to place
                     self._must_haves = self._must_haves + word[index]
             elif INPUT_GREEN == results[index]:
                 if not self.word[index].is_solved():
                     self.solve_it(letter=word[index], solved=index)
             else:
                 raise ValueError(f'Invalid results entry detected: {results[index]}')
+        self._update_counts(word=word, results=results)
+        self.deltas.append(diff_constraints(before, self.compile()))
 
-    def _check_word_exclusion(self, guess: str) -> bool:
-        """Checks for letter exclusions."""
-        # LOCAL VARIABLES
-        valid = True
+    def _is_placed(self, word: str, results: str, letter: str) -> bool:
+        """Determine if any copy of letter in word was green or yellow."""
+        return any(guess == letter and result != INPUT_SKIP
+                   for guess, result in zip(word, results))
 
-        # CHECK IT
-        for index in self._indices:
-            # Does this index match a found solution?
-            if self.word[index].is_solved():
-                if guess[index] != self.word[index].solution:
-                    valid = False
-                    break  # This letter is solved and the guesss doesn't match
-            # Is it excluded?
-            elif guess[index] in self.word[index].excluded:
-                valid = False  # Not a valid guess
-                break
+    def _is_solved(self, letter: str) -> bool:
+        """Determine if letter is the solution to any position."""
+        return any(letter_hints.solution == letter for letter_hints in self.word)
 
-        # DONE
-        return valid
-
-    def _check_word_must_haves(self, guess: str) -> bool:
-        """Verify the guess includes all the 'must haves'."""
+    def _update_counts(self, word: str, results: str) -> None:
+        """Tighten the letter count bounds by the copies of each letter marked in results."""
         # LOCAL VARIABLES
-        valid = True  # Prove this wrong
-
-        # CHECK IT
-        for must_have in self._must_haves:
-            if must_have not in guess:
-                valid = False
-                break
+        min_counts = list(self._min_counts)  # Fewest copies of each alphabet letter
+        max_counts = list(self._max_counts)  # Most copies of each alphabet letter
+        marked = 0                           # Green or yellow copies of one letter
 
-        # DONE
-        return valid
+        # UPDATE THEM
+        for letter in set(word):
+            marked = sum(guess == letter and result != INPUT_SKIP
+                         for guess, result in zip(word, results))
+            min_counts[ALPHABET.index(letter)] = max(min_counts[ALPHABET.index(letter)], marked)
+            if any(guess == letter and result == INPUT_SKIP
+                   for guess, result in zip(word, results)):
+                max_counts[ALPHABET.index(letter)] = marked  # Every other copy was found
+        self._min_counts = tuple(min_counts)
+        self._max_counts = tuple(max_counts)
 
-    def _check_word_room(self, guess: str) -> bool:
-        """Checks if there's room in this word for the guess."""
-        # LOCAL VARIABLES
-        valid = True         # Prove this wrong
-        curr_solutions = ''  # Solutions collated from LetterHints()
-        local_guess = guess  # Local copy of guess
-
-        # CHECK IT
-        # Check solutions
-        for word in self.word:
-            curr_solutions = curr_solutions + word.solution
-            if word.solution in local_guess:
-                local_guess = local_guess.replace(word.solution, '')  # Remove it from the guess
-        # Check must haves
-        for must_have in self._must_haves:
-            if must_have in local_guess:
-                local_guess = local_guess.replace(must_have, '')  # Remove it from the guess
-        # Check the measurements
-        if (len(self._must_haves) + len(local_guess) + len(curr_solutions)) > 5:
-            valid = False  # There's just no room
+    def _validate_string(self, letters: str, param_name: str) -> None:
+        """Common use validation functionality.
 
-        # DONE
-        return valid
+        Raise:
+            TypeError: Bad type.
+            ValueError: Non-lowercase word, or a length other than len(word).
+        """
+        if not isinstance(letters, str):
+            raise TypeError(f'"{param_name}" must be a string instead of a {type(letters)}')
+        if len(self.word) != len(letters):
+            raise ValueError(f'"{param_name}" is not {len(self.word)} characters long!')
+        if letters.lower() != letters:
+            raise ValueError(f'"{param_name}" must be all lower case: {letters}')
 
-    def _validate_string(self, five_letters: str, param_name: str) -> None:
-        """Common use validation functionality.
+    def _validate_words(self, words: Sequence[str]) -> None:
+        """Validate a whole collection of words at once, like _validate_string() on each.
 
         Raise:
             TypeError: Bad type.
-            ValueError: Non-lowercase word, or bad string length.
+            ValueError: Non-lowercase word, or a length other than len(word).
         """
-        if not isinstance(five_letters, str):
-            raise TypeError(f'"{param_name}" must be a string instead of a {type(five_letters)}')
-        if 5 != len(five_letters):
-            raise ValueError(f'"{param_name}" is not five characters long!')
-        if five_letters.lower() != five_letters:
-            raise ValueError(f'"{param_name}" must be all lower case: {five_letters}')
+        # LOCAL VARIABLES
+        joined = ''  # Every word, concatenated
+
+        # VALIDATE THEM
+        if isinstance(words, PackedWords) and words.length == len(self.word):
+            return  # Packed lowercase and fixed length
+        if isinstance(words, str) or not isinstance(words, Sequence):
+            raise TypeError(f'"words" must be an iterable of strings instead of a {type(words)}')
+        try:
+            joined = ''.join(words)
+        except TypeError:
+            joined = None  # Find the culprit below
+        if joined is None or joined.lower() != joined or set(map(len, words)) - {len(self.word)}:
+            for word in words:
+                self._validate_string(letters=word, param_name='word')
@@ -0,0 +1,206 @@
+"""Defines the WordIndex class."""
+
+# Standard Imports
+from typing import Dict, Iterator, List, Sequence, Tuple
+# Third Party Imports
+# Local Imports
+from well import vectorized
+from well.constraints import ALPHABET, Constraints
+
+
+def iter_bits(bitset: int) -> Iterator[int]:
+    """Iterate the indices of the set bits in bitset, lowest first."""
+    # LOCAL VARIABLES
+    bits = bin(bitset)[:1:-1]  # Binary digits, least significant first
+    index = bits.find('1')     # Index of the next set bit
+
+    # ITERATE IT
+    while index != -1:
+        yield index
+        index = bits.find('1', index + 1)
+
+
+def _to_bitset(ids: List[int], size: int) -> int:
+    """Convert a list of bit indices into a bitset."""
+    # LOCAL VARIABLES
+    buffer = bytearray((size + 7) // 8)  # Little endian bits
+
+    # CONVERT IT
+    for index in ids:
+        buffer[index >> 3] |= 1 << (index & 7)
+
+    # DONE
+    return int.from_bytes(buffer, 'little')
+
+
+class WordIndex():
+    """Positional inverted index over a word list.
+
+    Every set of words is an integer bitset: bit N is set if words[N] is in the set.  Constraints
+    are answered with bitwise intersections and differences, so the cost of a query scales with
+    the number of constraints instead of the number of words.
+    """
+
+    def __init__(self, words: Sequence[str]):
+        """WordIndex() ctor.
+
+        Args:
+            words: The lowercase words to index (e.g., FIVE_LETTER_WORDS minus the archive).
+        """
+        self.words = words                                # Indexed words, in id order
+        self.all_ids = (1 << len(words)) - 1              # Bitset of every word
+        self._ids: Dict[str, int] = {}                    # Word -> id
+        self._positions: Dict[Tuple[str, int], int] = {}  # (letter, position) -> bitset
+        self._counts: Dict[Tuple[str, int], int] = {}     # (letter, minimum count) -> bitset
+        self._build()
+
+    def __len__(self) -> int:
+        """Number of indexed words."""
+        return len(self.words)
+
+    def bitset(self, words: Sequence[str]) -> int:
+        """Translate a collection of indexed words into a bitset.
+
+        Raises:
+            ValueError: A word isn't in this index.
+        """
+        # LOCAL VARIABLES
+        ids = []    # Word ids
+        index = -1  # Id of one word
+
+        # TRANSLATE IT
+        for word in words:
+            index = self._ids.get(word)
+            if index is None:
+                raise ValueError(f'"{word}" is not in this index')
+            ids.append(index)
+
+        # DONE
+        return _to_bitset(ids, len(self.words))
+
+    def from_ids(self, ids: Sequence[int]) -> int:
+        """Translate word ids into a bitset."""
+        return _to_bitset(ids, len(self.words))
+
+    def has_letter(self, letter: str, position: int) -> int:
+        """Bitset of the words with letter at position."""
+        return self._positions.get((letter, position), 0)
+
+    def has_count(self, letter: str, count: int) -> int:
+        """Bitset of the words with at least count copies of letter."""
+        return self.all_ids if count <= 0 else self._counts.get((letter, count), 0)
+
+    def ids(self, bitset: int) -> Iterator[int]:
+        """Lazily iterate the word ids in bitset, in index order."""
+        return iter_bits(bitset & self.all_ids)
+
+    def index(self, word: str) -> int:
+        """Get the id of word.
+
+        Raises:
+            ValueError: word isn't in this index.
+        """
+        # LOCAL VARIABLES
+        index = self._ids.get(word)  # Id of word
+
+        # DONE
+        if index is None:
+            raise ValueError(f'"{word}" is not in this index')
+        return index
+
+    def iter_words(self, bitset: int) -> Iterator[str]:
+        """Lazily iterate the words in bitset, in index order."""
+        return (self.words[index] for index in self.ids(bitset))
+
+    def match(self, constraints: Constraints, survivors: int = None) -> int:
+        """Find the words that satisfy constraints.
+
+        Args:
+            constraints: Compiled word hints (see: WordHints.compile()).
+            survivors: Optional; Bitset to narrow down.  Defaults to every indexed word.
+
+        Returns:
+            The bitset of survivors that satisfy constraints.
+        """
+        # LOCAL VARIABLES
+        letter_mask = (1 << len(ALPHABET)) - 1  # Every alphabet letter
+        allowed_letters = 0                     # Letters allowed at a position
+
+        # MATCH IT
+        if survivors is None:
+            survivors = self.all_ids
+        # Positions
+        for position, allowed in enumerate(constraints.allowed):
+            allowed_letters = allowed & letter_mask
+            if allowed_letters == letter_mask:
+                continue  # Nothing to narrow
+            if allowed_letters.bit_count() <= len(ALPHABET) // 2:
+                survivors &= self._any_letter(allowed_letters, position)
+            else:
+                survivors &= ~self._any_letter(letter_mask & ~allowed_letters, position)
+        # Must haves
+        for index in iter_bits(constraints.required & letter_mask):
+            survivors &= self.has_count(ALPHABET[index], 1)
+        # Room
+        if constraints.room < 0:
+            survivors = 0  # Overconstrained
+        elif constraints.room < len(constraints.allowed):
+            survivors &= ~self._more_than(constraints.room, [
+                self.all_ids & ~self._any_letter(constraints.fixed & letter_mask, position)
+                for position in range(len(constraints.allowed))])
+        # Letter counts, one pass over the count bitsets for the whole candidate set
+        for letter, low, high in constraints.bounds:
+            survivors &= self.has_count(letter, low) & ~self.has_count(letter, high + 1)
+
+        # DONE
+        return survivors
+
+    def _any_letter(self, letters: int, position: int) -> int:
+        """Bitset of the words with any of the letters in the letters mask at position."""
+        # LOCAL VARIABLES
+        bitset = 0  # Union of words
+
+        # UNITE IT
+        for index in iter_bits(letters):
+            bitset |= self._positions.get((ALPHABET[index], position), 0)
+
+        # DONE
+        return bitset
+
+    def _build(self) -> None:
+        """Build the position and count bitsets, with NumPy if the word list is long enough."""
+        # LOCAL VARIABLES
+        positions = {}  # (letter, position) -> list of ids
+        counts = {}     # (letter, minimum count) -> list of ids
+        seen = {}       # Letter -> copies seen so far in the current word
+
+        # INDEX IT
+        self._ids = {word: index for index, word in enumerate(self.words)}
+        if vectorized.HAVE_NUMPY and len(self.words) >= vectorized.VECTORIZE_MIN:
+            try:
+                self._positions, self._counts = vectorized.index_codes(vectorized.encode_words(
+                    self.words, length=len(self.words[0])))
+                return
+            except ValueError:
+                pass  # Not encodable, so index it one letter at a time
+        for index, word in enumerate(self.words):
+            seen = {}
+            for position, letter in enumerate(word):
+                positions.setdefault((letter, position), []).append(index)
+                seen[letter] = seen.get(letter, 0) + 1
+                counts.setdefault((letter, seen[letter]), []).append(index)
+        self._positions = {key: _to_bitset(ids, len(self.words)) for key, ids in positions.items()}
+        self._counts = {key: _to_bitset(ids, len(self.words)) for key, ids in counts.items()}
+
+    def _more_than(self, limit: int, bitsets: List[int]) -> int:
+        """Bitset of the words that are set in more than limit of the bitsets."""
+        # LOCAL VARIABLES
+        at_least = [self.all_ids] + [0] * (limit + 1)  # at_least[N]: words set in N+ bitsets
+
+        # COUNT IT
+        for bitset in bitsets:
+            for count in range(limit + 1, 0, -1):
+                at_least[count] |= at_least[count - 1] & bitset
+
+        # DONE
+        return at_least[limit + 1]
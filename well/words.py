@@ -2,25 +2,51 @@
 
 # Standard Imports
 from collections import OrderedDict
-from typing import Dict, List
+from typing import Dict, Iterable, Iterator, List, Sequence, Tuple
+import hashlib
+import os
+import tempfile
 # Third Party Imports
 # Local Imports
-from well.globals import REL_START_FREQ, REL_WORD_FREQ
+from well import vectorized
+from well.cache import LRUCache
+from well.constraints import ALPHABET
+from well.dictionary import PackedWords, pack_words
+from well.globals import (CACHE_DIR, FIVE_LETTER_WORDS, MAX_WORD_LENGTH, MIN_WORD_LENGTH,
+                          POSITIONAL_CACHE_SIZE, REL_START_FREQ, REL_WORD_FREQ, SCORER_POSITIONAL,
+                          SCORER_STATIC, WORD_LENGTH)
+from well.patterns import word_list_digest
 from well.word_hints import WordHints
 
 
+_POSITIONAL_TABLES = LRUCache(max_entries=POSITIONAL_CACHE_SIZE)  # Word list digest to table
+
+
 class CountError(ValueError):
     """A custom except indicating a count violation in a word."""
 
 
-def calc_word(word: str, unique: bool = False) -> int:
-    """Calculate the likelihood of a word based on frequency."""
+def calc_word(word: str, unique: bool = False,
+              table: Tuple[Tuple[float, ...], ...] = None) -> int:
+    """Calculate the likelihood of a word based on frequency.
+
+    Args:
+        word: The word to score.
+        unique: Optional; If True, raise CountError for words with a repeated letter.
+        table: Optional; A positional table (see: positional_table()) to score with instead of
+            the static English frequencies.
+    """
     # LOCAL VARIABLES
-    prob = REL_START_FREQ[word[0].lower()]  # Calculated value
+    prob = 0.0  # Calculated value
 
     # CALC IT
-    for letter in word:
-        prob += REL_WORD_FREQ[letter.lower()]
+    if table is None:
+        prob = REL_START_FREQ[word[0].lower()]
+        for letter in word:
+            prob += REL_WORD_FREQ[letter.lower()]
+    else:
+        for position, letter in enumerate(word.lower()):
+            prob += table[position][ALPHABET.index(letter)]
     if unique is True and _is_unique_word(word) is False:
         raise CountError(f'"{word}" is not unique')
 
@@ -28,15 +54,16 @@ def calc_word(word: str, unique: bool = False) -> int:
     return prob
 
 
-def calc_word_list(words: List[str], unique: bool = False) -> Dict[str, int]:
-    """Calculate likelihood for a list of words based on frequency."""
+def calc_word_list(words: List[str], unique: bool = False,
+                   table: Tuple[Tuple[float, ...], ...] = None) -> Dict[str, int]:
+    """Calculate likelihood for a list of words based on frequency (see: calc_word())."""
     # LOCAL VARIABLES
     prob_dict = {}  # Dictionary of likelihood
 
     # CALC THEM
     for word in words:
         try:
-            prob_dict[word.lower()] = calc_word(word, unique)
+            prob_dict[word.lower()] = calc_word(word, unique, table)
         except CountError:
             pass  # Skip it
 
@@ -44,55 +71,242 @@ def calc_word_list(words: List[str], unique: bool = False) -> Dict[str, int]:
     return prob_dict
 
 
-def calc_word_ordict(words: List[str], unique: bool = False) -> OrderedDict[str, int]:
+def calc_word_ordict(words: List[str], unique: bool = False, vectorized_calc: bool = None,
+                     scorer: str = SCORER_STATIC) -> OrderedDict[str, int]:
     """Calculate likelihood for a list of words into a dict sort by descending probability.
 
     Args:
-        words: A list of five letter words to calculate likelihoods for.
+        words: A list of same length words to calculate likelihoods for.
         unique: Optional; If True, will only include words that are comprised of unique letters.
+        vectorized_calc: Optional; True to use the NumPy backend, False to avoid it.  Defaults to
+            using NumPy, if it's installed, for lists long enough to benefit.  Both backends
+            return the same ordering.
+        scorer: Optional; SCORER_STATIC scores with English text letter frequencies.
+            SCORER_POSITIONAL scores with how often each letter appears at each position of words
+            themselves (see: positional_table()), so it adapts as the candidates narrow.
+
+    Raises:
+        ValueError: Unknown scorer.
     """
     # LOCAL VARIABLES
-    prob_dict = calc_word_list(words, unique)
-    ord_dict = OrderedDict(dict(sorted(prob_dict.items(), key=lambda item: item[1], reverse=True)))
+    prob_dict = {}   # Dictionary of likelihood
+    ord_dict = None  # Sorted likelihoods
+    table = None     # Positional table, if scoring with one
+
+    # INPUT VALIDATION
+    if scorer not in (SCORER_STATIC, SCORER_POSITIONAL):
+        raise ValueError(f'Unknown scorer: {scorer}')
+
+    # CALC IT
+    if vectorized_calc is None:
+        vectorized_calc = vectorized.HAVE_NUMPY and len(words) >= vectorized.VECTORIZE_MIN
+    if scorer == SCORER_POSITIONAL and words:
+        table = positional_table(words, vectorized_calc=vectorized_calc)
+    if vectorized_calc:
+        try:
+            ord_dict = vectorized.calc_word_ordict(words, unique, table)
+        except ValueError:
+            pass  # Not encodable, so let calc_word() sort it out
+    if ord_dict is None:
+        prob_dict = calc_word_list(words, unique, table)
+        ord_dict = OrderedDict(dict(sorted(prob_dict.items(), key=lambda item: item[1],
+                                           reverse=True)))
 
     # DONE
     return ord_dict
 
 
-def remove_word_hints(source: List[str], hints: WordHints) -> List[str]:
+def positional_table(words: Sequence[str],
+                     vectorized_calc: bool = None) -> Tuple[Tuple[float, ...], ...]:
+    """Tabulate how often each letter appears at each position of words.
+
+    Counted in one pass (one bincount with NumPy), then cached under a digest of words for the
+    most recent POSITIONAL_CACHE_SIZE word lists, so ranking the same candidates again doesn't
+    recount them, and the cache never holds on to the word lists themselves.
+
+    Args:
+        words: A list of same length words.  Duplicates are counted once.
+        vectorized_calc: Optional; True to count with NumPy, False to avoid it.  Defaults to
+            using NumPy, if it's installed, for lists long enough to benefit.
+
+    Returns:
+        table[position][alphabet index]: The fraction of words with that letter at that position.
+    """
+    # LOCAL VARIABLES
+    key = None    # Cache key
+    table = None  # Positional table
+
+    # TABULATE IT
+    if vectorized_calc is None:
+        vectorized_calc = vectorized.HAVE_NUMPY and len(words) >= vectorized.VECTORIZE_MIN
+    key = (word_list_digest(words), vectorized_calc)
+    table = _POSITIONAL_TABLES.get(key)
+    if table is None:
+        table = _positional_table(words, vectorized_calc)
+        _POSITIONAL_TABLES.put(key, table)
+
+    # DONE
+    return table
+
+
+def remove_word_hints(source: Iterable[str], hints: WordHints) -> List[str]:
     """Remove words from source that are incompatible with the word hints.
 
     Args:
-        source: A list of words.
+        source: Words, in any iterable (see: WordHints.filter()).
         hints: The WordHints object to validate words against.
 
     Returns:
         The new list of source words missing words excluded by the word hints.
+
+    Raises:
+        TypeError: source isn't an iterable of strings.
+        ValueError: A word isn't lowercase, or is the wrong length.
+    """
+    return list(hints.filter(source))
+
+
+def load_word_list(filename: str, length: int = WORD_LENGTH,
+                   cache_dir: str = CACHE_DIR) -> PackedWords:
+    """Load a plain text word list, one word per line, as memory-mapped PackedWords.
+
+    The file is streamed once, keeping the first copy of every all-alphabet word of length
+    letters, and packed into cache_dir.  Later loads of the same file (by path, size and
+    modification time) only map the packed copy, so even a 100k+ word list opens instantly.
+
+    Args:
+        filename: The word list (e.g., /usr/share/dict/words).
+        length: Optional; Letters per word, from MIN_WORD_LENGTH to MAX_WORD_LENGTH.
+        cache_dir: Optional; The directory to store the packed copy in.
+
+    Returns:
+        The words of length, lowercase, in file order.
+
+    Raises:
+        OSError: Unable to read filename.
+        ValueError: Unsupported length.
     """
     # LOCAL VARIABLES
-    new_list = []  # New list of words missing guesses excluded by hints
+    stat = None     # Word list metadata
+    key = ''        # Identifies this version of the word list
+    packed = ''     # Packed copy filename
+    temp_fd = None  # File descriptor of the work-in-progress file
+    temp_name = ''  # Filename of the work-in-progress file
 
-    # REMOVE IT
-    for word in source:
-        if hints.check_word(word):
-            new_list.append(word)
+    # INPUT VALIDATION
+    if not MIN_WORD_LENGTH <= length <= MAX_WORD_LENGTH:
+        raise ValueError(f'Word length must be {MIN_WORD_LENGTH} to {MAX_WORD_LENGTH}: {length}')
+
+    # LOAD IT
+    stat = os.stat(filename)
+    key = f'{os.path.abspath(filename)}:{stat.st_size}:{stat.st_mtime_ns}:{length}'
+    packed = os.path.join(cache_dir, f'words-{length}-'
+                          f'{hashlib.sha256(key.encode("utf-8")).hexdigest()[:16]}.bin')
+    if not os.path.isfile(packed):
+        os.makedirs(cache_dir, exist_ok=True)
+        temp_fd, temp_name = tempfile.mkstemp(dir=cache_dir, suffix='.tmp')
+        os.close(temp_fd)
+        try:
+            with open(filename, 'r', encoding='utf-8', errors='replace') as in_file:
+                pack_words(_read_words(in_file, length), temp_name, length=length)
+            os.replace(temp_name, packed)  # Atomic, so concurrent loaders never see half a file
+        finally:
+            if os.path.exists(temp_name):
+                os.remove(temp_name)
+
+    # DONE
+    return PackedWords(packed, length=length)
+
+
+def narrow_word_hints(source: List[str], hints: WordHints,
+                      words: Sequence[str] = FIVE_LETTER_WORDS) -> List[str]:
+    """Narrow the survivors of earlier hints down by the latest WordHints.update_word() call.
+
+    Only the constraints added by the latest update are checked, so source must already be
+    compatible with every earlier update (e.g., the previous results of this function).  The
+    words are trusted and are not validated.  If the latest update may have loosened the hints
+    (see: diff_constraints()), words is filtered in full instead.
+
+    Args:
+        source: A list of words compatible with every update prior to the latest.
+        hints: The WordHints object to narrow by.
+        words: Optional; Every word source was narrowed from.
+
+    Returns:
+        The new list of source words missing words excluded by the latest update.
+    """
+    # NARROW IT
+    if not hints.deltas:
+        return remove_word_hints(source, hints)  # Nothing to narrow by yet
+    if hints.deltas[-1] is None:
+        return remove_word_hints(words, hints)  # Loosened, so start over
 
     # DONE
-    return new_list
+    return hints.deltas[-1].filter(source)
 
 
-def remove_words(source: List[str], remove: List[str]) -> List[str]:
+def remove_words(source: Sequence[str], remove: List[str], in_place: bool = False) -> List[str]:
     """Remove words from a master list.
 
     Args:
         source: A list of words.
         remove: Words to remove from source.
+        in_place: Optional; If True, source must be a list of lowercase words (e.g., an earlier
+            result of this function).  The remove words are deleted from it in one pass, however
+            many there are, and nothing to remove (e.g., no new answers, see: get_new_answers())
+            leaves it untouched.
 
     Returns:
-        The new list of source words missing the remove words.
+        The new list of source words missing the remove words, or source itself if in_place.
     """
-    new_remove = [word.lower() for word in remove]
-    return [word.lower() for word in source if word.lower() not in new_remove]
+    # LOCAL VARIABLES
+    new_remove = {word.lower() for word in remove}  # Words to remove, lowercase
+
+    # DONE
+    if in_place:
+        if new_remove:
+            source[:] = [word for word in source if word not in new_remove]
+        return source
+    if isinstance(source, PackedWords):
+        return [word for word in source if word not in new_remove]  # Already lowercase
+    return [word for word in map(str.lower, source) if word not in new_remove]
+
+
+def _positional_table(words: Sequence[str],
+                      vectorized_calc: bool) -> Tuple[Tuple[float, ...], ...]:
+    """Count positional_table() for a word list."""
+    # LOCAL VARIABLES
+    length = len(words[0]) if words else 0                 # Letters per word
+    counts = [[0] * len(ALPHABET) for _ in range(length)]  # counts[position][alphabet index]
+
+    # COUNT IT
+    words = tuple(dict.fromkeys(map(str.lower, words)))  # Same deduplication as calc_word_list()
+    if vectorized_calc:
+        try:
+            counts = vectorized.count_positions(vectorized.encode_words(words, length)).tolist()
+        except ValueError:
+            vectorized_calc = False  # Not encodable, so count it one letter at a time
+    if not vectorized_calc:
+        for word in words:
+            for position, letter in enumerate(word):
+                counts[position][ALPHABET.index(letter)] += 1
+
+    # DONE
+    return tuple(tuple(count / len(words) for count in row) for row in counts)
+
+
+def _read_words(lines: Iterable[str], length: int) -> Iterator[str]:
+    """Lazily yield the first copy of every all-alphabet word of length in lines, lowercase."""
+    # LOCAL VARIABLES
+    seen = set()  # Words yielded so far
+    word = ''     # Current line, stripped and lowercased
+
+    # READ THEM
+    for line in lines:
+        word = line.strip().lower()
+        if len(word) == length and word.isascii() and word.isalpha() and word not in seen:
+            seen.add(word)
+            yield word
 
 
 def _is_unique_word(word: str) -> bool: